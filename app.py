@@ -1,10 +1,14 @@
 import streamlit as st
 import pandas as pd
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from streamlit_option_menu import option_menu
+from st_aggrid import AgGrid, GridOptionsBuilder, GridUpdateMode
 import plotly.express as px
 import plotly.graph_objects as go
-from database import db
+from database import get_db
+
+# One manager per server process, shared by every session and rerun
+db = get_db()
 
 # Configure Streamlit page
 st.set_page_config(
@@ -130,36 +134,161 @@ def get_status_color(status):
     }
     return colors.get(status, '#999999')
 
-def display_escalation_card(escalation):
-    """Display a single escalation as a card"""
-    with st.container():
-        col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
-        
-        with col1:
-            st.write(f"**{escalation['title']}**")
-            st.write(f"_{escalation['description'][:100]}..._" if len(escalation['description']) > 100 else f"_{escalation['description']}_")
-            escalation_info = f"Created by: {escalation['created_by_name']} | Current Tier: {escalation['current_tier_name']}"
-            
-            # Add escalation information if escalated
-            if escalation['target_tier_id'] and escalation['assigned_to_name']:
-                escalation_info += f" | 📈 Escalated to: {escalation['assigned_to_name']}"
-                if escalation['days_since_escalation'] is not None:
-                    escalation_info += f" ({escalation['days_since_escalation']}d ago)"
-            
-            st.write(escalation_info)
-        
-        with col2:
-            urgency_class = f"urgency-{escalation['urgency'].lower()}"
-            st.markdown(f"<span class='{urgency_class}'>{escalation['urgency']}</span>", unsafe_allow_html=True)
-        
-        with col3:
-            status_class = f"status-{escalation['status'].lower().replace(' ', '-')}"
-            st.markdown(f"<span class='{status_class}'>{escalation['status']}</span>", unsafe_allow_html=True)
-        
-        with col4:
-            st.write(f"**{escalation['days_open']}** days")
-        
-        st.divider()
+def get_page_cursor(listing_key, filters):
+    """Get the cursor of the page currently shown for a listing, resetting when its filters change"""
+    if st.session_state.get(f"{listing_key}_filters") != filters:
+        st.session_state[f"{listing_key}_filters"] = filters
+        st.session_state[f"{listing_key}_cursors"] = [None]
+    return st.session_state[f"{listing_key}_cursors"][-1]
+
+# Trend chart ranges, in days back from today
+TREND_RANGES = {"Last 30 days": 30, "Last 90 days": 90, "Last 365 days": 365}
+
+def show_trend_charts(key, tier_id=None, include_subtree=False):
+    """Daily trend charts read from the snapshot table only"""
+    range_choice = st.selectbox("Range", list(TREND_RANGES), index=1, key=f"{key}_trend_range")
+    start_date = (datetime.now(timezone.utc).date() - timedelta(days=TREND_RANGES[range_choice])).isoformat()
+    snapshots = db.get_daily_snapshots(start_date=start_date, tier_id=tier_id, include_subtree=include_subtree)
+    if snapshots.empty:
+        st.info("No daily snapshots yet. Build them from the Admin Panel Analytics tab or with "
+                "`python3 manage.py snapshot --backfill`.")
+        return
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        fig_backlog = px.line(snapshots, x='snapshot_date',
+                              y=['open_total', 'in_progress_total', 'pending_feedback_total'],
+                              title="Active Escalations at End of Day",
+                              labels={'snapshot_date': 'Date', 'value': 'Escalations', 'variable': 'Status'})
+        st.plotly_chart(fig_backlog, use_container_width=True)
+    with col2:
+        fig_flow = px.bar(snapshots, x='snapshot_date', y=['created_count', 'escalated_count', 'closed_count'],
+                          barmode='group', title="Created, Escalated and Closed per Day",
+                          labels={'snapshot_date': 'Date', 'value': 'Escalations', 'variable': 'Event'})
+        st.plotly_chart(fig_flow, use_container_width=True)
+    
+    if snapshots['resolution_p50_days'].notna().any():
+        fig_resolution = px.line(snapshots, x='snapshot_date', y=['resolution_p50_days', 'resolution_p90_days'],
+                                 title="Resolution Time of Escalations Closed Each Day (Days)",
+                                 labels={'snapshot_date': 'Date', 'value': 'Days', 'variable': 'Percentile'})
+        st.plotly_chart(fig_resolution, use_container_width=True)
+
+def show_time_in_status():
+    """Time-in-status, tier hand-off and feedback round-trip charts from escalation_status_durations"""
+    time_in_status = db.get_time_in_status()
+    if time_in_status.empty:
+        st.info("No time-in-status data yet. Refresh it above or with `python3 manage.py status-durations`.")
+        return
+    
+    by_status = time_in_status.groupby('status')[['stays', 'total_hours']].sum()
+    by_status['avg_hours'] = by_status['total_hours'] / by_status['stays']
+    col1, col2 = st.columns(2)
+    with col1:
+        fig_status = px.bar(by_status.reset_index(), x='status', y='avg_hours',
+                            title="Average Hours per Status",
+                            labels={'status': 'Status', 'avg_hours': 'Hours'})
+        st.plotly_chart(fig_status, use_container_width=True)
+    with col2:
+        feedback = db.get_feedback_round_trip()
+        if not feedback.empty:
+            by_urgency = feedback.groupby('urgency')[['round_trips']].sum()
+            by_urgency['avg_hours'] = (feedback['avg_hours'] * feedback['round_trips']).groupby(
+                feedback['urgency']).sum() / by_urgency['round_trips']
+            fig_feedback = px.bar(by_urgency.reset_index(), x='urgency', y='avg_hours',
+                                  title="Feedback Round-Trip by Urgency (Hours)",
+                                  labels={'urgency': 'Urgency', 'avg_hours': 'Hours'})
+            st.plotly_chart(fig_feedback, use_container_width=True)
+    
+    handoffs = db.get_handoff_latency()
+    if not handoffs.empty:
+        st.write("**Slowest Tier Hand-offs** (hours Open before escalation)")
+        st.dataframe(handoffs.head(20), use_container_width=True, hide_index=True)
+    
+    slowest_tiers = time_in_status.pivot_table(index='tier_name', columns='status', values='avg_hours')
+    st.write("**Average Hours per Status by Tier**")
+    st.dataframe(slowest_tiers.sort_values(slowest_tiers.columns[0], ascending=False).round(1),
+                 use_container_width=True)
+
+def show_page_navigation(listing_key, next_cursor):
+    """Show previous/next buttons for a keyset-paginated listing"""
+    cursors = st.session_state[f"{listing_key}_cursors"]
+    if len(cursors) == 1 and next_cursor is None:
+        return
+    
+    col_prev, col_page, col_next = st.columns([1, 2, 1])
+    with col_prev:
+        if len(cursors) > 1 and st.button("⬅️ Previous", key=f"{listing_key}_prev"):
+            cursors.pop()
+            st.rerun()
+    with col_page:
+        st.write(f"Page {len(cursors)}")
+    with col_next:
+        if next_cursor is not None and st.button("Next ➡️", key=f"{listing_key}_next"):
+            cursors.append(next_cursor)
+            st.rerun()
+
+# Rows fetched per server page for the grid view; the grid renders only the visible rows
+GRID_PAGE_SIZE = 500
+
+# Grid columns and their headers; everything else stays on the server side of the page
+GRID_COLUMNS = {
+    'title': "Title",
+    'description_preview': "Description",
+    'status': "Status",
+    'urgency': "Urgency",
+    'current_tier_name': "Current Tier",
+    'created_by_name': "Created By",
+    'assigned_to_name': "Assigned To",
+    'days_open': "Days Open",
+    'days_since_escalation': "Days Since Escalation",
+}
+
+def show_escalation_grid(escalations, grid_key, height=420):
+    """Show a page of escalations in a sortable, filterable grid and return the selected row, if any"""
+    columns = ['id'] + [column for column in GRID_COLUMNS if column in escalations.columns]
+    if 'search_snippet' in escalations.columns:
+        columns.append('search_snippet')
+    grid_data = escalations[columns]
+    if 'search_snippet' in grid_data.columns:
+        grid_data = grid_data.assign(search_snippet=grid_data['search_snippet'].str.replace('**', '', regex=False))
+    
+    builder = GridOptionsBuilder.from_dataframe(grid_data)
+    builder.configure_default_column(sortable=True, filter=True, resizable=True)
+    builder.configure_column('id', hide=True)
+    for column, header in GRID_COLUMNS.items():
+        if column in grid_data.columns:
+            builder.configure_column(column, header_name=header)
+    if 'search_snippet' in grid_data.columns:
+        builder.configure_column('search_snippet', header_name="Match", flex=2)
+    builder.configure_column('title', flex=2)
+    builder.configure_column('urgency', cellClassRules={
+        f"urgency-{urgency.lower()}": f"x == '{urgency}'" for urgency in ['Low', 'Medium', 'High', 'Critical']})
+    builder.configure_column('status', cellClassRules={
+        f"status-{status.lower().replace(' ', '-')}": f"x == '{status}'"
+        for status in ['Open', 'In Progress', 'Pending Feedback', 'Closed']})
+    builder.configure_selection('single')
+    
+    # The grid runs in its own frame, so the badge colours are passed in as grid CSS
+    custom_css = {f".urgency-{urgency.lower()}": {"color": f"{get_urgency_color(urgency)} !important",
+                                                   "font-weight": "bold"}
+                  for urgency in ['Low', 'Medium', 'High', 'Critical']}
+    custom_css.update({f".status-{status.lower().replace(' ', '-')}": {"color": f"{get_status_color(status)} !important",
+                                                                        "font-weight": "bold"}
+                       for status in ['Open', 'In Progress', 'Pending Feedback', 'Closed']})
+    
+    # A fixed height keeps AgGrid's row virtualisation on (autoHeight would render every row)
+    response = AgGrid(grid_data, gridOptions=builder.build(), height=height, custom_css=custom_css,
+                      update_mode=GridUpdateMode.SELECTION_CHANGED, fit_columns_on_grid_load=True,
+                      key=grid_key)
+    
+    selected = response['selected_rows']
+    # Older st_aggrid versions return a list of dicts, newer ones a DataFrame (or None)
+    if selected is None or len(selected) == 0:
+        return None
+    selected_id = selected.iloc[0]['id'] if isinstance(selected, pd.DataFrame) else selected[0]['id']
+    # The selection can outlive its page when the filters or page change
+    matches = escalations[escalations['id'] == selected_id]
+    return matches.iloc[0] if not matches.empty else None
 
 def show_admin_login():
     """Show admin login form"""
@@ -206,7 +335,8 @@ def admin_panel():
     if hasattr(st.session_state, 'show_password_change') and st.session_state.show_password_change:
         show_password_change_form()
     
-    tab1, tab2, tab3 = st.tabs(["📊 Tier Management", "👥 People Management", "📈 Analytics"])
+    tab1, tab2, tab3, tab4, tab5, tab6, tab7 = st.tabs(["📊 Tier Management", "👥 People Management", "📈 Analytics",
+                                                        "📥 Bulk Import", "⚡ Performance", "🗄️ Archive", "⏰ SLA"])
     
     with tab1:
         st.subheader("Tier Management")
@@ -222,12 +352,11 @@ def admin_panel():
                 tier_name = st.text_input("Tier Name", placeholder="e.g., Level 1 Support")
                 tier_level = st.number_input("Tier Level", min_value=1, value=1, step=1)
                 
-                # Get existing tiers for parent selection
-                tiers_df = db.get_tiers()
-                if not tiers_df.empty:
-                    tier_options = ["None"] + [(row['name'], row['id']) for _, row in tiers_df.iterrows()]
-                    parent_tier = st.selectbox("Parent Tier", options=[opt[0] for opt in tier_options])
-                    parent_tier_id = None if parent_tier == "None" else next(opt[1] for opt in tier_options if opt[0] == parent_tier)
+                # Existing tiers for parent selection, from the shared tier graph
+                tier_graph = db.get_tier_graph()
+                if len(tier_graph):
+                    parent_tier_id = st.selectbox("Parent Tier", options=(None,) + tier_graph.parent_options(),
+                                                  format_func=tier_graph.name)
                 else:
                     parent_tier_id = None
                 
@@ -243,17 +372,20 @@ def admin_panel():
             
             with col2:
                 st.write("### Existing Tiers")
-                tiers_df = db.get_tiers()
-                if not tiers_df.empty:
-                    for _, tier in tiers_df.iterrows():
+                # Headcount, escalation counts and deletability for all tiers in one query
+                tier_stats_df = db.get_tier_stats()
+                if not tier_stats_df.empty:
+                    for _, tier in tier_stats_df.iterrows():
                         with st.expander(f"Level {tier['level']}: {tier['name']}"):
                             st.write(f"**Description:** {tier['description'] or 'No description'}")
                             st.write(f"**Parent Tier:** {tier['parent_tier_name'] or 'None'}")
                             st.write(f"**Created:** {tier['created_at']}")
-                            
-                            # Count people in this tier
-                            people_count = len(db.get_people(tier['id']))
-                            st.write(f"**People in tier:** {people_count}")
+                            st.write(f"**People in tier:** {tier['people_count']}")
+                            st.write(f"**Child tiers:** {tier['child_tier_count']}")
+                            st.write(f"**Escalations:** {tier['open_count']} open, "
+                                     f"{tier['in_progress_count']} in progress, "
+                                     f"{tier['pending_feedback_count']} pending feedback, "
+                                     f"{tier['closed_count']} closed")
                             
                             # Edit and Delete buttons
                             col_edit, col_delete = st.columns(2)
@@ -263,7 +395,9 @@ def admin_panel():
                                     st.rerun()
                             
                             with col_delete:
-                                if st.button(f"🗑️ Delete", key=f"delete_tier_{tier['id']}"):
+                                if st.button(f"🗑️ Delete", key=f"delete_tier_{tier['id']}",
+                                             disabled=not tier['is_deletable'],
+                                             help=None if tier['is_deletable'] else "Tier has people, escalations, or child tiers"):
                                     if db.delete_tier(tier['id']):
                                         st.success(f"Tier '{tier['name']}' deleted successfully!")
                                         st.rerun()
@@ -287,11 +421,10 @@ def admin_panel():
                 person_email = st.text_input("Email", placeholder="john.doe@company.com")
                 
                 # Tier selection
-                tiers_df = db.get_tiers()
-                if not tiers_df.empty:
-                    tier_options = [(row['name'], row['id']) for _, row in tiers_df.iterrows()]
-                    selected_tier_name = st.selectbox("Assign to Tier", options=[opt[0] for opt in tier_options])
-                    selected_tier_id = next(opt[1] for opt in tier_options if opt[0] == selected_tier_name)
+                tier_graph = db.get_tier_graph()
+                if len(tier_graph):
+                    selected_tier_id = st.selectbox("Assign to Tier", options=tier_graph.order,
+                                                    format_func=tier_graph.name)
                 else:
                     st.error("Please create at least one tier first!")
                     selected_tier_id = None
@@ -340,15 +473,17 @@ def admin_panel():
     with tab3:
         st.subheader("Analytics Dashboard")
         
-        # Get escalation data for analytics
-        escalations_df = db.get_escalations()
+        include_archived = st.checkbox("Include archived", key="analytics_archived",
+                                       help="Also count Closed escalations moved to the archive")
+        # Per-tier counters are maintained on write, so this reads O(tiers) rows
+        counters_df = db.get_escalation_counters(include_archived=include_archived)
         
-        if not escalations_df.empty:
+        if not counters_df.empty:
             col1, col2 = st.columns(2)
             
             with col1:
                 # Escalations by urgency
-                urgency_counts = escalations_df['urgency'].value_counts()
+                urgency_counts = counters_df.groupby('urgency')['escalation_count'].sum().sort_values(ascending=False)
                 fig_urgency = px.pie(values=urgency_counts.values, names=urgency_counts.index, 
                                    title="Escalations by Urgency",
                                    color_discrete_map={
@@ -359,22 +494,318 @@ def admin_panel():
             
             with col2:
                 # Escalations by status
-                status_counts = escalations_df['status'].value_counts()
+                status_counts = counters_df.groupby('status')['escalation_count'].sum().sort_values(ascending=False)
                 fig_status = px.bar(x=status_counts.index, y=status_counts.values,
                                   title="Escalations by Status",
                                   color=status_counts.values,
                                   color_continuous_scale='viridis')
                 st.plotly_chart(fig_status, use_container_width=True)
             
-            # Average resolution time by tier
-            closed_escalations = escalations_df[escalations_df['status'] == 'Closed']
-            if not closed_escalations.empty:
-                avg_resolution_time = closed_escalations.groupby('current_tier_name')['days_open'].mean().reset_index()
-                fig_resolution = px.bar(avg_resolution_time, x='current_tier_name', y='days_open',
+            # Average resolution time (created to closed) by tier
+            closed_counters = counters_df[counters_df['status'] == 'Closed']
+            if not closed_counters.empty:
+                avg_resolution_time = closed_counters.groupby('tier_name')[['resolution_days_sum', 'escalation_count']].sum()
+                avg_resolution_time['resolution_days'] = avg_resolution_time['resolution_days_sum'] / avg_resolution_time['escalation_count']
+                fig_resolution = px.bar(avg_resolution_time.reset_index(), x='tier_name', y='resolution_days',
                                       title="Average Resolution Time by Tier (Days)")
                 st.plotly_chart(fig_resolution, use_container_width=True)
         else:
             st.info("No escalation data available for analytics yet.")
+        
+        st.write("### 📈 Trends")
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("📸 Refresh Snapshots", help="Update yesterday's and today's daily snapshots"):
+                with st.spinner("Updating snapshots..."):
+                    db.snapshot_daily()
+                st.rerun()
+        with col2:
+            if st.button("🧮 Rebuild All Snapshots", help="Replay the whole escalation history"):
+                with st.spinner("Rebuilding snapshots from history..."):
+                    rows = db.build_daily_snapshots()
+                st.success(f"Wrote {rows} snapshot rows")
+        show_trend_charts("analytics")
+        
+        st.write("### ⏱️ Time in Status")
+        if st.button("🔄 Refresh Time in Status", help="Add stays from history recorded since the last refresh"):
+            with st.spinner("Updating time in status..."):
+                db.refresh_status_durations()
+            st.rerun()
+        show_time_in_status()
+    
+    with tab4:
+        show_bulk_import()
+    
+    with tab5:
+        show_performance()
+    
+    with tab6:
+        show_archive()
+    
+    with tab7:
+        show_sla()
+
+def show_performance():
+    """Query timings, slow query plans and read cache statistics"""
+    st.subheader("Performance")
+    
+    instrumentation = db.instrumentation
+    col1, col2, col3 = st.columns([2, 2, 1])
+    with col1:
+        enabled = st.checkbox("Record query timings", value=instrumentation.enabled,
+                              help="Applies to every session of this server process")
+    with col2:
+        slow_query_ms = st.number_input("Slow query threshold (ms)", min_value=1, max_value=60000,
+                                        value=int(instrumentation.slow_query_ms))
+    with col3:
+        if st.button("🧹 Reset Timings"):
+            db.reset_instrumentation()
+            st.rerun()
+    if enabled != instrumentation.enabled or slow_query_ms != instrumentation.slow_query_ms:
+        db.set_instrumentation(enabled, slow_query_ms)
+    
+    stats = db.get_query_stats()
+    if not stats.empty:
+        columns = ['method', 'calls', 'total_ms', 'p50_ms', 'p95_ms', 'max_ms', 'avg_rows']
+        col1, col2 = st.columns(2)
+        with col1:
+            st.write("**Top by total time**")
+            st.dataframe(stats[columns].head(10).round(2), use_container_width=True, hide_index=True)
+        with col2:
+            st.write("**Top by p95 time**")
+            st.dataframe(stats.sort_values('p95_ms', ascending=False)[columns].head(10).round(2),
+                         use_container_width=True, hide_index=True)
+        
+        st.write("### 🐢 Slow Calls")
+        slow_queries = db.get_slow_queries()
+        if slow_queries:
+            for record in slow_queries:
+                started = datetime.fromtimestamp(record['started_at']).strftime('%H:%M:%S')
+                with st.expander(f"{record['method']} - {record['duration_ms']:.1f} ms at {started} "
+                                 f"({record['rows']} rows, {record['statement_count']} statements)"):
+                    for sql, plan in record['plans'].items():
+                        st.code(sql.strip(), language="sql")
+                        if plan:
+                            st.code("\n".join(plan))
+        else:
+            st.info(f"No calls slower than {instrumentation.slow_query_ms:g} ms recorded.")
+    elif enabled:
+        st.info("No queries recorded yet.")
+    else:
+        st.info("Query timing is off. Enable it to record calls from all sessions.")
+    
+    # Shared read cache statistics
+    st.write("### ⚡ Read Cache")
+    cache_stats = db.get_cache_stats()
+    if cache_stats:
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Hit Rate", f"{cache_stats['hit_rate']:.1%}")
+        with col2:
+            st.metric("Hits / Misses", f"{cache_stats['hits']} / {cache_stats['misses']}")
+        with col3:
+            st.metric("Entries", f"{cache_stats['entries']} / {cache_stats['max_entries']}")
+        with col4:
+            st.metric("Evictions", cache_stats['evictions'])
+        st.caption(f"Invalidated by {cache_stats['invalidations']} local writes; commits from other processes are detected automatically.")
+        if st.button("🧹 Clear Cache"):
+            db.clear_cache()
+            st.rerun()
+    else:
+        st.info("Read caching is disabled.")
+    
+    # Single writer thread with group commits
+    st.write("### ✍️ Write Pipeline")
+    pipeline_status = db.get_write_pipeline_status()
+    pipeline_enabled = st.checkbox("Group commit writes", value=pipeline_status is not None,
+                          help="Applies every session's writes on one writer thread, many per commit")
+    if pipeline_enabled != (pipeline_status is not None):
+        if pipeline_enabled:
+            db.start_write_pipeline()
+        else:
+            db.stop_write_pipeline()
+        st.rerun()
+    if pipeline_status:
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Group Commits", pipeline_status['groups'])
+        with col2:
+            st.metric("Writes per Commit", f"{pipeline_status['average_group']:.1f}")
+        with col3:
+            st.metric("Largest Group", f"{pipeline_status['largest_group']} / {pipeline_status['max_batch']}")
+        with col4:
+            st.metric("Queued", pipeline_status['queued'])
+        st.caption(f"{pipeline_status['grouped_writes']} grouped and {pipeline_status['exclusive_writes']} "
+                   f"exclusive writes; groups collect for up to {pipeline_status['max_delay_ms']:g} ms.")
+        if pipeline_status['last_error']:
+            st.error(f"Last failed group ({pipeline_status['failed_groups']} so far): {pipeline_status['last_error']}")
+
+def show_archive():
+    """Archive old Closed escalations and browse or restore archived ones"""
+    st.subheader("Archive")
+    st.caption("Archived escalations are left out of listings, search and analytics unless "
+               "\"Include archived\" is checked.")
+    
+    summary = db.get_archive_summary()
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Archived Escalations", summary['archived_count'])
+    with col2:
+        st.metric("Oldest Closed", (summary['oldest_closed_at'] or "N/A")[:10])
+    with col3:
+        st.metric("Newest Closed", (summary['newest_closed_at'] or "N/A")[:10])
+    
+    st.write("### Archive Closed Escalations")
+    col1, col2, col3 = st.columns([2, 2, 1])
+    with col1:
+        older_than_days = st.number_input("Closed and untouched for (days)", min_value=0, value=90, step=1)
+    with col2:
+        batch_size = st.number_input("Batch size", min_value=1, max_value=10000, value=500, step=100)
+    with col3:
+        if st.button("🗄️ Archive"):
+            with st.spinner("Archiving..."):
+                archived = db.archive_closed_escalations(older_than_days, batch_size)
+            st.success(f"Archived {archived} escalations")
+    
+    st.write("### Archived Escalations")
+    cursor = get_page_cursor("archived_escalations", {})
+    page, next_cursor = db.get_escalations_page(sort_by=['-created_at'], page_size=GRID_PAGE_SIZE,
+                                                cursor=cursor, archived=True)
+    if page.empty:
+        st.info("No archived escalations.")
+        return
+    
+    selected = show_escalation_grid(page, "archived_escalations_grid", height=320)
+    show_page_navigation("archived_escalations", next_cursor)
+    if selected is None:
+        return
+    
+    # Full text and history are loaded only for the selected escalation
+    detail = db.get_escalation_detail(selected['id'], include_archived=True)
+    if detail is None:
+        st.info("This escalation no longer exists.")
+        return
+    st.write(f"### {detail['title']} - closed {str(detail['closed_at'])[:10]}")
+    st.write(detail['description'])
+    if detail['feedback']:
+        st.write(f"**Feedback:** {detail['feedback']}")
+    if st.button("♻️ Restore", key=f"restore_{detail['id']}"):
+        if db.restore_escalation(detail['id']):
+            st.success("Escalation restored")
+            st.rerun()
+        else:
+            st.error("Escalation is no longer in the archive.")
+    show_escalation_history(detail['history'])
+
+def show_sla():
+    """SLA thresholds, auto-escalation rules, scanner status and recent breaches"""
+    st.subheader("SLA Monitoring")
+    
+    scanner_status = db.get_sla_scanner_status()
+    if scanner_status:
+        col1, col2, col3, col4 = st.columns(4)
+        last_result = scanner_status['last_result'] or {}
+        with col1:
+            st.metric("Scanner", "Running" if scanner_status['running'] else "Stopped")
+        with col2:
+            last_run_at = scanner_status['last_run_at']
+            st.metric("Last Run", datetime.fromtimestamp(last_run_at).strftime('%H:%M:%S') if last_run_at else "N/A")
+        with col3:
+            st.metric("Run Time", f"{last_result['duration_ms']:.0f} ms" if last_result else "N/A")
+        with col4:
+            st.metric("Backlog", last_result.get('backlog', "N/A"))
+        st.caption(f"Scans every {scanner_status['interval_seconds']:g} s; {scanner_status['runs']} runs so far. "
+                   f"Last run recorded {last_result.get('breaches_recorded', 0)} breaches and "
+                   f"auto-escalated {last_result.get('auto_escalated', 0)}.")
+        if scanner_status['last_error']:
+            st.error(f"Last scan failed: {scanner_status['last_error']}")
+        if st.button("🔄 Scan Now"):
+            # The scan runs on the scanner thread; its result shows on a later rerun
+            db.start_sla_scanner().run_now()
+            st.info("Scan started.")
+    else:
+        st.info("The SLA scanner is not running in this process.")
+    
+    st.write("### Rules")
+    st.caption("An Open or In Progress escalation breaches its SLA when it has been open longer than its "
+               "urgency's threshold. With auto-escalate, Open breaches move up to a higher-level tier, "
+               "one of the tier's own sub-tiers when it has a staffed one.")
+    rules = db.get_sla_rules()
+    with st.form("sla_rules_form"):
+        updated_rules = []
+        for _, rule in rules.iterrows():
+            col1, col2, col3 = st.columns([1, 2, 2])
+            with col1:
+                st.write(f"**{rule['urgency']}**")
+            with col2:
+                max_open_hours = st.number_input("Max open hours", min_value=0.5, value=float(rule['max_open_hours']),
+                                                 step=1.0, key=f"sla_hours_{rule['urgency']}")
+            with col3:
+                auto_escalate = st.checkbox("Auto-escalate to a higher tier", value=bool(rule['auto_escalate']),
+                                            key=f"sla_auto_{rule['urgency']}")
+            updated_rules.append((rule['urgency'], max_open_hours, auto_escalate))
+        if st.form_submit_button("💾 Save Rules"):
+            for urgency, max_open_hours, auto_escalate in updated_rules:
+                db.update_sla_rule(urgency, max_open_hours, auto_escalate)
+            st.success("SLA rules saved")
+            st.rerun()
+    
+    st.write("### Recent Breaches")
+    breaches = db.get_sla_breaches()
+    if not breaches.empty:
+        breaches['hours_open'] = breaches['hours_open'].round(1)
+        st.dataframe(breaches[['detected_at', 'title', 'tier_name', 'status', 'urgency', 'hours_open', 'action']],
+                     use_container_width=True, hide_index=True)
+    else:
+        st.info("No SLA breaches recorded.")
+
+def show_bulk_import():
+    """Import tiers, people or escalations from a CSV file"""
+    st.subheader("Bulk Import")
+    
+    import_types = {
+        "Tiers": {
+            "columns": "name, level, parent_tier_name (or parent_tier_id), description",
+            "method": db.create_tiers_bulk,
+        },
+        "People": {
+            "columns": "name, email, tier_name (or tier_id), role",
+            "method": db.create_people_bulk,
+        },
+        "Escalations": {
+            "columns": "title, description, urgency, created_by_email (or created_by), source_tier_name, "
+                       "status (Open/Closed), created_at, closed_at",
+            "method": db.create_escalations_bulk,
+        },
+    }
+    
+    import_type = st.selectbox("What are you importing?", list(import_types.keys()))
+    st.info(f"Expected CSV columns: {import_types[import_type]['columns']}. "
+            "Rows with errors are skipped and listed below; all other rows are imported.")
+    
+    uploaded_file = st.file_uploader("CSV file", type=["csv"], key=f"bulk_import_{import_type}")
+    if uploaded_file is None:
+        return
+    
+    try:
+        import_df = pd.read_csv(uploaded_file, dtype=str, keep_default_na=False)
+    except Exception as e:
+        st.error(f"Could not read CSV file: {str(e)}")
+        return
+    
+    st.write(f"**{len(import_df)}** rows found")
+    st.dataframe(import_df.head(20), use_container_width=True)
+    
+    if st.button(f"📥 Import {import_type}", type="primary"):
+        result = import_types[import_type]["method"](import_df.to_dict("records"))
+        if result['created']:
+            st.success(f"✅ Imported {len(result['created'])} {import_type.lower()}.")
+        if result['errors']:
+            st.warning(f"{len(result['errors'])} rows were skipped.")
+            errors_df = pd.DataFrame(result['errors'])
+            # Report spreadsheet line numbers (header is line 1)
+            errors_df['row'] = errors_df['row'] + 2
+            st.dataframe(errors_df.rename(columns={'row': 'CSV line', 'error': 'Error'}), use_container_width=True)
 
 def escalation_dashboard():
     """Main escalation dashboard"""
@@ -425,15 +856,14 @@ def my_dashboard():
     person_id = st.session_state.selected_person
     tier_id = st.session_state.selected_tier
     
-    # Get escalations for this person
-    my_escalations = db.get_escalations(person_id=person_id)
-    tier_escalations = db.get_escalations(tier_id=tier_id)
+    # Metrics are aggregated in the database rather than from loaded rows
+    summary = db.get_person_summary(person_id, tier_id)
     
     # Metrics
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        created_count = len(my_escalations[my_escalations['created_by'] == person_id])
+        created_count = summary['created_count']
         st.markdown(f"""
         <div class="metric-card">
             <h3>{created_count}</h3>
@@ -442,7 +872,7 @@ def my_dashboard():
         """, unsafe_allow_html=True)
     
     with col2:
-        assigned_count = len(my_escalations[my_escalations['assigned_to'] == person_id])
+        assigned_count = summary['assigned_count']
         st.markdown(f"""
         <div class="metric-card">
             <h3>{assigned_count}</h3>
@@ -451,7 +881,7 @@ def my_dashboard():
         """, unsafe_allow_html=True)
     
     with col3:
-        pending_feedback = len(tier_escalations[tier_escalations['status'] == 'Pending Feedback'])
+        pending_feedback = summary['pending_feedback']
         st.markdown(f"""
         <div class="metric-card">
             <h3>{pending_feedback}</h3>
@@ -460,7 +890,7 @@ def my_dashboard():
         """, unsafe_allow_html=True)
     
     with col4:
-        avg_days = my_escalations['days_open'].mean() if not my_escalations.empty else 0
+        avg_days = summary['avg_days_open']
         st.markdown(f"""
         <div class="metric-card">
             <h3>{avg_days:.1f}</h3>
@@ -468,15 +898,18 @@ def my_dashboard():
         </div>
         """, unsafe_allow_html=True)
     
-    # Recent escalations
+    # Recent escalations, one page at a time
     st.subheader("🔔 Recent Escalations")
     
-    if not my_escalations.empty:
-        # Filter and sort recent escalations
-        recent_escalations = my_escalations.head(10)
-        
-        for _, escalation in recent_escalations.iterrows():
-            display_escalation_card(escalation)
+    cursor = get_page_cursor("my_dashboard", (person_id,))
+    recent_escalations, next_cursor = db.get_escalations_page(person_id=person_id, page_size=GRID_PAGE_SIZE,
+                                                              cursor=cursor)
+    
+    if not recent_escalations.empty:
+        selected = show_escalation_grid(recent_escalations, "my_dashboard_grid", height=320)
+        show_page_navigation("my_dashboard", next_cursor)
+        if selected is not None:
+            show_escalation_detail(selected, "my_dashboard")
     else:
         st.info("No escalations found.")
 
@@ -533,8 +966,10 @@ def manage_escalations():
     """Manage and take actions on escalations"""
     st.subheader("🔄 Manage Escalations")
     
+    search_text = st.text_input("🔍 Search", placeholder="Search titles, descriptions, feedback and history notes...")
+    
     # Filters
-    col1, col2, col3, col4 = st.columns(4)
+    col1, col2, col3, col4, col5 = st.columns(5)
     
     with col1:
         status_filter = st.selectbox("Filter by Status", 
@@ -551,135 +986,199 @@ def manage_escalations():
     with col4:
         days_filter = st.slider("Days Open", 0, 30, (0, 30))
     
-    # Get escalations based on filters
-    tier_escalations = db.get_escalations(tier_id=st.session_state.selected_tier)
+    with col5:
+        sort_options = {
+            "Newest First": ['-created_at'],
+            "Oldest First": ['created_at'],
+            "Most Urgent": ['-urgency', '-created_at'],
+            "Recently Updated": ['-updated_at'],
+        }
+        sort_choice = st.selectbox("Sort by", list(sort_options.keys()))
+    
+    escalated = {"Escalated Only": True, "Not Escalated": False}.get(escalation_filter)
+    include_subtree = st.checkbox("Include sub-tiers", help="Also show escalations currently in tiers below this one")
+    
+    # All filters and sorting are applied in the database query, one page at a time
+    filters = dict(
+        tier_id=st.session_state.selected_tier,
+        status_filter=status_filter,
+        urgency_filter=urgency_filter,
+        escalated=escalated,
+        days_open_range=days_filter,
+        sort_by=sort_options[sort_choice],
+        include_subtree=include_subtree
+    )
+    if search_text.strip():
+        # Ranked full-text matches; the sort order does not apply
+        listing_key = "search_escalations"
+        search_filters = {key: value for key, value in filters.items() if key not in ('tier_id', 'sort_by')}
+        cursor = get_page_cursor(listing_key, dict(search_filters, query=search_text))
+        filtered_escalations, next_cursor = db.search_escalations(
+            search_text, tier_scope=st.session_state.selected_tier, page_size=GRID_PAGE_SIZE, cursor=cursor,
+            **search_filters)
+    else:
+        listing_key = "manage_escalations"
+        cursor = get_page_cursor(listing_key, filters)
+        filtered_escalations, next_cursor = db.get_escalations_page(page_size=GRID_PAGE_SIZE, cursor=cursor, **filters)
     
-    if not tier_escalations.empty:
-        # Apply filters
-        filtered_escalations = tier_escalations.copy()
+    if not filtered_escalations.empty:
+        st.write(f"Showing **{len(filtered_escalations)}** escalations")
         
-        if status_filter != "All":
-            filtered_escalations = filtered_escalations[filtered_escalations['status'] == status_filter]
+        selected = show_escalation_grid(filtered_escalations, f"{listing_key}_grid")
+        show_page_navigation(listing_key, next_cursor)
+        if selected is not None:
+            show_escalation_detail(selected, listing_key)
+    else:
+        st.info("No escalations found for your tier matching these filters.")
+
+def show_escalation_detail(escalation, pane_key):
+    """Show one escalation with the actions the selected person can take on it
+    
+    `pane_key` prefixes the widget keys so each listing can have its own pane.
+    The listing row only has a description preview, so the full text, feedback
+    and history are loaded here for the one selected escalation.
+    """
+    search_snippet = escalation.get('search_snippet')
+    escalation = db.get_escalation_detail(escalation['id'])
+    if escalation is None:
+        st.info("This escalation no longer exists.")
+        return
+    
+    detail_title = f"{escalation['title']} - {escalation['status']}"
+    if escalation['target_tier_id'] and escalation['assigned_to_name']:
+        detail_title += f" (Escalated to {escalation['target_tier_name']})"
+    st.write(f"### {detail_title}")
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        if search_snippet:
+            st.write(f"**🔍 Match:** {search_snippet}")
+        st.write(f"**Description:** {escalation['description']}")
+        st.write(f"**Created by:** {escalation['created_by_name']} (from {escalation['source_tier_name']})")
         
-        if urgency_filter != "All":
-            filtered_escalations = filtered_escalations[filtered_escalations['urgency'] == urgency_filter]
+        # Show escalation flow information
+        if escalation['target_tier_id'] and escalation['assigned_to_name']:
+            st.write(f"**📈 Escalated to:** {escalation['target_tier_name']} → {escalation['assigned_to_name']}")
+            if escalation['days_since_escalation'] is not None:
+                st.write(f"**⏱️ Days since escalation:** {escalation['days_since_escalation']} days")
         
-        if escalation_filter == "Escalated Only":
-            filtered_escalations = filtered_escalations[filtered_escalations['target_tier_id'].notna()]
-        elif escalation_filter == "Not Escalated":
-            filtered_escalations = filtered_escalations[filtered_escalations['target_tier_id'].isna()]
+        st.write(f"**📅 Total days open:** {escalation['days_open']} days")
+        st.write(f"**🏢 Current tier:** {escalation['current_tier_name']}")
         
-        filtered_escalations = filtered_escalations[
-            (filtered_escalations['days_open'] >= days_filter[0]) & 
-            (filtered_escalations['days_open'] <= days_filter[1])
-        ]
+        if escalation['feedback']:
+            st.write(f"**💬 Feedback:** {escalation['feedback']}")
+    
+    with col2:
+        # Check if current user is the creator/owner of the escalation
+        is_creator = escalation['created_by'] == st.session_state.selected_person
+        is_assigned = escalation['assigned_to'] == st.session_state.selected_person
+        current_tier_match = escalation['current_tier_id'] == st.session_state.selected_tier
         
-        st.write(f"**{len(filtered_escalations)}** escalations found")
+        # An action form stays open across the reruns its own widgets trigger, and
+        # submits against the version the escalation had when it was opened
+        form_key = f"{pane_key}_action_form"
+        open_form = st.session_state.get(form_key)
+        if open_form and open_form[1] != escalation['id']:
+            open_form = None
         
-        for _, escalation in filtered_escalations.iterrows():
-            # Create more informative expander title
-            expander_title = f"{escalation['title']} - {escalation['status']}"
-            if escalation['target_tier_id'] and escalation['assigned_to_name']:
-                expander_title += f" (Escalated to {escalation['target_tier_name']})"
+        # Owner/Creator permissions - can always close or delete (except when escalated and in progress)
+        if is_creator:
+            col_owner1, col_owner2 = st.columns(2)
+            with col_owner1:
+                # Owner can close escalation if not in progress at another tier
+                if escalation['status'] != 'In Progress' or current_tier_match:
+                    if st.button(f"✅ Close", key=f"{pane_key}_owner_close_{escalation['id']}", help="Close as resolved"):
+                        result = db.close_escalation(escalation['id'], st.session_state.selected_person,
+                                                     expected_version=escalation['version'])
+                        if result:
+                            st.success("✅ Escalation closed by owner!")
+                            st.rerun()
+                        else:
+                            show_transition_refused(result)
             
-            with st.expander(expander_title):
-                col1, col2 = st.columns([2, 1])
-                
-                with col1:
-                    st.write(f"**Description:** {escalation['description']}")
-                    st.write(f"**Created by:** {escalation['created_by_name']} (from {escalation['source_tier_name']})")
-                    
-                    # Show escalation flow information
-                    if escalation['target_tier_id'] and escalation['assigned_to_name']:
-                        st.write(f"**📈 Escalated to:** {escalation['target_tier_name']} → {escalation['assigned_to_name']}")
-                        if escalation['days_since_escalation'] is not None:
-                            st.write(f"**⏱️ Days since escalation:** {escalation['days_since_escalation']} days")
-                    
-                    st.write(f"**📅 Total days open:** {escalation['days_open']} days")
-                    st.write(f"**🏢 Current tier:** {escalation['current_tier_name']}")
-                    
-                    if escalation['feedback']:
-                        st.write(f"**💬 Feedback:** {escalation['feedback']}")
-                
-                with col2:
-                    # Check if current user is the creator/owner of the escalation
-                    is_creator = escalation['created_by'] == st.session_state.selected_person
-                    is_assigned = escalation['assigned_to'] == st.session_state.selected_person
-                    current_tier_match = escalation['current_tier_id'] == st.session_state.selected_tier
-                    
-                    # Owner/Creator permissions - can always close or delete (except when escalated and in progress)
-                    if is_creator:
-                        col_owner1, col_owner2 = st.columns(2)
-                        with col_owner1:
-                            # Owner can close escalation if not in progress at another tier
-                            if escalation['status'] != 'In Progress' or current_tier_match:
-                                if st.button(f"✅ Close", key=f"owner_close_{escalation['id']}", help="Close as resolved"):
-                                    db.close_escalation(escalation['id'], st.session_state.selected_person)
-                                    st.success("✅ Escalation closed by owner!")
-                                    st.rerun()
-                        
-                        with col_owner2:
-                            # Owner can delete escalation if it's not in progress at another tier
-                            if escalation['status'] != 'In Progress' or current_tier_match:
-                                if st.button(f"🗑️ Delete", key=f"owner_delete_{escalation['id']}", help="Permanently delete"):
-                                    if db.delete_escalation(escalation['id'], st.session_state.selected_person):
-                                        st.success("🗑️ Escalation deleted successfully!")
-                                        st.rerun()
-                                    else:
-                                        st.error("Unable to delete escalation. Only creators can delete their own escalations.")
-                    
-                    # Standard workflow actions
-                    if escalation['status'] == 'Open' and current_tier_match:
-                        if st.button(f"⬆️ Escalate to Next Tier", key=f"escalate_{escalation['id']}"):
-                            show_escalation_form(escalation['id'])
-                    
-                    elif escalation['status'] == 'In Progress':
-                        if is_assigned:
-                            # Assigned user can provide feedback and return to creator
-                            if st.button(f"💬 Provide Feedback & Return", key=f"feedback_{escalation['id']}"):
-                                show_feedback_form(escalation['id'])
-                        elif current_tier_match and not is_creator:
-                            # Other users in the same tier can also provide feedback
-                            if st.button(f"💬 Provide Feedback & Return", key=f"tier_feedback_{escalation['id']}"):
-                                show_feedback_form(escalation['id'])
-                    
-                    elif escalation['status'] == 'Pending Feedback' and is_creator:
-                        if st.button(f"✅ Close Escalation", key=f"close_{escalation['id']}"):
-                            db.close_escalation(escalation['id'], st.session_state.selected_person)
-                            st.success("✅ Escalation closed!")
+            with col_owner2:
+                # Owner can delete escalation if it's not in progress at another tier
+                if escalation['status'] != 'In Progress' or current_tier_match:
+                    if st.button(f"🗑️ Delete", key=f"{pane_key}_owner_delete_{escalation['id']}", help="Permanently delete"):
+                        if db.delete_escalation(escalation['id'], st.session_state.selected_person):
+                            st.success("🗑️ Escalation deleted successfully!")
                             st.rerun()
-                    
-                    # View history button (available to everyone)
-                    if st.button(f"📜 View History", key=f"history_{escalation['id']}"):
-                        show_escalation_history(escalation['id'])
+                        else:
+                            st.error("Unable to delete escalation. Only creators can delete their own escalations.")
+        
+        # Standard workflow actions
+        if escalation['status'] == 'Open' and current_tier_match:
+            if st.button(f"⬆️ Escalate to Next Tier", key=f"{pane_key}_escalate_{escalation['id']}"):
+                open_form = st.session_state[form_key] = ('escalate', escalation['id'], escalation['version'])
+            if open_form and open_form[0] == 'escalate':
+                show_escalation_form(escalation['id'], open_form[2], form_key)
+        
+        elif escalation['status'] == 'In Progress':
+            if is_assigned:
+                # Assigned user can provide feedback and return to creator
+                if st.button(f"💬 Provide Feedback & Return", key=f"{pane_key}_feedback_{escalation['id']}"):
+                    open_form = st.session_state[form_key] = ('feedback', escalation['id'], escalation['version'])
+            elif current_tier_match and not is_creator:
+                # Other users in the same tier can also provide feedback
+                if st.button(f"💬 Provide Feedback & Return", key=f"{pane_key}_tier_feedback_{escalation['id']}"):
+                    open_form = st.session_state[form_key] = ('feedback', escalation['id'], escalation['version'])
+            else:
+                open_form = None
+            if open_form and open_form[0] == 'feedback':
+                show_feedback_form(escalation['id'], open_form[2], form_key)
+        
+        elif escalation['status'] == 'Pending Feedback' and is_creator:
+            if st.button(f"✅ Close Escalation", key=f"{pane_key}_close_{escalation['id']}"):
+                result = db.close_escalation(escalation['id'], st.session_state.selected_person,
+                                             expected_version=escalation['version'])
+                if result:
+                    st.success("✅ Escalation closed!")
+                    st.rerun()
+                else:
+                    show_transition_refused(result)
+        
+        # View history button (available to everyone)
+        if st.button(f"📜 View History", key=f"{pane_key}_history_{escalation['id']}"):
+            show_escalation_history(escalation['history'])
+
+def show_transition_refused(result):
+    """Explain why an escalation action was not applied"""
+    if result.reason == 'conflict':
+        st.warning("⚠️ Someone else updated this escalation since you opened it. "
+                   "Review the latest version and try again.")
+    elif result.reason == 'invalid_status':
+        st.warning(f"⚠️ This escalation is now {result.status}, so that action no longer applies.")
     else:
-        st.info("No escalations found for your tier.")
+        st.error("This escalation no longer exists.")
 
-def show_escalation_form(escalation_id):
-    """Show form to escalate to next tier"""
+def show_escalation_form(escalation_id, expected_version=None, form_key="escalation_action_form"):
+    """Show form to escalate to next tier
+    
+    `form_key` is the session state entry holding the form open; it is cleared
+    when the form is submitted or cancelled.
+    """
     st.subheader("⬆️ Escalate to Next Tier")
     st.info("This will move the escalation to a higher tier for additional support or expertise.")
     
     # Get available tiers (higher level)
-    tiers_df = db.get_tiers()
-    current_tier = tiers_df[tiers_df['id'] == st.session_state.selected_tier].iloc[0]
-    higher_tiers = tiers_df[tiers_df['level'] > current_tier['level']]
+    tier_graph = db.get_tier_graph()
+    higher_tiers = tier_graph.higher_tiers(st.session_state.selected_tier)
     
-    if higher_tiers.empty:
+    if not higher_tiers:
         st.warning("No higher tier available for escalation.")
         return
     
-    with st.form(f"escalate_form_{escalation_id}"):
-        target_tier_options = [(row['name'], row['id']) for _, row in higher_tiers.iterrows()]
-        selected_tier_name = st.selectbox("Target Tier", options=[opt[0] for opt in target_tier_options])
-        target_tier_id = next(opt[1] for opt in target_tier_options if opt[0] == selected_tier_name)
+    with st.form(f"{form_key}_escalate_{escalation_id}"):
+        target_tier_id = st.selectbox("Target Tier", options=higher_tiers, format_func=tier_graph.name)
+        selected_tier_name = tier_graph.name(target_tier_id)
         
         # Get people in target tier
         target_people = db.get_people(target_tier_id)
         if not target_people.empty:
-            people_options = [(row['name'], row['id']) for _, row in target_people.iterrows()]
-            selected_person_name = st.selectbox("Assign to", options=[opt[0] for opt in people_options])
-            assigned_to = next(opt[1] for opt in people_options if opt[0] == selected_person_name)
+            people_names = dict(zip(target_people['id'], target_people['name']))
+            assigned_to = st.selectbox("Assign to", options=list(people_names), format_func=people_names.get)
+            selected_person_name = people_names[assigned_to]
         else:
             st.error("No people found in target tier.")
             return
@@ -687,20 +1186,27 @@ def show_escalation_form(escalation_id):
         col1, col2 = st.columns([1, 1])
         with col1:
             if st.form_submit_button("⬆️ Escalate Now", type="primary"):
-                db.escalate_to_next_tier(escalation_id, target_tier_id, assigned_to, st.session_state.selected_person)
-                st.success(f"✅ Escalation successfully sent to {selected_tier_name} and assigned to {selected_person_name}!")
-                st.rerun()
+                result = db.escalate_to_next_tier(escalation_id, target_tier_id, assigned_to,
+                                                  st.session_state.selected_person,
+                                                  expected_version=expected_version)
+                if result:
+                    st.session_state.pop(form_key, None)
+                    st.success(f"✅ Escalation successfully sent to {selected_tier_name} and assigned to {selected_person_name}!")
+                    st.rerun()
+                else:
+                    show_transition_refused(result)
         
         with col2:
             if st.form_submit_button("❌ Cancel"):
+                st.session_state.pop(form_key, None)
                 st.rerun()
 
-def show_feedback_form(escalation_id):
-    """Show form to provide feedback and return to creator"""
+def show_feedback_form(escalation_id, expected_version=None, form_key="escalation_action_form"):
+    """Show form to provide feedback and return to creator, held open by `form_key` like show_escalation_form"""
     st.subheader("💬 Provide Feedback & Return to Creator")
     st.info("This will return the escalation to the original creator with your feedback for their review.")
     
-    with st.form(f"feedback_form_{escalation_id}"):
+    with st.form(f"{form_key}_feedback_{escalation_id}"):
         feedback = st.text_area("Feedback*", 
                                placeholder="Provide your feedback, resolution details, or recommendations...\n\nExample:\n- Issue has been resolved by...\n- Recommended next steps are...\n- Additional information needed...",
                                height=150)
@@ -709,24 +1215,26 @@ def show_feedback_form(escalation_id):
         with col1:
             if st.form_submit_button("📤 Submit Feedback & Return", type="primary"):
                 if feedback:
-                    if db.return_escalation_to_creator(escalation_id, feedback, st.session_state.selected_person):
+                    result = db.return_escalation_to_creator(escalation_id, feedback, st.session_state.selected_person,
+                                                             expected_version=expected_version)
+                    if result:
+                        st.session_state.pop(form_key, None)
                         st.success("✅ Feedback provided and escalation returned to creator!")
                         st.rerun()
                     else:
-                        st.error("Unable to return escalation to creator.")
+                        show_transition_refused(result)
                 else:
                     st.error("Please provide feedback before submitting.")
         
         with col2:
             if st.form_submit_button("❌ Cancel"):
+                st.session_state.pop(form_key, None)
                 st.rerun()
 
-def show_escalation_history(escalation_id):
-    """Show escalation history"""
+def show_escalation_history(history_df):
+    """Show escalation history, as loaded by get_escalation_detail"""
     st.subheader("Escalation History")
     
-    history_df = db.get_escalation_history(escalation_id)
-    
     if not history_df.empty:
         for _, record in history_df.iterrows():
             with st.container():
@@ -751,28 +1259,41 @@ def tier_overview():
     """Overview of the current tier's performance"""
     st.subheader("📈 Tier Overview")
     
-    tier_escalations = db.get_escalations(tier_id=st.session_state.selected_tier)
+    col1, col2 = st.columns(2)
+    with col1:
+        include_subtree = st.checkbox("Include sub-tiers", key="tier_overview_subtree",
+                                      help="Roll up escalations from every tier below this one")
+    with col2:
+        include_archived = st.checkbox("Include archived", key="tier_overview_archived",
+                                       help="Also count Closed escalations moved to the archive")
+    
+    # Counters by status and urgency for this tier, maintained on every write
+    tier_counters = db.get_escalation_counters(tier_id=st.session_state.selected_tier,
+                                               include_subtree=include_subtree,
+                                               include_archived=include_archived)
     
-    if not tier_escalations.empty:
+    if not tier_counters.empty:
         # Performance metrics
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            total_escalations = len(tier_escalations)
-            open_escalations = len(tier_escalations[tier_escalations['status'].isin(['Open', 'In Progress'])])
+            total_escalations = int(tier_counters['escalation_count'].sum())
+            open_escalations = int(tier_counters[tier_counters['status'].isin(['Open', 'In Progress'])]['escalation_count'].sum())
             st.metric("Total Escalations", total_escalations)
             st.metric("Open Escalations", open_escalations)
         
         with col2:
-            avg_resolution = tier_escalations[tier_escalations['status'] == 'Closed']['days_open'].mean()
-            st.metric("Avg Resolution Time", f"{avg_resolution:.1f} days" if pd.notna(avg_resolution) else "N/A")
+            closed_counters = tier_counters[tier_counters['status'] == 'Closed']
+            closed_count = closed_counters['escalation_count'].sum()
+            avg_resolution = closed_counters['resolution_days_sum'].sum() / closed_count if closed_count else None
+            st.metric("Avg Resolution Time", f"{avg_resolution:.1f} days" if avg_resolution is not None else "N/A")
             
-            critical_count = len(tier_escalations[tier_escalations['urgency'] == 'Critical'])
+            critical_count = int(tier_counters[tier_counters['urgency'] == 'Critical']['escalation_count'].sum())
             st.metric("Critical Issues", critical_count)
         
         with col3:
             # Escalation trend (simple calculation)
-            escalation_rate = len(tier_escalations[tier_escalations['target_tier_id'].notna()]) / len(tier_escalations) * 100
+            escalation_rate = tier_counters['escalated_count'].sum() / total_escalations * 100
             st.metric("Escalation Rate", f"{escalation_rate:.1f}%")
         
         # Charts
@@ -780,19 +1301,46 @@ def tier_overview():
         
         with col1:
             # Urgency distribution
-            urgency_counts = tier_escalations['urgency'].value_counts()
+            urgency_counts = tier_counters.groupby('urgency')['escalation_count'].sum().sort_values(ascending=False)
             fig_urgency = px.pie(values=urgency_counts.values, names=urgency_counts.index,
                                title="Urgency Distribution")
             st.plotly_chart(fig_urgency, use_container_width=True)
         
         with col2:
             # Status distribution
-            status_counts = tier_escalations['status'].value_counts()
+            status_counts = tier_counters.groupby('status')['escalation_count'].sum().sort_values(ascending=False)
             fig_status = px.bar(x=status_counts.index, y=status_counts.values,
                               title="Status Distribution")
             st.plotly_chart(fig_status, use_container_width=True)
     else:
         st.info("No escalations data available for this tier.")
+    
+    st.write("### 📈 Trends")
+    show_trend_charts("tier_overview", tier_id=st.session_state.selected_tier, include_subtree=include_subtree)
+    
+    # Roll-up of each child tier's whole subtree
+    rollup = db.get_subtree_rollup(st.session_state.selected_tier, include_archived=include_archived)
+    child_rollup = rollup[rollup['depth'] == 1]
+    if not child_rollup.empty:
+        st.write("### 🌳 Sub-tier Roll-up")
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Tiers Below", int(child_rollup['tier_count'].sum()))
+        with col2:
+            st.metric("Escalations Below", int(child_rollup['escalation_count'].sum()))
+        with col3:
+            st.metric("Open Below", int((child_rollup['open_count'] + child_rollup['in_progress_count']).sum()))
+        with col4:
+            st.metric("Critical Below", int(child_rollup['critical_count'].sum()))
+        
+        fig_rollup = px.bar(child_rollup, x='tier_name',
+                            y=['open_count', 'in_progress_count', 'pending_feedback_count', 'closed_count'],
+                            title="Escalations by Child Tier Subtree",
+                            labels={'tier_name': 'Child tier', 'value': 'Escalations', 'variable': 'Status'})
+        st.plotly_chart(fig_rollup, use_container_width=True)
+        st.dataframe(child_rollup[['tier_name', 'tier_count', 'escalation_count', 'open_count', 'in_progress_count',
+                                   'pending_feedback_count', 'closed_count', 'critical_count']],
+                     use_container_width=True, hide_index=True)
 
 def show_password_change_form():
     """Show password change form"""
@@ -828,7 +1376,8 @@ def show_password_change_form():
 def show_edit_tier_form():
     """Show edit tier form"""
     tier_id = st.session_state.editing_tier
-    tier_data = db.get_tier_by_id(tier_id)
+    tier_graph = db.get_tier_graph()
+    tier_data = tier_graph.by_id.get(tier_id)
     
     if not tier_data:
         st.error("Tier not found.")
@@ -842,20 +1391,16 @@ def show_edit_tier_form():
         tier_name = st.text_input("Tier Name", value=tier_data['name'])
         tier_level = st.number_input("Tier Level", min_value=1, value=tier_data['level'], step=1)
         
-        # Get existing tiers for parent selection (excluding current tier)
-        tiers_df = db.get_tiers()
-        available_tiers = tiers_df[tiers_df['id'] != tier_id]
-        
-        if not available_tiers.empty:
-            tier_options = ["None"] + [(row['name'], row['id']) for _, row in available_tiers.iterrows()]
-            current_parent = tier_data['parent_tier_name'] if tier_data['parent_tier_id'] else "None"
-            try:
-                parent_index = [opt[0] for opt in tier_options].index(current_parent)
-            except ValueError:
-                parent_index = 0
+        # Existing tiers for parent selection (excluding current tier and its sub-tiers)
+        available_tiers = tier_graph.parent_options(tier_id)
+        
+        if available_tiers:
+            tier_options = (None,) + available_tiers
+            current_parent = tier_data['parent_tier_id']
+            parent_index = tier_options.index(current_parent) if current_parent in tier_options else 0
             
-            parent_tier = st.selectbox("Parent Tier", options=[opt[0] for opt in tier_options], index=parent_index)
-            parent_tier_id = None if parent_tier == "None" else next(opt[1] for opt in tier_options if opt[0] == parent_tier)
+            parent_tier_id = st.selectbox("Parent Tier", options=tier_options, index=parent_index,
+                                          format_func=tier_graph.name)
         else:
             parent_tier_id = None
         
@@ -865,10 +1410,12 @@ def show_edit_tier_form():
         with col1:
             if st.form_submit_button("Update Tier", type="primary"):
                 if tier_name:
-                    db.update_tier(tier_id, tier_name, tier_level, parent_tier_id, tier_description)
-                    st.success(f"Tier '{tier_name}' updated successfully!")
-                    st.session_state.editing_tier = None
-                    st.rerun()
+                    if db.update_tier(tier_id, tier_name, tier_level, parent_tier_id, tier_description):
+                        st.success(f"Tier '{tier_name}' updated successfully!")
+                        st.session_state.editing_tier = None
+                        st.rerun()
+                    else:
+                        st.error("A tier cannot be moved under itself or one of its sub-tiers")
                 else:
                     st.error("Please provide a tier name")
         
@@ -895,18 +1442,12 @@ def show_edit_person_form():
         person_email = st.text_input("Email", value=person_data['email'])
         
         # Tier selection
-        tiers_df = db.get_tiers()
-        if not tiers_df.empty:
-            tier_options = [(row['name'], row['id']) for _, row in tiers_df.iterrows()]
-            try:
-                tier_index = [opt[1] for opt in tier_options].index(person_data['tier_id'])
-            except ValueError:
-                tier_index = 0
-            
-            selected_tier_name = st.selectbox("Assign to Tier", 
-                                            options=[opt[0] for opt in tier_options], 
-                                            index=tier_index)
-            selected_tier_id = next(opt[1] for opt in tier_options if opt[0] == selected_tier_name)
+        tier_graph = db.get_tier_graph()
+        if len(tier_graph):
+            selected_tier_id = st.selectbox("Assign to Tier", 
+                                            options=tier_graph.order, 
+                                            index=tier_graph.position.get(person_data['tier_id'], 0),
+                                            format_func=tier_graph.name)
         else:
             st.error("No tiers available!")
             return
@@ -942,6 +1483,9 @@ def show_edit_person_form():
 def main():
     """Main application navigation"""
     
+    # Started once per server process; later reruns get the running scanner
+    db.start_sla_scanner()
+    
     # Navigation menu
     with st.sidebar:
         st.image("https://via.placeholder.com/200x100/4CAF50/FFFFFF?text=TAD", caption="Tiered Accountability Dashboard")
@@ -0,0 +1,305 @@
+"""
+Benchmark Suite for Tiered Accountability Dashboard
+
+Generates synthetic databases at several scales, times every public
+DatabaseManager method and the data loading of each page, and writes
+p50/p95/p99 latencies and rows/sec as JSON so runs can be compared between
+commits:
+
+    python3 benchmark.py --scales small,medium --output bench.json
+    python3 benchmark.py --scales small --compare bench.json
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import subprocess
+import tempfile
+import time
+from datetime import datetime, timezone
+import pandas as pd
+from database import DatabaseManager
+from generate_data import generate_data
+
+SCALES = {
+    'small': {'tiers': 20, 'people': 200, 'escalations': 2000},
+    'medium': {'tiers': 200, 'people': 2000, 'escalations': 50000},
+    'large': {'tiers': 200, 'people': 10000, 'escalations': 500000},
+}
+
+def _rows(result) -> int:
+    """Number of rows a DatabaseManager call returned"""
+    if isinstance(result, pd.DataFrame):
+        return len(result)
+    if isinstance(result, tuple) and result and isinstance(result[0], pd.DataFrame):
+        return len(result[0])
+    if isinstance(result, dict) and 'created' in result:
+        return len(result['created'])
+    if isinstance(result, list):
+        return len(result)
+    return 1
+
+def _percentile(samples, percent):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(percent / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+def _summarize(samples, rows):
+    total = sum(samples)
+    return {
+        'calls': len(samples),
+        'p50_ms': round(statistics.median(samples) * 1000, 3),
+        'p95_ms': round(_percentile(samples, 95) * 1000, 3),
+        'p99_ms': round(_percentile(samples, 99) * 1000, 3),
+        'rows': rows,
+        'rows_per_sec': round(rows / total, 1) if total else None,
+    }
+
+class Fixtures:
+    """Random but seeded arguments drawn from the generated data"""
+    
+    def __init__(self, db: DatabaseManager, seed: int):
+        self.db = db
+        self.rng = random.Random(seed)
+        with db.get_connection() as conn:
+            self.tiers = [row[0] for row in conn.execute('SELECT id FROM tiers')]
+            self.people = conn.execute('SELECT id, tier_id FROM people WHERE is_active = 1').fetchall()
+            self.escalations = [row[0] for row in conn.execute(
+                "SELECT id FROM escalations ORDER BY created_at_epoch DESC LIMIT 5000")]
+        self.counter = 0
+    
+    def tier(self):
+        return self.rng.choice(self.tiers)
+    
+    def person(self):
+        return self.rng.choice(self.people)
+    
+    def escalation(self):
+        return self.rng.choice(self.escalations)
+    
+    def unique(self, prefix):
+        self.counter += 1
+        return f"{prefix}-{self.counter}-{self.rng.getrandbits(32)}"
+    
+    def new_escalation(self):
+        creator, tier_id = self.person()
+        return self.db.create_escalation(self.unique("bench"), "Benchmark escalation", "Medium", creator, tier_id), creator
+
+def _method_cases(db: DatabaseManager, f: Fixtures):
+    """(name, prepare) pairs; prepare returns a zero-argument call to time"""
+    def escalated():
+        escalation_id, creator = f.new_escalation()
+        assignee, target = f.person()
+        db.escalate_to_next_tier(escalation_id, target, assignee, creator)
+        return escalation_id, creator, assignee
+    
+    def archived_escalation():
+        with db.get_connection() as conn:
+            return conn.execute('SELECT id FROM escalations_archive ORDER BY random() LIMIT 1').fetchone()[0]
+    
+    def bench_person():
+        return db.create_person(f.unique("Bench"), f.unique("bench") + "@example.com", f.tier())
+    
+    return [
+        ('verify_admin_password', lambda: lambda: db.verify_admin_password("TA")),
+        ('change_admin_password', lambda: lambda: db.change_admin_password("TA", "TA")),
+        ('get_tiers', lambda: db.get_tiers),
+        ('get_tier_by_id', lambda: (lambda tier_id: lambda: db.get_tier_by_id(tier_id))(f.tier())),
+        ('get_tier_hierarchy', lambda: db.get_tier_hierarchy),
+        ('get_tier_graph', lambda: db.get_tier_graph),
+        ('get_tier_stats', lambda: db.get_tier_stats),
+        ('get_tier_ancestors', lambda: (lambda tier_id: lambda: db.get_tier_ancestors(tier_id))(f.tier())),
+        ('get_tier_descendants', lambda: (lambda tier_id: lambda: db.get_tier_descendants(tier_id))(f.tier())),
+        ('get_subtree_rollup', lambda: (lambda tier_id: lambda: db.get_subtree_rollup(tier_id))(f.tier())),
+        ('get_people', lambda: db.get_people),
+        ('get_people_by_tier', lambda: (lambda tier_id: lambda: db.get_people(tier_id))(f.tier())),
+        ('get_person_by_id', lambda: (lambda person: lambda: db.get_person_by_id(person[0]))(f.person())),
+        ('get_person_summary', lambda: (lambda person: lambda: db.get_person_summary(*person))(f.person())),
+        ('get_escalations', lambda: db.get_escalations),
+        ('get_escalations_by_tier', lambda: (lambda tier_id: lambda: db.get_escalations(tier_id=tier_id))(f.tier())),
+        ('get_escalations_by_person', lambda: (lambda person: lambda: db.get_escalations(person_id=person[0]))(f.person())),
+        ('get_escalations_page', lambda: (lambda tier_id: lambda: db.get_escalations_page(tier_id=tier_id))(f.tier())),
+        ('get_escalations_page_subtree', lambda: (lambda tier_id: lambda: db.get_escalations_page(
+            tier_id=tier_id, include_subtree=True))(f.tier())),
+        ('search_escalations', lambda: lambda: db.search_escalations("resolved investigation")),
+        ('search_escalations_by_tier', lambda: (lambda tier_id: lambda: db.search_escalations(
+            "synthetic", tier_scope=tier_id))(f.tier())),
+        ('get_escalation_detail', lambda: (lambda escalation_id: lambda: db.get_escalation_detail(escalation_id))(f.escalation())),
+        ('get_escalation_history', lambda: (lambda escalation_id: lambda: db.get_escalation_history(escalation_id))(f.escalation())),
+        ('get_escalation_counters', lambda: db.get_escalation_counters),
+        ('get_daily_snapshots', lambda: db.get_daily_snapshots),
+        ('get_daily_snapshots_by_tier', lambda: (lambda tier_id: lambda: db.get_daily_snapshots(
+            tier_id=tier_id, include_subtree=True))(f.tier())),
+        ('get_time_in_status', lambda: db.get_time_in_status),
+        ('get_handoff_latency', lambda: db.get_handoff_latency),
+        ('get_feedback_round_trip', lambda: db.get_feedback_round_trip),
+        ('create_tier', lambda: lambda: db.create_tier(f.unique("Bench Tier"), 99)),
+        ('update_tier', lambda: (lambda tier_id: lambda: db.update_tier(tier_id, f.unique("Bench Tier"), 99))(
+            db.create_tier(f.unique("Bench Tier"), 99))),
+        ('delete_tier', lambda: (lambda tier_id: lambda: db.delete_tier(tier_id))(db.create_tier(f.unique("Bench Tier"), 99))),
+        ('create_person', lambda: lambda: bench_person()),
+        ('update_person', lambda: (lambda person_id: lambda: db.update_person(
+            person_id, "Bench Person", f.unique("bench") + "@example.com", f.tier(), "member"))(bench_person())),
+        ('delete_person', lambda: (lambda person_id: lambda: db.delete_person(person_id))(bench_person())),
+        ('create_escalation', lambda: lambda: f.new_escalation()),
+        ('escalate_to_next_tier', lambda: (lambda created, assignee: lambda: db.escalate_to_next_tier(
+            created[0], assignee[1], assignee[0], created[1]))(f.new_escalation(), f.person())),
+        ('provide_feedback', lambda: (lambda e: lambda: db.provide_feedback(e[0], "Benchmark feedback", e[2]))(escalated())),
+        ('return_escalation_to_creator', lambda: (lambda e: lambda: db.return_escalation_to_creator(
+            e[0], "Benchmark feedback", e[2]))(escalated())),
+        ('close_escalation', lambda: (lambda e: lambda: db.close_escalation(e[0], e[1]))(f.new_escalation())),
+        ('delete_escalation', lambda: (lambda e: lambda: db.delete_escalation(e[0], e[1]))(f.new_escalation())),
+        ('create_people_bulk', lambda: lambda: db.create_people_bulk([
+            {'name': "Bench", 'email': f.unique("bulk") + "@example.com", 'tier_id': f.tier()} for _ in range(100)])),
+        ('create_escalations_bulk', lambda: (lambda person: lambda: db.create_escalations_bulk([
+            {'title': "Bench bulk", 'urgency': "Low", 'created_by': person[0]} for _ in range(100)]))(f.person())),
+        ('create_tiers_bulk', lambda: lambda: db.create_tiers_bulk([
+            {'name': f.unique("Bulk Tier"), 'level': 99} for _ in range(10)])),
+        # The first call records the existing breaches; later calls time an idle scan
+        ('scan_sla_breaches', lambda: db.scan_sla_breaches),
+        # The first call archives the older half of the year; later calls time the no-op scan
+        ('archive_closed_escalations', lambda: lambda: db.archive_closed_escalations(180)),
+        ('restore_escalation', lambda: (lambda escalation_id: lambda: db.restore_escalation(escalation_id))(
+            archived_escalation())),
+        ('get_escalations_page_archived', lambda: lambda: db.get_escalations_page(archived=True)),
+        ('get_escalation_counters_archived', lambda: lambda: db.get_escalation_counters(include_archived=True)),
+        ('rebuild_escalation_counters', lambda: db.rebuild_escalation_counters),
+        ('snapshot_daily', lambda: db.snapshot_daily),
+        ('build_daily_snapshots', lambda: db.build_daily_snapshots),
+        ('refresh_status_durations', lambda: db.refresh_status_durations),
+        ('refresh_status_durations_full', lambda: lambda: db.refresh_status_durations(full=True)),
+        ('rebuild_tier_closure', lambda: db.rebuild_tier_closure),
+        ('rebuild_search_index', lambda: db.rebuild_search_index),
+    ]
+
+def _page_cases(db: DatabaseManager, f: Fixtures):
+    """Data loading of each app.py page, mirroring the calls it makes per render"""
+    def my_dashboard():
+        person_id, tier_id = f.person()
+        db.get_person_summary(person_id, tier_id)
+        return db.get_escalations_page(person_id=person_id, page_size=10)
+    
+    def manage_escalations():
+        return db.get_escalations_page(tier_id=f.tier(), status_filter="All", urgency_filter="All",
+                                       days_open_range=(0, 30), sort_by=['-created_at'], page_size=25)
+    
+    def tier_overview():
+        return db.get_escalation_counters(tier_id=f.tier())
+    
+    def escalation_form():
+        targets = db.get_tier_graph().higher_tiers(f.tier())
+        return db.get_people(targets[0] if targets else f.tier())
+    
+    def admin_tiers():
+        db.get_tier_graph()
+        return db.get_tier_stats()
+    
+    def admin_people():
+        db.get_tier_graph()
+        return db.get_people()
+    
+    def admin_analytics():
+        return db.get_escalation_counters()
+    
+    return [
+        ('page:my_dashboard', lambda: my_dashboard),
+        ('page:manage_escalations', lambda: manage_escalations),
+        ('page:tier_overview', lambda: tier_overview),
+        ('page:escalation_form', lambda: escalation_form),
+        ('page:admin_tiers', lambda: admin_tiers),
+        ('page:admin_people', lambda: admin_people),
+        ('page:admin_analytics', lambda: admin_analytics),
+    ]
+
+def _time_cases(cases, iterations):
+    results = {}
+    for name, prepare in cases:
+        samples, rows = [], 0
+        for _ in range(iterations):
+            call = prepare()
+            start = time.perf_counter()
+            result = call()
+            samples.append(time.perf_counter() - start)
+            rows += _rows(result)
+        results[name] = _summarize(samples, rows)
+    return results
+
+def run_scale(name, sizes, iterations, seed, workdir):
+    """Generate one scale and time every method and page against it"""
+    db_path = os.path.join(workdir, f"bench_{name}.db")
+    db = DatabaseManager(db_path, cache_size=0)
+    try:
+        start = time.perf_counter()
+        counts = generate_data(db, seed=seed, **sizes)
+        generate_seconds = time.perf_counter() - start
+        
+        fixtures = Fixtures(db, seed)
+        # Reads and page loads are measured before the write benchmarks add rows
+        results = _time_cases(_page_cases(db, fixtures), iterations)
+        results.update(_time_cases(_method_cases(db, fixtures), iterations))
+        return {
+            'scale': name,
+            **counts,
+            'generate_seconds': round(generate_seconds, 2),
+            'db_bytes': os.path.getsize(db_path),
+            'results': results,
+        }
+    finally:
+        db.close()
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare(report, baseline):
+    """Print p95 changes against an earlier report"""
+    previous = {run['scale']: run['results'] for run in baseline['scales']}
+    print(f"\n📊 p95 compared with {baseline.get('commit') or 'baseline'}:")
+    for run in report['scales']:
+        for name, result in run['results'].items():
+            before = previous.get(run['scale'], {}).get(name)
+            if not before or not before['p95_ms']:
+                continue
+            change = (result['p95_ms'] - before['p95_ms']) / before['p95_ms'] * 100
+            flag = "⚠️ " if change > 20 else "   "
+            print(f"{flag}{run['scale']:>7} {name:<32} {before['p95_ms']:>10.3f} → {result['p95_ms']:>10.3f} ms ({change:+.0f}%)")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark DatabaseManager at several data scales")
+    parser.add_argument("--scales", default="small,medium", help=f"Comma-separated from {', '.join(SCALES)}")
+    parser.add_argument("--iterations", type=int, default=30, help="Calls per method")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    parser.add_argument("--compare", help="Earlier JSON report to compare p95 latencies against")
+    args = parser.parse_args()
+    
+    report = {
+        'commit': _git_commit(),
+        'run_at': datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S'),
+        'iterations': args.iterations,
+        'seed': args.seed,
+        'scales': [],
+    }
+    with tempfile.TemporaryDirectory() as workdir:
+        for name in args.scales.split(','):
+            print(f"⏱️ Running {name} scale {SCALES[name]}...", flush=True)
+            report['scales'].append(run_scale(name, SCALES[name], args.iterations, args.seed, workdir))
+    
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(report, output, indent=2)
+        print(f"✅ Report written to {args.output}")
+    else:
+        print(json.dumps(report, indent=2))
+    
+    if args.compare:
+        with open(args.compare) as baseline:
+            compare(report, json.load(baseline))
+
+if __name__ == "__main__":
+    main()
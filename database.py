@@ -1,20 +1,924 @@
 import sqlite3
+import bisect
+import re
 import uuid
-from datetime import datetime
-from typing import List, Dict, Optional
+import copy
+import queue
+import threading
+import time
+import random
+import functools
+import itertools
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from contextlib import contextmanager
+from types import MappingProxyType
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Optional, Tuple
+import numpy as np
 import pandas as pd
 import hashlib
 
+# Allowed values, matching the CHECK constraints and the Admin Panel choices
+URGENCY_LEVELS = ('Low', 'Medium', 'High', 'Critical')
+PERSON_ROLES = ('member', 'lead', 'manager', 'admin')
+
+def _clean(value):
+    """Normalize an imported value: strip strings, map blanks and NaN to None"""
+    if value is None or (isinstance(value, float) and value != value):
+        return None
+    if isinstance(value, str):
+        value = value.strip()
+        return value or None
+    return value
+
+def _format_timestamp(value) -> Optional[str]:
+    """Convert an imported timestamp to the 'YYYY-MM-DD HH:MM:SS' form SQLite writes"""
+    value = _clean(value)
+    if value is None:
+        return None
+    if not isinstance(value, datetime):
+        value = datetime.fromisoformat(str(value))
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.strftime('%Y-%m-%d %H:%M:%S')
+
+class PooledConnection(sqlite3.Connection):
+    """Connection handed out by ConnectionPool
+    
+    `depth` counts the checkouts holding it on the current thread. Only the
+    outermost one ends the transaction: commit() or rollback() under a nested
+    checkout would end its caller's transaction early, so they raise instead.
+    """
+    
+    depth = 0
+    
+    def _check_outermost(self, action: str):
+        if self.depth > 1:
+            raise sqlite3.ProgrammingError(
+                f"{action}() inside a nested connection checkout; the outermost checkout ends the transaction")
+    
+    def commit(self):
+        self._check_outermost('commit')
+        super().commit()
+    
+    def rollback(self):
+        self._check_outermost('rollback')
+        super().rollback()
+
+class ConnectionPool:
+    """Bounded pool of SQLite connections shared by all sessions and threads"""
+    
+    # Pragmas applied to every new connection. WAL lets readers proceed while a
+    # writer holds the lock; NORMAL sync is durable in WAL mode apart from the
+    # last transactions on power loss.
+    PRAGMAS = (
+        'PRAGMA journal_mode = WAL',
+        'PRAGMA synchronous = NORMAL',
+        'PRAGMA cache_size = -16000',
+        'PRAGMA mmap_size = 268435456',
+        'PRAGMA temp_store = MEMORY',
+    )
+    
+    def __init__(self, db_path: str, size: int = 8, busy_timeout: float = 30.0):
+        self.db_path = db_path
+        # An in-memory database only exists for the connection that created it
+        self.size = 1 if db_path == ":memory:" else size
+        self.busy_timeout = busy_timeout
+        self._idle = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        # Optional sqlite3 trace callback installed on connections as they are checked out
+        self.trace_callback = None
+        self._traced = {}
+    
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout, check_same_thread=False,
+                               factory=PooledConnection)
+        conn.execute(f'PRAGMA busy_timeout = {int(self.busy_timeout * 1000)}')
+        for pragma in self.PRAGMAS:
+            conn.execute(pragma)
+        return conn
+    
+    def _acquire(self) -> sqlite3.Connection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._created < self.size:
+                self._created += 1
+                create = True
+            else:
+                create = False
+        if create:
+            try:
+                return self._connect()
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+        try:
+            return self._idle.get(timeout=self.busy_timeout)
+        except queue.Empty:
+            raise sqlite3.OperationalError("timed out waiting for a pooled database connection")
+    
+    @contextmanager
+    def connection(self):
+        """Check out a connection for one unit of work.
+        
+        The outermost checkout on a thread wraps the work in a transaction that
+        commits on success and rolls back on error. Nested checkouts on the same
+        thread reuse that connection and transaction: they must not commit or
+        roll back (PooledConnection raises if they try), and an error leaving a
+        nested checkout rolls back the whole transaction once it reaches the
+        outermost one. An error caught in between does not undo the inner writes;
+        use a SAVEPOINT for that, as queued writes do.
+        """
+        held = getattr(self._local, 'conn', None)
+        if held is not None:
+            held.depth += 1
+            try:
+                yield held
+            finally:
+                held.depth -= 1
+            return
+        
+        conn = self._acquire()
+        if self._traced.get(id(conn)) is not self.trace_callback:
+            conn.set_trace_callback(self.trace_callback)
+            self._traced[id(conn)] = self.trace_callback
+        self._local.conn = conn
+        conn.depth = 1
+        try:
+            with conn:
+                yield conn
+        finally:
+            self._local.conn = None
+            conn.depth = 0
+            self._idle.put(conn)
+    
+    @property
+    def held(self) -> bool:
+        """Whether this thread already has a connection checked out"""
+        return getattr(self._local, 'conn', None) is not None
+    
+    @contextmanager
+    def write_connection(self):
+        """Check out a connection inside BEGIN IMMEDIATE
+        
+        The write lock is taken before anything is read, so checks made in the
+        transaction still hold when its writes run, and a busy database is
+        reported up front rather than partway through. A nested checkout joins
+        the transaction already open.
+        """
+        with self.connection() as conn:
+            if not conn.in_transaction:
+                conn.execute('BEGIN IMMEDIATE')
+            yield conn
+    
+    def close(self):
+        """Close every idle connection in the pool"""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+            with self._lock:
+                self._created -= 1
+
+class QueryCache:
+    """Bounded LRU cache of read results shared by every session of a DatabaseManager
+    
+    Entries are tagged with the data generation they were read at. The generation
+    moves whenever a mutating method runs in this process, and whenever SQLite
+    reports a commit from another connection (PRAGMA data_version), which also
+    covers other processes sharing the same database file.
+    """
+    
+    def __init__(self, db_path: str, max_entries: int = 256, ttl: float = 60.0):
+        self.max_entries = max_entries
+        # Bounds staleness of values derived from the clock, such as days_open
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._local_generation = 0
+        # A dedicated connection used only to watch for commits by anyone else
+        self._watcher = None if db_path == ":memory:" else sqlite3.connect(db_path, check_same_thread=False)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+    
+    def generation(self) -> Tuple[int, int]:
+        """Current data generation (local write counter, SQLite data_version)"""
+        with self._lock:
+            data_version = self._watcher.execute('PRAGMA data_version').fetchone()[0] if self._watcher else 0
+            return (self._local_generation, data_version)
+    
+    def bump(self):
+        """Invalidate every entry after a write through this process"""
+        with self._lock:
+            self._local_generation += 1
+            self.invalidations += 1
+    
+    def get(self, key, generation):
+        """Return (found, value) for an entry read at this generation and not yet expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry_generation, stored_at, value = entry
+                if entry_generation == generation and time.monotonic() - stored_at < self.ttl:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, value
+                del self._entries[key]
+            self.misses += 1
+            return False, None
+    
+    def put(self, key, generation, value):
+        """Store a value read at the given generation, evicting the least recently used entry"""
+        with self._lock:
+            self._entries[key] = (generation, time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+    
+    def clear(self):
+        """Drop every cached entry"""
+        with self._lock:
+            self._entries.clear()
+    
+    def stats(self) -> Dict:
+        """Hit/miss counters for display in the Admin Panel"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+                'generation': self._local_generation,
+            }
+    
+    def close(self):
+        """Close the commit watcher connection"""
+        if self._watcher is not None:
+            self._watcher.close()
+            self._watcher = None
+
+def _freeze(value):
+    """Turn method arguments into a hashable cache key"""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    return value
+
+def cached_read(method):
+    """Serve a DatabaseManager read method from the shared query cache"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.cache is None:
+            return method(self, *args, **kwargs)
+        key = (method.__name__, _freeze(args), _freeze(kwargs))
+        generation = self.cache.generation()
+        found, value = self.cache.get(key, generation)
+        if not found:
+            value = method(self, *args, **kwargs)
+            self.cache.put(key, generation, value)
+        # Callers get their own copy so they can never modify a cached result
+        return copy.deepcopy(value)
+    return wrapper
+
+def invalidates_cache(method):
+    """Move the data generation forward after a DatabaseManager write method"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            if self.cache is not None:
+                self.cache.bump()
+    return wrapper
+
+# SQLITE_BUSY still reaches callers after busy_timeout, and at once when a deferred
+# transaction that has read cannot upgrade to a write lock because another
+# connection committed in between
+BUSY_RETRIES = 5
+BUSY_RETRY_DELAY = 0.05
+
+def _is_busy(error: sqlite3.OperationalError) -> bool:
+    message = str(error)
+    return 'database is locked' in message or 'database is busy' in message
+
+def _retry_busy(call, can_retry=lambda: True):
+    """Call `call`, re-running it while SQLite reports the database busy
+    
+    Waits grow exponentially with full jitter so writers that collided do not
+    collide again.
+    """
+    for attempt in itertools.count():
+        try:
+            return call()
+        except sqlite3.OperationalError as e:
+            if attempt + 1 >= BUSY_RETRIES or not _is_busy(e) or not can_retry():
+                raise
+        time.sleep(random.uniform(0, BUSY_RETRY_DELAY * 2 ** attempt))
+
+def retry_on_busy(method):
+    """Re-run a DatabaseManager write method when SQLite reports the database busy
+    
+    Only an outermost call retries; inside another checkout the error goes to
+    the transaction that owns the connection.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        return _retry_busy(functools.partial(method, self, *args, **kwargs), lambda: not self.pool.held)
+    return wrapper
+
+def _pipelined(method, group: bool):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        future = self._queue_write(functools.partial(method, self, *args, **kwargs), group)
+        if future is None:
+            return method(self, *args, **kwargs)
+        return future.result()
+    # Read by DatabaseManager.submit, and copied onto the outer decorators' wrappers
+    wrapper.write_group = group
+    return wrapper
+
+def queued_write(method):
+    """Apply a DatabaseManager write method on the write pipeline's thread when it is running
+    
+    The method must do all its work in one transaction: it shares a group commit
+    with other writes. The caller still waits for its own result.
+    """
+    return _pipelined(method, group=True)
+
+def exclusive_write(method):
+    """Like queued_write, for methods that commit in batches of their own; they run alone between groups"""
+    return _pipelined(method, group=False)
+
+def _result_rows(result) -> int:
+    """Number of rows a DatabaseManager method returned"""
+    if isinstance(result, pd.DataFrame):
+        return len(result)
+    if isinstance(result, tuple) and result and isinstance(result[0], pd.DataFrame):
+        return len(result[0])
+    if isinstance(result, dict) and 'created' in result:
+        return len(result['created'])
+    if isinstance(result, list):
+        return len(result)
+    return 0 if result is None else 1
+
+class QueryInstrumentation:
+    """Optional timing of DatabaseManager methods with the SQL they ran
+    
+    Each call is recorded in an in-process ring buffer with its wall time, rows
+    returned and the statements SQLite executed (captured through the connection
+    trace callback). Calls slower than slow_query_ms also keep the EXPLAIN QUERY
+    PLAN of their statements. When disabled the only cost is one flag check per
+    method call.
+    """
+    
+    # Statements kept per call; executemany can trace thousands
+    MAX_STATEMENTS = 20
+    
+    def __init__(self, capacity: int = 2000, slow_query_ms: float = 100.0):
+        self.enabled = False
+        self.slow_query_ms = slow_query_ms
+        self._records = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+    
+    def trace(self, statement: str):
+        """sqlite3 trace callback: attach a statement to every call in progress on this thread"""
+        for statements in getattr(self._local, 'stack', ()):
+            statements[1] += 1
+            if len(statements[0]) < self.MAX_STATEMENTS and statement not in statements[0]:
+                statements[0].append(statement)
+    
+    @contextmanager
+    def suppressed(self):
+        """Stop capturing statements on this thread, e.g. while explaining them"""
+        stack = getattr(self._local, 'stack', [])
+        self._local.stack = []
+        try:
+            yield
+        finally:
+            self._local.stack = stack
+    
+    def start_call(self) -> list:
+        if not hasattr(self._local, 'stack'):
+            self._local.stack = []
+        statements = [[], 0]
+        self._local.stack.append(statements)
+        return statements
+    
+    def finish_call(self, statements: list, method: str, duration_ms: float, rows: int, plans: Optional[Dict]):
+        self._local.stack.remove(statements)
+        with self._lock:
+            self._records.append({
+                'method': method,
+                'started_at': time.time() - duration_ms / 1000,
+                'duration_ms': duration_ms,
+                'rows': rows,
+                'statement_count': statements[1],
+                'statements': statements[0],
+                'plans': plans,
+            })
+    
+    def records(self) -> List[Dict]:
+        with self._lock:
+            return list(self._records)
+    
+    def reset(self):
+        with self._lock:
+            self._records.clear()
+
+def instrumented(method):
+    """Record timing, rows and SQL for a DatabaseManager method when instrumentation is on"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        instrumentation = self.instrumentation
+        if not instrumentation.enabled:
+            return method(self, *args, **kwargs)
+        
+        statements = instrumentation.start_call()
+        start = time.perf_counter()
+        result = None
+        try:
+            result = method(self, *args, **kwargs)
+            return result
+        finally:
+            duration_ms = (time.perf_counter() - start) * 1000
+            plans = None
+            if duration_ms >= instrumentation.slow_query_ms and statements[0]:
+                with instrumentation.suppressed():
+                    plans = {sql: self._explain_query_plan(sql) for sql in statements[0]}
+            instrumentation.finish_call(statements, method.__name__, duration_ms, _result_rows(result), plans)
+    return wrapper
+
+class TierGraph:
+    """Immutable snapshot of the tier hierarchy for building forms without further queries
+    
+    Built once per data generation by DatabaseManager.get_tier_graph and shared by
+    every session, so nothing on it may be modified. Tier ids are listed in
+    (level, name) order, matching get_tiers.
+    """
+    
+    def __init__(self, rows: List[Tuple], generation=None):
+        self.generation = generation
+        names = {row[0]: row[1] for row in rows}
+        self.order = tuple(row[0] for row in rows)
+        self.by_id = MappingProxyType({
+            row[0]: MappingProxyType({'id': row[0], 'name': row[1], 'level': row[2], 'parent_tier_id': row[3],
+                                      'description': row[4], 'parent_tier_name': names.get(row[3])})
+            for row in rows
+        })
+        self.id_by_name = MappingProxyType({row[1]: row[0] for row in rows})
+        self.position = MappingProxyType({tier_id: index for index, tier_id in enumerate(self.order)})
+        self._levels = tuple(row[2] for row in rows)
+        
+        children = {tier_id: [] for tier_id in self.order}
+        roots = []
+        for tier_id, _, _, parent_tier_id, _ in rows:
+            if parent_tier_id in children:
+                children[parent_tier_id].append(tier_id)
+            else:
+                roots.append(tier_id)
+        self.children = MappingProxyType({tier_id: tuple(ids) for tier_id, ids in children.items()})
+        self.roots = tuple(roots)
+        
+        # Each tier's subtree (itself included); tiers in a cycle left by older
+        # versions are unreachable from a root and only get themselves
+        subtrees = {}
+        stack = [(root, False) for root in self.roots]
+        while stack:
+            tier_id, expanded = stack.pop()
+            if expanded:
+                subtrees[tier_id] = frozenset().union((tier_id,), *(subtrees[child_id]
+                                                                      for child_id in self.children[tier_id]))
+            else:
+                stack.append((tier_id, True))
+                stack.extend((child_id, False) for child_id in self.children[tier_id])
+        self.subtree = MappingProxyType({tier_id: subtrees.get(tier_id, frozenset((tier_id,)))
+                                         for tier_id in self.order})
+    
+    def __len__(self) -> int:
+        return len(self.order)
+    
+    def __contains__(self, tier_id) -> bool:
+        return tier_id in self.by_id
+    
+    def name(self, tier_id: Optional[str]) -> str:
+        """Display name for a tier id, usable as a selectbox format_func"""
+        return self.by_id[tier_id]['name'] if tier_id in self.by_id else "None"
+    
+    def parent_options(self, tier_id: Optional[str] = None) -> Tuple:
+        """Tier ids that may become the parent of tier_id (any tier for a new tier)"""
+        if tier_id is None:
+            return self.order
+        excluded = self.subtree.get(tier_id, frozenset((tier_id,)))
+        return tuple(candidate for candidate in self.order if candidate not in excluded)
+    
+    def higher_tiers(self, tier_id: str) -> Tuple:
+        """Tier ids at a higher level than tier_id, the escalation targets"""
+        return self.order[bisect.bisect_right(self._levels, self.by_id[tier_id]['level']):]
+
+class SLAScanner:
+    """Background thread that periodically runs DatabaseManager.scan_sla_breaches
+    
+    Started once per process by DatabaseManager.start_sla_scanner. The thread only
+    holds a pooled connection while a scan batch runs, so UI reruns never wait on it.
+    """
+    
+    def __init__(self, db, interval_seconds: float = 60.0, batch_size: int = 500):
+        self.db = db
+        self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="sla-scanner", daemon=True)
+        self.runs = 0
+        self.last_result = None
+        self.last_error = None
+        self.last_run_at = None
+    
+    def start(self):
+        self._thread.start()
+    
+    def stop(self, timeout: float = 5.0):
+        self._stop.set()
+        self._wake.set()
+        self._thread.join(timeout)
+    
+    def run_now(self):
+        """Start the next scan without waiting for the interval"""
+        self._wake.set()
+    
+    def is_alive(self) -> bool:
+        return self._thread.is_alive()
+    
+    def status(self) -> Dict:
+        """Last run time, result and error for display in the Admin Panel"""
+        with self._lock:
+            return {
+                'running': self._thread.is_alive(),
+                'interval_seconds': self.interval_seconds,
+                'runs': self.runs,
+                'last_run_at': self.last_run_at,
+                'last_result': dict(self.last_result) if self.last_result else None,
+                'last_error': self.last_error,
+            }
+    
+    def _run(self):
+        while not self._stop.is_set():
+            run_at = time.time()
+            try:
+                result, error = self.db.scan_sla_breaches(self.batch_size), None
+            except Exception as e:
+                # Keep the thread alive; the error is shown in the Admin Panel
+                result, error = None, f"{type(e).__name__}: {e}"
+            with self._lock:
+                self.runs += 1
+                self.last_run_at = run_at
+                self.last_result = result or self.last_result
+                self.last_error = error
+            self._wake.wait(self.interval_seconds)
+            self._wake.clear()
+
+class WritePipeline:
+    """Dedicated writer thread that applies DatabaseManager writes in group commits
+    
+    Started by DatabaseManager.start_write_pipeline. Writes queued while a group
+    is being applied make up the next one: up to max_batch writes, collected for
+    at most max_delay_ms. A group runs in one BEGIN IMMEDIATE transaction with a
+    savepoint per write, so a write that fails is rolled back on its own, and
+    every write in the group shares one acquisition of the write lock and one
+    commit. Futures are resolved after the commit, so no caller sees a result
+    that could still be rolled back. Exclusive writes, which commit in batches of
+    their own, run alone between groups.
+    """
+    
+    _STOP = object()
+    
+    def __init__(self, db, max_batch: int = 64, max_delay_ms: float = 0.5):
+        self.db = db
+        self.max_batch = max_batch
+        self.max_delay_ms = max_delay_ms
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="write-pipeline", daemon=True)
+        self.groups = 0
+        self.grouped_writes = 0
+        self.exclusive_writes = 0
+        self.largest_group = 0
+        self.failed_groups = 0
+        self.last_error = None
+    
+    def start(self):
+        self._thread.start()
+    
+    def stop(self, timeout: float = 30.0):
+        """Apply the writes already queued, then stop the thread"""
+        with self._lock:
+            if not self._stopping:
+                self._stopping = True
+                self._queue.put(self._STOP)
+        self._thread.join(timeout)
+    
+    def is_alive(self) -> bool:
+        return self._thread.is_alive()
+    
+    def is_writer_thread(self) -> bool:
+        return threading.current_thread() is self._thread
+    
+    def submit(self, call, group: bool = True) -> Optional[Future]:
+        """Queue a call and return a Future for its result, or None once the pipeline is stopping"""
+        future = Future()
+        with self._lock:
+            if self._stopping:
+                return None
+            self._queue.put((call, group, future))
+        return future
+    
+    def status(self) -> Dict:
+        """Group commit counters for display in the Admin Panel"""
+        with self._lock:
+            return {
+                'running': self._thread.is_alive(),
+                'max_batch': self.max_batch,
+                'max_delay_ms': self.max_delay_ms,
+                'queued': self._queue.qsize(),
+                'groups': self.groups,
+                'grouped_writes': self.grouped_writes,
+                'average_group': self.grouped_writes / self.groups if self.groups else 0.0,
+                'largest_group': self.largest_group,
+                'exclusive_writes': self.exclusive_writes,
+                'failed_groups': self.failed_groups,
+                'last_error': self.last_error,
+            }
+    
+    def _run(self):
+        carried = None
+        last_group = 0
+        while True:
+            item = carried if carried is not None else self._queue.get()
+            carried = None
+            if item is self._STOP:
+                break
+            if not item[1]:
+                self._run_exclusive(item)
+                continue
+            
+            group = [item]
+            # Waiting for company only pays off when writes are already arriving together
+            delay = self.max_delay_ms / 1000 if last_group > 1 else 0
+            deadline = time.monotonic() + delay
+            while len(group) < self.max_batch:
+                try:
+                    item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if item is self._STOP or not item[1]:
+                    # Applied after this group, in the order it was queued
+                    carried = item
+                    break
+                group.append(item)
+            self._run_group(group)
+            last_group = len(group)
+    
+    def _run_exclusive(self, item):
+        call, _, future = item
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result = call()
+        except Exception as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+        with self._lock:
+            self.exclusive_writes += 1
+    
+    def _apply_group(self, group) -> List[Tuple]:
+        """Run every call of a group in one transaction and return (result, error) for each"""
+        outcomes = []
+        with self.db.pool.write_connection() as conn:
+            for call, _, _ in group:
+                conn.execute('SAVEPOINT queued_write')
+                try:
+                    outcomes.append((call(), None))
+                except Exception as e:
+                    conn.execute('ROLLBACK TO queued_write')
+                    outcomes.append((None, e))
+                conn.execute('RELEASE queued_write')
+        return outcomes
+    
+    def _run_group(self, group):
+        group = [item for item in group if item[2].set_running_or_notify_cancel()]
+        if not group:
+            return
+        try:
+            # A busy error rolls the whole group back, so it can run again from the start
+            outcomes = _retry_busy(lambda: self._apply_group(group))
+        except Exception as e:
+            # Nothing in the group was committed
+            with self._lock:
+                self.failed_groups += 1
+                self.last_error = f"{type(e).__name__}: {e}"
+            for _, _, future in group:
+                future.set_exception(e)
+            return
+        
+        with self._lock:
+            self.groups += 1
+            self.grouped_writes += len(group)
+            self.largest_group = max(self.largest_group, len(group))
+        for (_, _, future), (result, error) in zip(group, outcomes):
+            if error is None:
+                future.set_result(result)
+            else:
+                future.set_exception(error)
+
+class TransitionResult:
+    """Outcome of an escalation state transition, truthy when it was applied
+    
+    When it was not, `reason` is 'not_found', 'conflict' (the escalation changed
+    since the caller read `expected_version`) or 'invalid_status' (its current
+    status does not allow the transition). `status` and `version` are the
+    escalation's current ones, after the transition when it was applied.
+    """
+    
+    __slots__ = ('applied', 'reason', 'status', 'version')
+    
+    def __init__(self, applied: bool, reason: Optional[str] = None, status: Optional[str] = None,
+                 version: Optional[int] = None):
+        self.applied = applied
+        self.reason = reason
+        self.status = status
+        self.version = version
+    
+    def __bool__(self) -> bool:
+        return self.applied
+    
+    def __repr__(self) -> str:
+        return (f"TransitionResult(applied={self.applied}, reason={self.reason!r}, "
+                f"status={self.status!r}, version={self.version})")
+
 class DatabaseManager:
-    def __init__(self, db_path: str = "accountability_dashboard.db"):
+    def __init__(self, db_path: str = "accountability_dashboard.db", pool_size: int = 8,
+                 cache_size: int = 256, instrument: bool = False, slow_query_ms: float = 100.0,
+                 initialize: bool = True):
         self.db_path = db_path
-        self.init_database()
+        self.pool = ConnectionPool(db_path, size=pool_size)
+        self.instrumentation = QueryInstrumentation(slow_query_ms=slow_query_ms)
+        # Optional single writer thread; writes run on the caller's thread until it is started
+        self.write_pipeline = None
+        self._write_pipeline_lock = threading.Lock()
+        # initialize=False leaves the schema alone, e.g. to inspect or dry-run migrations
+        if initialize:
+            self.init_database()
+        # Shared read cache; cache_size=0 turns caching off
+        self.cache = QueryCache(db_path, max_entries=cache_size) if cache_size else None
+        self._tier_graph = None
+        self._sla_scanner = None
+        self._sla_scanner_lock = threading.Lock()
+        self.set_instrumentation(instrument)
     
     def get_connection(self):
-        return sqlite3.connect(self.db_path)
+        """Check out a pooled connection (use as a context manager)"""
+        return self.pool.connection()
+    
+    def close(self):
+        """Stop the SLA scanner and the write pipeline and release all pooled connections"""
+        if self._sla_scanner is not None:
+            self._sla_scanner.stop()
+            self._sla_scanner = None
+        self.stop_write_pipeline()
+        self.pool.close()
+        if self.cache is not None:
+            self.cache.close()
+    
+    def get_cache_stats(self) -> Optional[Dict]:
+        """Get read cache statistics, or None when caching is off"""
+        return self.cache.stats() if self.cache is not None else None
+    
+    def clear_cache(self):
+        """Drop all cached read results"""
+        if self.cache is not None:
+            self.cache.clear()
+    
+    # Write pipeline methods
+    def start_write_pipeline(self, max_batch: int = 64, max_delay_ms: float = 0.5) -> WritePipeline:
+        """Route writes from every session through one writer thread with group commits
+        
+        Started once per DatabaseManager; later calls return the running pipeline.
+        """
+        with self._write_pipeline_lock:
+            if self.write_pipeline is None or not self.write_pipeline.is_alive():
+                pipeline = WritePipeline(self, max_batch, max_delay_ms)
+                pipeline.start()
+                self.write_pipeline = pipeline
+            return self.write_pipeline
+    
+    def stop_write_pipeline(self):
+        """Apply the writes already queued, then go back to writing on each caller's thread"""
+        with self._write_pipeline_lock:
+            pipeline, self.write_pipeline = self.write_pipeline, None
+        if pipeline is not None:
+            pipeline.stop()
+    
+    def get_write_pipeline_status(self) -> Optional[Dict]:
+        """Group commit counters, or None when the write pipeline is not running"""
+        pipeline = self.write_pipeline
+        return pipeline.status() if pipeline is not None else None
+    
+    def _queue_write(self, call, group: bool) -> Optional[Future]:
+        """Queue a write on the pipeline, or return None when it has to run on the caller's thread"""
+        pipeline = self.write_pipeline
+        # Nested writes run inline: the caller may hold the write lock the writer thread needs
+        if pipeline is None or pipeline.is_writer_thread() or self.pool.held:
+            return None
+        return pipeline.submit(call, group)
+    
+    def submit(self, method: str, *args, **kwargs) -> Future:
+        """Start a write method by name and return a Future for its result
+        
+        For example `db.submit('create_escalation', title, ...)` returns at once
+        and `.result()` gives the new id once its group has committed. Without
+        the write pipeline the method runs before this returns.
+        """
+        group = getattr(getattr(type(self), method, None), 'write_group', None)
+        if group is None:
+            raise ValueError(f"Not a write method: {method}")
+        call = functools.partial(getattr(self, method), *args, **kwargs)
+        future = self._queue_write(call, group)
+        if future is None:
+            future = Future()
+            try:
+                future.set_result(call())
+            except Exception as e:
+                future.set_exception(e)
+        return future
+    
+    # Query instrumentation methods
+    def set_instrumentation(self, enabled: bool, slow_query_ms: Optional[float] = None):
+        """Turn method timing and SQL capture on or off for every session"""
+        if slow_query_ms is not None:
+            self.instrumentation.slow_query_ms = slow_query_ms
+        self.instrumentation.enabled = enabled
+        self.pool.trace_callback = self.instrumentation.trace if enabled else None
+    
+    def reset_instrumentation(self):
+        """Clear recorded calls"""
+        self.instrumentation.reset()
+    
+    def _explain_query_plan(self, sql: str, params: Tuple = ()) -> List[str]:
+        """EXPLAIN QUERY PLAN for one statement, or an empty list if it cannot be explained"""
+        if not sql.lstrip().upper().startswith(('SELECT', 'WITH', 'INSERT', 'UPDATE', 'DELETE')):
+            return []
+        try:
+            with self.get_connection() as conn:
+                return [row[3] for row in conn.execute('EXPLAIN QUERY PLAN ' + sql, params)]
+        except sqlite3.Error:
+            return []
+    
+    def get_query_stats(self) -> pd.DataFrame:
+        """Per-method call count, total/p50/p95/max time and rows from the instrumentation buffer"""
+        records = pd.DataFrame(self.instrumentation.records())
+        if records.empty:
+            return pd.DataFrame(columns=['method', 'calls', 'total_ms', 'p50_ms', 'p95_ms', 'max_ms',
+                                         'avg_rows', 'sample_sql'])
+        grouped = records.groupby('method')
+        stats = pd.DataFrame({
+            'calls': grouped.size(),
+            'total_ms': grouped['duration_ms'].sum(),
+            'p50_ms': grouped['duration_ms'].median(),
+            'p95_ms': grouped['duration_ms'].quantile(0.95),
+            'max_ms': grouped['duration_ms'].max(),
+            'avg_rows': grouped['rows'].mean(),
+            'sample_sql': grouped['statements'].last().map(lambda statements: '; '.join(statements)),
+        }).reset_index()
+        return stats.sort_values('total_ms', ascending=False).reset_index(drop=True)
+    
+    def get_slow_queries(self, limit: int = 20) -> List[Dict]:
+        """Most recent calls above the slow threshold, with their query plans"""
+        slow = [record for record in self.instrumentation.records() if record['plans'] is not None]
+        return slow[-limit:][::-1]
     
     def init_database(self):
-        """Initialize the database with all required tables"""
+        """Create missing tables, apply pending migrations and create indexes"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
             
@@ -66,52 +970,569 @@ class DatabaseManager:
                 )
             ''')
             
-            # Create escalations table
+            # Create escalations with their audit trail, and the archive copies of both
+            self._create_escalation_tables(cursor)
+            
+            # Create per-tier escalation counters, maintained by every escalation write
             cursor.execute('''
-                CREATE TABLE IF NOT EXISTS escalations (
-                    id TEXT PRIMARY KEY,
-                    title TEXT NOT NULL,
-                    description TEXT,
-                    urgency TEXT CHECK (urgency IN ('Low', 'Medium', 'High', 'Critical')) DEFAULT 'Medium',
-                    status TEXT CHECK (status IN ('Open', 'In Progress', 'Pending Feedback', 'Resolved', 'Closed')) DEFAULT 'Open',
-                    created_by TEXT NOT NULL,
-                    assigned_to TEXT,
-                    source_tier_id TEXT NOT NULL,
-                    target_tier_id TEXT,
-                    current_tier_id TEXT NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    escalated_at TIMESTAMP,
-                    resolved_at TIMESTAMP,
-                    closed_at TIMESTAMP,
-                    feedback TEXT,
-                    FOREIGN KEY (created_by) REFERENCES people (id),
-                    FOREIGN KEY (assigned_to) REFERENCES people (id),
-                    FOREIGN KEY (source_tier_id) REFERENCES tiers (id),
-                    FOREIGN KEY (target_tier_id) REFERENCES tiers (id),
-                    FOREIGN KEY (current_tier_id) REFERENCES tiers (id)
-                )
+                CREATE TABLE IF NOT EXISTS escalation_counters (
+                    tier_id TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    urgency TEXT NOT NULL,
+                    escalation_count INTEGER NOT NULL DEFAULT 0,
+                    escalated_count INTEGER NOT NULL DEFAULT 0,
+                    resolution_days_sum REAL NOT NULL DEFAULT 0,
+                    PRIMARY KEY (tier_id, status, urgency)
+                ) WITHOUT ROWID
             ''')
             
-            # Create escalation history table for audit trail
+            # Create archive counters for old Closed escalations
             cursor.execute('''
-                CREATE TABLE IF NOT EXISTS escalation_history (
-                    id TEXT PRIMARY KEY,
+                CREATE TABLE IF NOT EXISTS escalation_archive_counters (
+                    tier_id TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    urgency TEXT NOT NULL,
+                    escalation_count INTEGER NOT NULL DEFAULT 0,
+                    escalated_count INTEGER NOT NULL DEFAULT 0,
+                    resolution_days_sum REAL NOT NULL DEFAULT 0,
+                    PRIMARY KEY (tier_id, status, urgency)
+                ) WITHOUT ROWID
+            ''')
+            
+            # Create SLA thresholds per urgency and the breaches found by scan_sla_breaches
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS sla_rules (
+                    urgency TEXT PRIMARY KEY CHECK (urgency IN ('Low', 'Medium', 'High', 'Critical')),
+                    max_open_hours REAL NOT NULL,
+                    auto_escalate INTEGER NOT NULL DEFAULT 0
+                )
+            ''')
+            cursor.executemany('INSERT OR IGNORE INTO sla_rules (urgency, max_open_hours) VALUES (?, ?)',
+                               self.DEFAULT_SLA_RULES)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS sla_breaches (
+                    id INTEGER PRIMARY KEY,
                     escalation_id TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    urgency TEXT NOT NULL,
+                    tier_id TEXT NOT NULL,
+                    hours_open REAL NOT NULL,
                     action TEXT NOT NULL,
-                    performed_by TEXT NOT NULL,
-                    from_status TEXT,
-                    to_status TEXT,
-                    notes TEXT,
-                    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (escalation_id) REFERENCES escalations (id),
-                    FOREIGN KEY (performed_by) REFERENCES people (id)
+                    detected_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    UNIQUE (escalation_id, status, tier_id)
+                )
+            ''')
+            
+            # Create daily per-tier snapshots for trend charts, written by build_daily_snapshots
+            snapshot_counts = ',\n'.join(f"{column} INTEGER NOT NULL DEFAULT 0" for column in
+                                         self.SNAPSHOT_STATE_COLUMNS + self.SNAPSHOT_FLOW_COLUMNS)
+            cursor.execute(f'''
+                CREATE TABLE IF NOT EXISTS daily_tier_snapshots (
+                    snapshot_date TEXT NOT NULL,
+                    tier_id TEXT NOT NULL,
+                    {snapshot_counts},
+                    resolution_p50_days REAL,
+                    resolution_p90_days REAL,
+                    PRIMARY KEY (snapshot_date, tier_id)
+                ) WITHOUT ROWID
+            ''')
+            
+            # Create time-in-status stays derived from escalation history by refresh_status_durations
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS escalation_status_durations (
+                    escalation_id TEXT NOT NULL,
+                    seq INTEGER NOT NULL,
+                    status TEXT NOT NULL,
+                    tier_id TEXT NOT NULL,
+                    urgency TEXT NOT NULL,
+                    started_at TIMESTAMP NOT NULL,
+                    ended_at TIMESTAMP,
+                    ended_by TEXT,
+                    next_tier_id TEXT,
+                    duration_hours REAL,
+                    PRIMARY KEY (escalation_id, seq)
+                ) WITHOUT ROWID
+            ''')
+            
+            # Create tier closure table: one row per (ancestor, descendant) pair, including (tier, tier)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS tier_closure (
+                    ancestor_id TEXT NOT NULL,
+                    descendant_id TEXT NOT NULL,
+                    depth INTEGER NOT NULL,
+                    PRIMARY KEY (ancestor_id, descendant_id)
+                ) WITHOUT ROWID
+            ''')
+            
+            # Bring existing databases up to the current schema before anything reads them
+            conn.commit()
+            self._run_migrations(conn)
+            self._create_epoch_triggers(cursor)
+            
+            # Existing databases get their counters and closure built on first start
+            cursor.execute('SELECT EXISTS (SELECT 1 FROM escalation_counters)')
+            if not cursor.fetchone()[0]:
+                self._rebuild_escalation_counters(cursor)
+            cursor.execute('SELECT EXISTS (SELECT 1 FROM tier_closure)')
+            if not cursor.fetchone()[0]:
+                self._rebuild_tier_closure(cursor)
+            
+            # Create full-text search index: one document per escalation, keyed by its rowid,
+            # with history notes appended. Triggers keep it in step with every write path.
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'escalation_search'")
+            search_index_exists = cursor.fetchone() is not None
+            cursor.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS escalation_search USING fts5 (
+                    title, description, feedback, notes, tier_path,
+                    tokenize = 'porter unicode61'
+                )
+            ''')
+            self._create_search_triggers(cursor)
+            if not search_index_exists:
+                self._rebuild_search_index(cursor)
+            
+            self._create_indexes(cursor)
+            conn.commit()
+    
+    def _create_escalation_tables(self, cursor):
+        """Create the escalation, history and archive tables in their current form
+        
+        Escalations are referenced internally by an integer `key` (their rowid, so
+        also the search index's document id) and publicly by their UUID `id`.
+        History rows have integer ids and point at their escalation's key, which
+        keeps the history table and its index a fraction of the size of UUID text.
+        Keys are never reused (AUTOINCREMENT), since archived rows keep theirs.
+        """
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS escalations (
+                key INTEGER PRIMARY KEY AUTOINCREMENT,
+                id TEXT UNIQUE NOT NULL,
+                title TEXT NOT NULL,
+                description TEXT,
+                urgency TEXT CHECK (urgency IN ('Low', 'Medium', 'High', 'Critical')) DEFAULT 'Medium',
+                status TEXT CHECK (status IN ('Open', 'In Progress', 'Pending Feedback', 'Resolved', 'Closed')) DEFAULT 'Open',
+                created_by TEXT NOT NULL,
+                assigned_to TEXT,
+                source_tier_id TEXT NOT NULL,
+                target_tier_id TEXT,
+                current_tier_id TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                escalated_at TIMESTAMP,
+                resolved_at TIMESTAMP,
+                closed_at TIMESTAMP,
+                feedback TEXT,
+                created_at_epoch INTEGER,
+                updated_at_epoch INTEGER,
+                escalated_at_epoch INTEGER,
+                resolved_at_epoch INTEGER,
+                closed_at_epoch INTEGER,
+                version INTEGER NOT NULL DEFAULT 0,
+                FOREIGN KEY (created_by) REFERENCES people (id),
+                FOREIGN KEY (assigned_to) REFERENCES people (id),
+                FOREIGN KEY (source_tier_id) REFERENCES tiers (id),
+                FOREIGN KEY (target_tier_id) REFERENCES tiers (id),
+                FOREIGN KEY (current_tier_id) REFERENCES tiers (id)
+            )
+        ''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS escalation_history (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                escalation_key INTEGER NOT NULL,
+                action TEXT NOT NULL,
+                performed_by TEXT NOT NULL,
+                from_status TEXT,
+                to_status TEXT,
+                notes TEXT,
+                timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                timestamp_epoch INTEGER,
+                FOREIGN KEY (escalation_key) REFERENCES escalations (key),
+                FOREIGN KEY (performed_by) REFERENCES people (id)
+            )
+        ''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS escalations_archive (
+                key INTEGER UNIQUE NOT NULL,
+                id TEXT PRIMARY KEY,
+                title TEXT NOT NULL,
+                description TEXT,
+                urgency TEXT,
+                status TEXT,
+                created_by TEXT NOT NULL,
+                assigned_to TEXT,
+                source_tier_id TEXT NOT NULL,
+                target_tier_id TEXT,
+                current_tier_id TEXT NOT NULL,
+                created_at TIMESTAMP,
+                updated_at TIMESTAMP,
+                escalated_at TIMESTAMP,
+                resolved_at TIMESTAMP,
+                closed_at TIMESTAMP,
+                feedback TEXT,
+                archived_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                created_at_epoch INTEGER,
+                updated_at_epoch INTEGER,
+                escalated_at_epoch INTEGER,
+                resolved_at_epoch INTEGER,
+                closed_at_epoch INTEGER,
+                version INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS escalation_history_archive (
+                id INTEGER PRIMARY KEY,
+                escalation_key INTEGER NOT NULL,
+                action TEXT NOT NULL,
+                performed_by TEXT NOT NULL,
+                from_status TEXT,
+                to_status TEXT,
+                notes TEXT,
+                timestamp TIMESTAMP,
+                timestamp_epoch INTEGER
+            )
+        ''')
+    
+    # Secondary indexes matching the read paths below. Every statement is
+    # idempotent so existing databases pick up new indexes on the next start.
+    INDEXES = (
+        # get_tiers / get_tier_hierarchy order, delete_tier child check
+        'CREATE INDEX IF NOT EXISTS idx_tiers_level_name ON tiers (level, name)',
+        'CREATE INDEX IF NOT EXISTS idx_tiers_parent ON tiers (parent_tier_id)',
+        # get_tier_ancestors
+        'CREATE INDEX IF NOT EXISTS idx_tier_closure_descendant ON tier_closure (descendant_id, depth)',
+        # get_people by tier (covers the ORDER BY), delete_tier headcount
+        'CREATE INDEX IF NOT EXISTS idx_people_tier_active_name ON people (tier_id, is_active, name)',
+        # get_escalations: tier listing with and without a status filter
+        'CREATE INDEX IF NOT EXISTS idx_escalations_current_tier_created_epoch ON escalations (current_tier_id, created_at_epoch)',
+        'CREATE INDEX IF NOT EXISTS idx_escalations_current_tier_status_created_epoch ON escalations (current_tier_id, status, created_at_epoch)',
+        # get_escalations: personal listing (created_by OR assigned_to)
+        'CREATE INDEX IF NOT EXISTS idx_escalations_created_by_created_epoch ON escalations (created_by, created_at_epoch)',
+        'CREATE INDEX IF NOT EXISTS idx_escalations_assigned_to_created_epoch ON escalations (assigned_to, created_at_epoch)',
+        # get_escalations: unfiltered and status-only listings
+        'CREATE INDEX IF NOT EXISTS idx_escalations_created_epoch ON escalations (created_at_epoch)',
+        'CREATE INDEX IF NOT EXISTS idx_escalations_status_created_epoch ON escalations (status, created_at_epoch)',
+        # delete_tier reference checks
+        'CREATE INDEX IF NOT EXISTS idx_escalations_source_tier ON escalations (source_tier_id)',
+        'CREATE INDEX IF NOT EXISTS idx_escalations_target_tier ON escalations (target_tier_id)',
+        # get_escalation_history / delete_escalation
+        'CREATE INDEX IF NOT EXISTS idx_history_escalation_timestamp ON escalation_history (escalation_key, timestamp)',
+        # scan_sla_breaches: one range per (status, urgency) rule
+        'CREATE INDEX IF NOT EXISTS idx_escalations_status_urgency_created_epoch ON escalations (status, urgency, created_at_epoch)',
+        # archive_closed_escalations candidates
+        'CREATE INDEX IF NOT EXISTS idx_escalations_status_closed_epoch ON escalations (status, closed_at_epoch)',
+        # Archived listings, history and delete_tier reference checks
+        'CREATE INDEX IF NOT EXISTS idx_escalations_archive_current_tier_created_epoch ON escalations_archive (current_tier_id, created_at_epoch)',
+        'CREATE INDEX IF NOT EXISTS idx_escalations_archive_created_epoch ON escalations_archive (created_at_epoch)',
+        'CREATE INDEX IF NOT EXISTS idx_escalations_archive_source_tier ON escalations_archive (source_tier_id)',
+        'CREATE INDEX IF NOT EXISTS idx_escalations_archive_target_tier ON escalations_archive (target_tier_id)',
+        'CREATE INDEX IF NOT EXISTS idx_history_archive_escalation_timestamp ON escalation_history_archive (escalation_key, timestamp)',
+        # get_archive_summary: oldest and newest closing dates without reading the archive
+        'CREATE INDEX IF NOT EXISTS idx_escalations_archive_closed ON escalations_archive (closed_at)',
+        # get_time_in_status for one tier or subtree, covering the aggregate
+        'CREATE INDEX IF NOT EXISTS idx_status_durations_tier_status ON escalation_status_durations (tier_id, status, duration_hours)',
+        # snapshot_daily: escalations with recent history
+        'CREATE INDEX IF NOT EXISTS idx_history_timestamp ON escalation_history (timestamp)',
+        'CREATE INDEX IF NOT EXISTS idx_history_archive_timestamp ON escalation_history_archive (timestamp)',
+    )
+    
+    def _create_indexes(self, cursor):
+        """Create secondary indexes and refresh planner statistics"""
+        for statement in self.INDEXES:
+            cursor.execute(statement)
+        cursor.execute('PRAGMA optimize')
+    
+    # Integer Unix-time copies of the text timestamps, so ages are plain arithmetic and
+    # age filters are integer ranges. Triggers keep them in step with every write path;
+    # the text columns are still written and stay readable.
+    EPOCH_COLUMNS = {
+        'escalations': ('created_at', 'updated_at', 'escalated_at', 'resolved_at', 'closed_at'),
+        'escalations_archive': ('created_at', 'updated_at', 'escalated_at', 'resolved_at', 'closed_at'),
+        'escalation_history': ('timestamp',),
+        'escalation_history_archive': ('timestamp',),
+    }
+    
+    def _epoch_assignments(self, table: str, row: str = '') -> str:
+        """SET clause computing a table's epoch columns from its text columns (`row` is e.g. 'new.')"""
+        return ', '.join(f"{column}_epoch = CAST(strftime('%s', {row}{column}) AS INTEGER)"
+                         for column in self.EPOCH_COLUMNS[table])
+    
+    def _create_epoch_triggers(self, cursor):
+        """Create the triggers filling epoch columns for every table that exists"""
+        for table, columns in self.EPOCH_COLUMNS.items():
+            if not self._table_columns(cursor, table):
+                continue
+            # Rows inserted with their epochs already set (archive moves, generated data) skip the update
+            cursor.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS {table}_epoch_insert AFTER INSERT ON {table}
+                WHEN new.{columns[0]}_epoch IS NULL BEGIN
+                    UPDATE {table} SET {self._epoch_assignments(table, 'new.')} WHERE rowid = new.rowid;
+                END
+            ''')
+            cursor.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS {table}_epoch_update AFTER UPDATE OF {', '.join(columns)} ON {table} BEGIN
+                    UPDATE {table} SET {self._epoch_assignments(table, 'new.')} WHERE rowid = new.rowid;
+                END
+            ''')
+    
+    # Migration methods
+    
+    # Schema changes that CREATE ... IF NOT EXISTS cannot make on an existing database,
+    # applied once each in version order and recorded in schema_version:
+    # (version, description, method making the schema change, method listing its backfills).
+    # A schema method that copies rows returns how many. A backfill is (table, SET clause, WHERE clause matching rows still to fill). Tables
+    # that do not exist yet are skipped, since init_database creates them in their current
+    # form. Never edit or renumber a migration once it has shipped.
+    MIGRATIONS = (
+        (1, "Integer epoch copies of escalation and history timestamps", '_migrate_epoch_columns', '_epoch_backfills'),
+        (2, "Drop created_at indexes replaced by created_at_epoch ones", '_migrate_retired_indexes', None),
+        (3, "Escalation version column for optimistic concurrency", '_migrate_escalation_version', None),
+        (4, "Integer escalation keys and history ids in place of UUID text", '_migrate_integer_keys', None),
+    )
+    
+    # Indexes replaced by created_at_epoch ones in INDEXES, dropped by migration 2
+    RETIRED_INDEXES = (
+        'idx_escalations_current_tier_created',
+        'idx_escalations_current_tier_status_created',
+        'idx_escalations_created_by_created',
+        'idx_escalations_assigned_to_created',
+        'idx_escalations_created',
+        'idx_escalations_status_created',
+        'idx_escalations_status_urgency_created',
+        'idx_escalations_status_closed',
+        'idx_escalations_archive_current_tier_created',
+        'idx_escalations_archive_created',
+    )
+    
+    def _migrate_epoch_columns(self, cursor):
+        """Add epoch columns to existing tables, with the triggers that fill new rows during the backfill"""
+        for table, columns in self.EPOCH_COLUMNS.items():
+            existing = self._table_columns(cursor, table)
+            for column in columns:
+                if existing and f"{column}_epoch" not in existing:
+                    cursor.execute(f'ALTER TABLE {table} ADD COLUMN {column}_epoch INTEGER')
+        self._create_epoch_triggers(cursor)
+    
+    def _epoch_backfills(self) -> List[Tuple[str, str, str]]:
+        return [(table, self._epoch_assignments(table), f"{columns[0]}_epoch IS NULL")
+                for table, columns in self.EPOCH_COLUMNS.items()]
+    
+    def _migrate_retired_indexes(self, cursor):
+        for name in self.RETIRED_INDEXES:
+            cursor.execute(f'DROP INDEX IF EXISTS {name}')
+    
+    def _migrate_escalation_version(self, cursor):
+        """Add the version column; a constant default fills existing rows without a backfill"""
+        for table in ('escalations', 'escalations_archive'):
+            existing = self._table_columns(cursor, table)
+            if existing and 'version' not in existing:
+                cursor.execute(f'ALTER TABLE {table} ADD COLUMN version INTEGER NOT NULL DEFAULT 0')
+    
+    def _migrate_integer_keys(self, cursor) -> int:
+        """Rebuild the escalation and history tables with integer keys, returning the rows copied
+        
+        SQLite cannot change a primary key in place, so the four tables are renamed,
+        recreated and copied in one transaction. Live escalations keep their rowid
+        as key, so the search index stays valid; archived ones and archived history
+        are numbered after the live rows. Triggers and indexes go with the old
+        tables and are recreated by init_database. Archive tables that already
+        have keys (init_database creates them on databases that predate the
+        archive) are left alone.
+        """
+        existing = self._table_columns(cursor, 'escalations')
+        if not existing or 'key' in existing:
+            return 0
+        if not cursor.connection.in_transaction:
+            # DDL would otherwise commit statement by statement
+            cursor.execute('BEGIN')
+        key_columns = {'escalations': 'key', 'escalation_history': 'escalation_key',
+                       'escalations_archive': 'key', 'escalation_history_archive': 'escalation_key'}
+        old_columns = {table: self._table_columns(cursor, table) for table in key_columns}
+        rebuilt = [table for table, key in key_columns.items()
+                   if old_columns[table] and key not in old_columns[table]]
+        for table in rebuilt:
+            cursor.execute("SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = ?", (table,))
+            for (trigger,) in cursor.fetchall():
+                cursor.execute(f'DROP TRIGGER {trigger}')
+            cursor.execute(f'ALTER TABLE {table} RENAME TO {table}_before_keys')
+        self._create_escalation_tables(cursor)
+        
+        def copy(query: str, *params) -> int:
+            cursor.execute(query, params)
+            return cursor.rowcount
+        
+        def next_id(table: str, column: str) -> int:
+            cursor.execute(f'SELECT COALESCE(MAX({column}), 0) FROM {table}')
+            return cursor.fetchone()[0]
+        
+        escalation_columns = ', '.join(old_columns['escalations'])
+        rows = copy(f'''
+            INSERT INTO escalations (key, {escalation_columns})
+            SELECT rowid, {escalation_columns} FROM escalations_before_keys
+        ''')
+        history_columns = [column for column in old_columns['escalation_history']
+                           if column not in ('id', 'escalation_id')]
+        columns, selected = ', '.join(history_columns), ', '.join(f'h.{column}' for column in history_columns)
+        rows += copy(f'''
+            INSERT INTO escalation_history (escalation_key, {columns})
+            SELECT e.key, {selected}
+            FROM escalation_history_before_keys h
+            JOIN escalations e ON e.id = h.escalation_id
+            ORDER BY h.rowid
+        ''')
+        if 'escalations_archive' in rebuilt:
+            archive_columns = ', '.join(old_columns['escalations_archive'])
+            rows += copy(f'''
+                INSERT INTO escalations_archive (key, {archive_columns})
+                SELECT ? + ROW_NUMBER() OVER (ORDER BY rowid), {archive_columns} FROM escalations_archive_before_keys
+            ''', next_id('escalations', 'key'))
+        if 'escalation_history_archive' in rebuilt:
+            rows += copy(f'''
+                INSERT INTO escalation_history_archive (id, escalation_key, {columns})
+                SELECT ? + ROW_NUMBER() OVER (ORDER BY h.rowid), e.key, {selected}
+                FROM escalation_history_archive_before_keys h
+                JOIN escalations_archive e ON e.id = h.escalation_id
+            ''', next_id('escalation_history', 'id'))
+        
+        # New keys and ids continue after the archived ones, which move back on restore
+        for table, archive, column in (('escalations', 'escalations_archive', 'key'),
+                                       ('escalation_history', 'escalation_history_archive', 'id')):
+            cursor.execute('DELETE FROM sqlite_sequence WHERE name = ?', (table,))
+            cursor.execute('INSERT INTO sqlite_sequence (name, seq) VALUES (?, ?)',
+                           (table, max(next_id(table, column), next_id(archive, column))))
+        for table in reversed(rebuilt):
+            cursor.execute(f'DROP TABLE {table}_before_keys')
+        return rows
+    
+    def _applied_migrations(self, cursor) -> Dict[int, Dict]:
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'schema_version'")
+        if cursor.fetchone() is None:
+            return {}
+        cursor.execute('SELECT version, description, applied_at, rows_touched, duration_ms FROM schema_version')
+        return {row[0]: dict(zip(('version', 'description', 'applied_at', 'rows_touched', 'duration_ms'), row))
+                for row in cursor.fetchall()}
+    
+    def _run_backfill(self, conn, table: str, assignments: str, pending: str, batch_size: int) -> int:
+        """Apply a backfill one rowid range at a time, committing after each
+        
+        Short transactions let other sessions keep writing while a large table is
+        backfilled. Rows added meanwhile are filled by triggers, so the rowid range
+        is fixed at the start. Returns the number of rows updated.
+        """
+        cursor = conn.cursor()
+        cursor.execute(f'SELECT MIN(rowid), MAX(rowid) FROM {table}')
+        low, high = cursor.fetchone()
+        updated = 0
+        if low is None:
+            return updated
+        for start in range(low, high + 1, batch_size):
+            cursor.execute(f'''
+                UPDATE {table} SET {assignments}
+                WHERE rowid BETWEEN ? AND ? AND {pending}
+            ''', (start, start + batch_size - 1))
+            updated += cursor.rowcount
+            conn.commit()
+        return updated
+    
+    def _estimate_migration(self, conn, migrate: str, backfills: List[Tuple[str, str, str]],
+                            batch_size: int) -> Tuple[int, float]:
+        """Rows a migration would touch and the estimated seconds, leaving the database unchanged
+        
+        The schema change and one batch of each backfill run inside a transaction
+        that is rolled back. The schema change is timed in full (it may copy whole
+        tables); each batch's time is scaled to every pending row.
+        """
+        cursor = conn.cursor()
+        conn.commit()
+        cursor.execute('BEGIN')
+        rows, seconds = 0, 0.0
+        try:
+            start = time.perf_counter()
+            rows += getattr(self, migrate)(cursor) or 0
+            seconds += time.perf_counter() - start
+            for table, assignments, pending in backfills:
+                if not self._table_columns(cursor, table):
+                    continue
+                cursor.execute(f'SELECT COUNT(*) FROM {table} WHERE {pending}')
+                table_rows = cursor.fetchone()[0]
+                start = time.perf_counter()
+                cursor.execute(f'''
+                    UPDATE {table} SET {assignments}
+                    WHERE rowid IN (SELECT rowid FROM {table} WHERE {pending} LIMIT ?)
+                ''', (batch_size,))
+                if cursor.rowcount > 0:
+                    seconds += (time.perf_counter() - start) * table_rows / cursor.rowcount
+                rows += table_rows
+        finally:
+            conn.rollback()
+        return rows, seconds
+    
+    def _run_migrations(self, conn, dry_run: bool = False, batch_size: int = 5000) -> List[Dict]:
+        """Apply (or with `dry_run`, estimate) every migration not yet in schema_version"""
+        cursor = conn.cursor()
+        applied = self._applied_migrations(cursor)
+        if not dry_run:
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS schema_version (
+                    version INTEGER PRIMARY KEY,
+                    description TEXT NOT NULL,
+                    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    rows_touched INTEGER NOT NULL DEFAULT 0,
+                    duration_ms REAL
                 )
             ''')
+            conn.commit()
+        
+        report = []
+        for version, description, migrate, backfills_method in self.MIGRATIONS:
+            if version in applied:
+                continue
+            backfills = getattr(self, backfills_method)() if backfills_method else []
+            if dry_run:
+                rows, seconds = self._estimate_migration(conn, migrate, backfills, batch_size)
+                report.append({'version': version, 'description': description, 'applied': False,
+                               'rows': rows, 'seconds': seconds})
+                continue
             
+            start = time.perf_counter()
+            rows = getattr(self, migrate)(cursor) or 0
+            conn.commit()
+            rows += sum(self._run_backfill(conn, *backfill, batch_size) for backfill in backfills
+                       if self._table_columns(cursor, backfill[0]))
+            seconds = time.perf_counter() - start
+            cursor.execute('''
+                INSERT INTO schema_version (version, description, rows_touched, duration_ms)
+                VALUES (?, ?, ?, ?)
+            ''', (version, description, rows, seconds * 1000))
             conn.commit()
+            report.append({'version': version, 'description': description, 'applied': True,
+                           'rows': rows, 'seconds': seconds})
+        return report
+    
+    @instrumented
+    @invalidates_cache
+    @exclusive_write
+    def migrate(self, dry_run: bool = False, batch_size: int = 5000) -> List[Dict]:
+        """Apply pending schema migrations, or with `dry_run` only estimate them
+        
+        Returns one entry per pending migration with its version, description,
+        rows touched (or that would be touched) and seconds taken (or estimated).
+        init_database runs this on every start; run it beforehand, e.g. with
+        `python3 manage.py migrate`, so a large backfill does not delay startup.
+        """
+        with self.get_connection() as conn:
+            return self._run_migrations(conn, dry_run, batch_size)
+    
+    @instrumented
+    def get_schema_migrations(self) -> List[Dict]:
+        """Every known migration with its applied_at, rows_touched and duration_ms, or None if pending"""
+        with self.get_connection() as conn:
+            applied = self._applied_migrations(conn.cursor())
+        return [applied.get(version, {'version': version, 'description': description, 'applied_at': None,
+                                      'rows_touched': None, 'duration_ms': None})
+                for version, description, _, _ in self.MIGRATIONS]
     
     # Admin password management methods
+    @instrumented
     def verify_admin_password(self, password: str) -> bool:
         """Verify admin password"""
         password_hash = hashlib.sha256(password.encode()).hexdigest()
@@ -121,6 +1542,9 @@ class DatabaseManager:
             result = cursor.fetchone()
             return result and result[0] == password_hash
     
+    @instrumented
+    @invalidates_cache
+    @queued_write
     def change_admin_password(self, current_password: str, new_password: str) -> bool:
         """Change admin password"""
         if not self.verify_admin_password(current_password):
@@ -134,10 +1558,12 @@ class DatabaseManager:
                 SET setting_value = ?, updated_at = CURRENT_TIMESTAMP
                 WHERE setting_name = "admin_password"
             ''', (new_password_hash,))
-            conn.commit()
         return True
     
     # Tier management methods
+    @instrumented
+    @invalidates_cache
+    @queued_write
     def create_tier(self, name: str, level: int, parent_tier_id: Optional[str] = None, description: str = "") -> str:
         """Create a new tier"""
         tier_id = str(uuid.uuid4())
@@ -147,21 +1573,42 @@ class DatabaseManager:
                 INSERT INTO tiers (id, name, level, parent_tier_id, description)
                 VALUES (?, ?, ?, ?, ?)
             ''', (tier_id, name, level, parent_tier_id, description))
-            conn.commit()
+            self._add_tier_closure(cursor, [tier_id])
         return tier_id
     
+    @instrumented
+    @invalidates_cache
+    @queued_write
     def update_tier(self, tier_id: str, name: str, level: int, parent_tier_id: Optional[str] = None, description: str = "") -> bool:
-        """Update an existing tier"""
+        """Update an existing tier (fails if the new parent is the tier itself or one of its descendants)"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
+            cursor.execute('SELECT parent_tier_id FROM tiers WHERE id = ?', (tier_id,))
+            current = cursor.fetchone()
+            if current is None:
+                return False
+            
+            parent_changed = (current[0] or None) != (parent_tier_id or None)
+            if parent_changed and parent_tier_id:
+                # Reject cycles: the new parent may not sit inside this tier's subtree
+                cursor.execute('SELECT 1 FROM tier_closure WHERE ancestor_id = ? AND descendant_id = ?',
+                             (tier_id, parent_tier_id))
+                if cursor.fetchone():
+                    return False
+            
             cursor.execute('''
                 UPDATE tiers 
                 SET name = ?, level = ?, parent_tier_id = ?, description = ?
                 WHERE id = ?
             ''', (name, level, parent_tier_id, description, tier_id))
-            conn.commit()
+            if parent_changed:
+                self._move_tier_closure(cursor, tier_id, parent_tier_id)
+                self._refresh_search_tier_paths(cursor, tier_id)
         return True
     
+    @instrumented
+    @invalidates_cache
+    @queued_write
     def delete_tier(self, tier_id: str) -> bool:
         """Delete a tier (only if no people or escalations are associated)"""
         with self.get_connection() as conn:
@@ -172,22 +1619,25 @@ class DatabaseManager:
             if cursor.fetchone()[0] > 0:
                 return False
             
-            # Check if tier has escalations
-            cursor.execute('SELECT COUNT(*) FROM escalations WHERE source_tier_id = ? OR target_tier_id = ? OR current_tier_id = ?', 
-                         (tier_id, tier_id, tier_id))
-            if cursor.fetchone()[0] > 0:
-                return False
+            # Check if tier has escalations, live or archived
+            for table in ('escalations', 'escalations_archive'):
+                cursor.execute(f'SELECT COUNT(*) FROM {table} WHERE source_tier_id = ? OR target_tier_id = ? OR current_tier_id = ?', 
+                             (tier_id, tier_id, tier_id))
+                if cursor.fetchone()[0] > 0:
+                    return False
             
             # Check if tier has child tiers
             cursor.execute('SELECT COUNT(*) FROM tiers WHERE parent_tier_id = ?', (tier_id,))
             if cursor.fetchone()[0] > 0:
                 return False
             
-            # Delete the tier
+            # Delete the tier; without children its only closure rows are its own paths
             cursor.execute('DELETE FROM tiers WHERE id = ?', (tier_id,))
-            conn.commit()
+            cursor.execute('DELETE FROM tier_closure WHERE descendant_id = ?', (tier_id,))
         return True
     
+    @instrumented
+    @cached_read
     def get_tier_by_id(self, tier_id: str) -> Optional[Dict]:
         """Get a specific tier by ID"""
         with self.get_connection() as conn:
@@ -204,6 +1654,8 @@ class DatabaseManager:
                 return dict(zip(columns, result))
         return None
     
+    @instrumented
+    @cached_read
     def get_tiers(self) -> pd.DataFrame:
         """Get all tiers"""
         with self.get_connection() as conn:
@@ -214,6 +1666,63 @@ class DatabaseManager:
                 ORDER BY t.level, t.name
             ''', conn)
     
+    @instrumented
+    @cached_read
+    def get_tier_stats(self) -> pd.DataFrame:
+        """Get every tier with headcount, child tiers, escalation counts by status and deletability
+        
+        is_deletable mirrors the checks in delete_tier: no active people, no
+        child tiers and no live or archived escalation referencing the tier in
+        any role. Status counts cover live escalations only.
+        """
+        with self.get_connection() as conn:
+            return pd.read_sql_query('''
+                WITH people_counts AS (
+                    SELECT tier_id, COUNT(*) AS people_count
+                    FROM people
+                    WHERE is_active = 1
+                    GROUP BY tier_id
+                ),
+                child_counts AS (
+                    SELECT parent_tier_id, COUNT(*) AS child_tier_count
+                    FROM tiers
+                    WHERE parent_tier_id IS NOT NULL
+                    GROUP BY parent_tier_id
+                ),
+                status_counts AS (
+                    SELECT current_tier_id,
+                           SUM(status = 'Open') AS open_count,
+                           SUM(status = 'In Progress') AS in_progress_count,
+                           SUM(status = 'Pending Feedback') AS pending_feedback_count,
+                           SUM(status = 'Closed') AS closed_count
+                    FROM escalations
+                    GROUP BY current_tier_id
+                )
+                SELECT t.*, pt.name as parent_tier_name,
+                       COALESCE(pc.people_count, 0) AS people_count,
+                       COALESCE(cc.child_tier_count, 0) AS child_tier_count,
+                       COALESCE(sc.open_count, 0) AS open_count,
+                       COALESCE(sc.in_progress_count, 0) AS in_progress_count,
+                       COALESCE(sc.pending_feedback_count, 0) AS pending_feedback_count,
+                       COALESCE(sc.closed_count, 0) AS closed_count,
+                       (pc.people_count IS NULL
+                        AND cc.child_tier_count IS NULL
+                        AND NOT EXISTS (SELECT 1 FROM escalations WHERE current_tier_id = t.id)
+                        AND NOT EXISTS (SELECT 1 FROM escalations WHERE source_tier_id = t.id)
+                        AND NOT EXISTS (SELECT 1 FROM escalations WHERE target_tier_id = t.id)
+                        AND NOT EXISTS (SELECT 1 FROM escalations_archive WHERE current_tier_id = t.id)
+                        AND NOT EXISTS (SELECT 1 FROM escalations_archive WHERE source_tier_id = t.id)
+                        AND NOT EXISTS (SELECT 1 FROM escalations_archive WHERE target_tier_id = t.id)) AS is_deletable
+                FROM tiers t
+                LEFT JOIN tiers pt ON t.parent_tier_id = pt.id
+                LEFT JOIN people_counts pc ON pc.tier_id = t.id
+                LEFT JOIN child_counts cc ON cc.parent_tier_id = t.id
+                LEFT JOIN status_counts sc ON sc.current_tier_id = t.id
+                ORDER BY t.level, t.name
+            ''', conn)
+    
+    @instrumented
+    @cached_read
     def get_tier_hierarchy(self) -> List[Dict]:
         """Get tier hierarchy for dropdown selection"""
         with self.get_connection() as conn:
@@ -221,7 +1730,147 @@ class DatabaseManager:
             cursor.execute('SELECT id, name, level FROM tiers ORDER BY level, name')
             return [{'id': row[0], 'name': row[1], 'level': row[2]} for row in cursor.fetchall()]
     
+    # Tier hierarchy methods
+    def _add_tier_closure(self, cursor, tier_ids: List[str]):
+        """Add closure rows for new leaf tiers; parents must already be in the closure table"""
+        cursor.executemany('''
+            INSERT INTO tier_closure (ancestor_id, descendant_id, depth)
+            SELECT ?, ?, 0
+            UNION ALL
+            SELECT c.ancestor_id, t.id, c.depth + 1
+            FROM tiers t
+            JOIN tier_closure c ON c.descendant_id = t.parent_tier_id
+            WHERE t.id = ?
+        ''', [(tier_id, tier_id, tier_id) for tier_id in tier_ids])
+    
+    def _move_tier_closure(self, cursor, tier_id: str, parent_tier_id: Optional[str]):
+        """Re-attach a tier's whole subtree under a new parent (or make it a root)"""
+        # Paths from the old ancestors into the subtree
+        cursor.execute('''
+            DELETE FROM tier_closure
+            WHERE descendant_id IN (SELECT descendant_id FROM tier_closure WHERE ancestor_id = ?)
+              AND ancestor_id NOT IN (SELECT descendant_id FROM tier_closure WHERE ancestor_id = ?)
+        ''', (tier_id, tier_id))
+        if parent_tier_id:
+            cursor.execute('''
+                INSERT INTO tier_closure (ancestor_id, descendant_id, depth)
+                SELECT above.ancestor_id, below.descendant_id, above.depth + below.depth + 1
+                FROM tier_closure above
+                CROSS JOIN tier_closure below
+                WHERE above.descendant_id = ? AND below.ancestor_id = ?
+            ''', (parent_tier_id, tier_id))
+    
+    def _rebuild_tier_closure(self, cursor):
+        """Recompute the closure table from tiers.parent_tier_id"""
+        cursor.execute('DELETE FROM tier_closure')
+        # The depth bound stops the recursion on a cycle left by older versions
+        cursor.execute('''
+            WITH RECURSIVE paths (ancestor_id, descendant_id, depth) AS (
+                SELECT id, id, 0 FROM tiers
+                UNION ALL
+                SELECT p.ancestor_id, t.id, p.depth + 1
+                FROM paths p
+                JOIN tiers t ON t.parent_tier_id = p.descendant_id
+                WHERE p.depth < (SELECT COUNT(*) FROM tiers)
+            )
+            INSERT OR IGNORE INTO tier_closure (ancestor_id, descendant_id, depth)
+            SELECT ancestor_id, descendant_id, depth FROM paths
+        ''')
+    
+    @instrumented
+    @invalidates_cache
+    @exclusive_write
+    def rebuild_tier_closure(self) -> int:
+        """Rebuild the tier closure table, returning the number of ancestor/descendant pairs
+        
+        The search index stores tier paths derived from the closure, so it is
+        rebuilt as well.
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            self._rebuild_tier_closure(cursor)
+            self._rebuild_search_index(cursor)
+            conn.commit()
+            cursor.execute('SELECT COUNT(*) FROM tier_closure')
+            return cursor.fetchone()[0]
+    
+    @instrumented
+    @cached_read
+    def get_tier_ancestors(self, tier_id: str, include_self: bool = False) -> pd.DataFrame:
+        """Get the tiers above a tier, nearest first, with their distance as depth"""
+        with self.get_connection() as conn:
+            return pd.read_sql_query('''
+                SELECT t.*, c.depth
+                FROM tier_closure c
+                JOIN tiers t ON t.id = c.ancestor_id
+                WHERE c.descendant_id = ? AND c.depth >= ?
+                ORDER BY c.depth
+            ''', conn, params=(tier_id, 0 if include_self else 1))
+    
+    @instrumented
+    @cached_read
+    def get_tier_descendants(self, tier_id: str, include_self: bool = False) -> pd.DataFrame:
+        """Get every tier in a tier's subtree with its distance as depth"""
+        with self.get_connection() as conn:
+            return pd.read_sql_query('''
+                SELECT t.*, c.depth
+                FROM tier_closure c
+                JOIN tiers t ON t.id = c.descendant_id
+                WHERE c.ancestor_id = ? AND c.depth >= ?
+                ORDER BY c.depth, t.name
+            ''', conn, params=(tier_id, 0 if include_self else 1))
+    
+    @instrumented
+    @cached_read
+    def get_subtree_rollup(self, tier_id: str, include_archived: bool = False) -> pd.DataFrame:
+        """Get escalation totals for a tier and for each of its child tiers' whole subtrees
+        
+        The first row (depth 0) covers only the tier itself; each depth 1 row
+        rolls up a direct child and everything below it.
+        """
+        counters = self.ALL_COUNTERS if include_archived else 'escalation_counters'
+        with self.get_connection() as conn:
+            return pd.read_sql_query(f'''
+                SELECT child.id AS tier_id, child.name AS tier_name, top.depth,
+                       COUNT(DISTINCT sub.descendant_id) AS tier_count,
+                       COALESCE(SUM(c.escalation_count), 0) AS escalation_count,
+                       COALESCE(SUM(CASE WHEN c.status = 'Open' THEN c.escalation_count END), 0) AS open_count,
+                       COALESCE(SUM(CASE WHEN c.status = 'In Progress' THEN c.escalation_count END), 0) AS in_progress_count,
+                       COALESCE(SUM(CASE WHEN c.status = 'Pending Feedback' THEN c.escalation_count END), 0) AS pending_feedback_count,
+                       COALESCE(SUM(CASE WHEN c.status = 'Closed' THEN c.escalation_count END), 0) AS closed_count,
+                       COALESCE(SUM(CASE WHEN c.urgency = 'Critical' THEN c.escalation_count END), 0) AS critical_count,
+                       COALESCE(SUM(c.escalated_count), 0) AS escalated_count,
+                       COALESCE(SUM(c.resolution_days_sum), 0) AS resolution_days_sum
+                FROM tier_closure top
+                JOIN tiers child ON child.id = top.descendant_id
+                JOIN tier_closure sub ON sub.ancestor_id = child.id AND (top.depth = 1 OR sub.depth = 0)
+                LEFT JOIN {counters} c ON c.tier_id = sub.descendant_id
+                WHERE top.ancestor_id = ? AND top.depth <= 1
+                GROUP BY child.id, child.name, top.depth
+                ORDER BY top.depth, child.name
+            ''', conn, params=(tier_id,))
+    
+    @instrumented
+    def get_tier_graph(self) -> TierGraph:
+        """Get the shared tier graph, rebuilt only when the data generation moves
+        
+        Without a read cache there is no generation to compare, so every call
+        builds a new graph.
+        """
+        generation = self.cache.generation() if self.cache is not None else None
+        graph = self._tier_graph
+        if graph is None or generation is None or graph.generation != generation:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('SELECT id, name, level, parent_tier_id, description FROM tiers ORDER BY level, name')
+                graph = TierGraph(cursor.fetchall(), generation)
+            self._tier_graph = graph
+        return graph
+    
     # People management methods
+    @instrumented
+    @invalidates_cache
+    @queued_write
     def create_person(self, name: str, email: str, tier_id: str, role: str = 'member') -> str:
         """Create a new person"""
         person_id = str(uuid.uuid4())
@@ -231,9 +1880,11 @@ class DatabaseManager:
                 INSERT INTO people (id, name, email, tier_id, role)
                 VALUES (?, ?, ?, ?, ?)
             ''', (person_id, name, email, tier_id, role))
-            conn.commit()
         return person_id
     
+    @instrumented
+    @invalidates_cache
+    @queued_write
     def update_person(self, person_id: str, name: str, email: str, tier_id: str, role: str) -> bool:
         """Update an existing person"""
         with self.get_connection() as conn:
@@ -243,9 +1894,11 @@ class DatabaseManager:
                 SET name = ?, email = ?, tier_id = ?, role = ?
                 WHERE id = ?
             ''', (name, email, tier_id, role, person_id))
-            conn.commit()
         return True
     
+    @instrumented
+    @invalidates_cache
+    @queued_write
     def delete_person(self, person_id: str) -> bool:
         """Delete a person (soft delete by setting is_active to False)"""
         with self.get_connection() as conn:
@@ -255,9 +1908,10 @@ class DatabaseManager:
                 SET is_active = 0
                 WHERE id = ?
             ''', (person_id,))
-            conn.commit()
         return True
     
+    @instrumented
+    @cached_read
     def get_person_by_id(self, person_id: str) -> Optional[Dict]:
         """Get a specific person by ID"""
         with self.get_connection() as conn:
@@ -274,6 +1928,8 @@ class DatabaseManager:
                 return dict(zip(columns, result))
         return None
     
+    @instrumented
+    @cached_read
     def get_people(self, tier_id: Optional[str] = None) -> pd.DataFrame:
         """Get all people or people in a specific tier"""
         with self.get_connection() as conn:
@@ -295,6 +1951,19 @@ class DatabaseManager:
                 ''', conn)
     
     # Escalation management methods
+    
+    # Statuses each transition may start from, keyed by the history action it records
+    ESCALATION_TRANSITIONS = {
+        'Escalated': ('Open',),
+        'Feedback Provided': ('In Progress',),
+        'Returned to Creator': ('In Progress',),
+        'Closed': ('Open', 'In Progress', 'Pending Feedback', 'Resolved'),
+    }
+    
+    @instrumented
+    @invalidates_cache
+    @queued_write
+    @retry_on_busy
     def create_escalation(self, title: str, description: str, urgency: str, created_by: str, source_tier_id: str) -> str:
         """Create a new escalation"""
         escalation_id = str(uuid.uuid4())
@@ -307,124 +1976,212 @@ class DatabaseManager:
             
             # Add history entry
             self._add_escalation_history(cursor, escalation_id, "Created", created_by, None, "Open")
-            conn.commit()
+            self._adjust_escalation_counters(cursor, escalation_id, 1)
         return escalation_id
     
-    def escalate_to_next_tier(self, escalation_id: str, target_tier_id: str, assigned_to: str, performed_by: str) -> bool:
-        """Escalate an escalation to the next tier"""
-        with self.get_connection() as conn:
+    def _transition(self, escalation_id: str, action: str, to_status: str, performed_by: str, assignments: str,
+                    params: Tuple, notes: str, expected_version: Optional[int]) -> TransitionResult:
+        """Move an escalation to `to_status`, setting `assignments` and recording `action` in its history
+        
+        The status and version are read under BEGIN IMMEDIATE, so they are still
+        current when the update runs. The transition is refused when the status
+        does not allow `action`, or when `expected_version` (the version the caller
+        last read, e.g. when rendering a form) is given and no longer matches. The
+        update only matches the version read, so it never overwrites a newer one.
+        """
+        with self.pool.write_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute('''
-                UPDATE escalations 
-                SET target_tier_id = ?, assigned_to = ?, current_tier_id = ?, 
-                    status = 'In Progress', escalated_at = CURRENT_TIMESTAMP,
-                    updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-            ''', (target_tier_id, assigned_to, target_tier_id, escalation_id))
+            cursor.execute('SELECT status, version FROM escalations WHERE id = ?', (escalation_id,))
+            result = cursor.fetchone()
+            if not result:
+                return TransitionResult(False, 'not_found')
+            status, version = result
+            if expected_version is not None and version != expected_version:
+                return TransitionResult(False, 'conflict', status, version)
+            if status not in self.ESCALATION_TRANSITIONS[action]:
+                return TransitionResult(False, 'invalid_status', status, version)
             
-            self._add_escalation_history(cursor, escalation_id, "Escalated", performed_by, "Open", "In Progress")
-            conn.commit()
-            return True
+            self._adjust_escalation_counters(cursor, escalation_id, -1)
+            cursor.execute(f'''
+                UPDATE escalations
+                SET {assignments}, status = ?, updated_at = CURRENT_TIMESTAMP, version = version + 1
+                WHERE id = ? AND version = ?
+            ''', (*params, to_status, escalation_id, version))
+            applied = cursor.rowcount == 1
+            self._adjust_escalation_counters(cursor, escalation_id, 1)
+            if not applied:
+                return TransitionResult(False, 'conflict', status, version)
+            
+            self._add_escalation_history(cursor, escalation_id, action, performed_by, status, to_status, notes)
+        return TransitionResult(True, None, to_status, version + 1)
     
-    def provide_feedback(self, escalation_id: str, feedback: str, performed_by: str) -> bool:
-        """Provide feedback on an escalation"""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                UPDATE escalations 
-                SET feedback = ?, status = 'Pending Feedback', resolved_at = CURRENT_TIMESTAMP,
-                    updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-            ''', (feedback, escalation_id))
-            
-            self._add_escalation_history(cursor, escalation_id, "Feedback Provided", performed_by, "In Progress", "Pending Feedback")
-            conn.commit()
-            return True
+    @instrumented
+    @invalidates_cache
+    @queued_write
+    @retry_on_busy
+    def escalate_to_next_tier(self, escalation_id: str, target_tier_id: str, assigned_to: str, performed_by: str,
+                              notes: str = "", expected_version: Optional[int] = None) -> TransitionResult:
+        """Escalate an Open escalation to another tier (see _transition for expected_version)"""
+        return self._transition(escalation_id, "Escalated", "In Progress", performed_by, '''
+            target_tier_id = ?, assigned_to = ?, current_tier_id = ?, escalated_at = CURRENT_TIMESTAMP
+        ''', (target_tier_id, assigned_to, target_tier_id), notes, expected_version)
     
-    def close_escalation(self, escalation_id: str, performed_by: str) -> bool:
-        """Close an escalation"""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                UPDATE escalations 
-                SET status = 'Closed', closed_at = CURRENT_TIMESTAMP,
-                    updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-            ''', (escalation_id,))
-            
-            self._add_escalation_history(cursor, escalation_id, "Closed", performed_by, "Pending Feedback", "Closed")
-            conn.commit()
-            return True
+    @instrumented
+    @invalidates_cache
+    @queued_write
+    @retry_on_busy
+    def provide_feedback(self, escalation_id: str, feedback: str, performed_by: str,
+                         expected_version: Optional[int] = None) -> TransitionResult:
+        """Provide feedback on an In Progress escalation"""
+        return self._transition(escalation_id, "Feedback Provided", "Pending Feedback", performed_by,
+                                'feedback = ?, resolved_at = CURRENT_TIMESTAMP', (feedback,), "", expected_version)
+    
+    @instrumented
+    @invalidates_cache
+    @queued_write
+    @retry_on_busy
+    def close_escalation(self, escalation_id: str, performed_by: str,
+                         expected_version: Optional[int] = None) -> TransitionResult:
+        """Close an escalation that is not Closed yet"""
+        return self._transition(escalation_id, "Closed", "Closed", performed_by,
+                                'closed_at = CURRENT_TIMESTAMP', (), "", expected_version)
     
+    @instrumented
+    @invalidates_cache
+    @queued_write
+    @retry_on_busy
     def delete_escalation(self, escalation_id: str, performed_by: str) -> bool:
         """Delete an escalation (only by creator/owner)"""
-        with self.get_connection() as conn:
+        with self.pool.write_connection() as conn:
             cursor = conn.cursor()
             
             # Verify the user is the creator of the escalation
-            cursor.execute('SELECT created_by FROM escalations WHERE id = ?', (escalation_id,))
+            cursor.execute('SELECT key, created_by FROM escalations WHERE id = ?', (escalation_id,))
             result = cursor.fetchone()
-            if not result or result[0] != performed_by:
+            if not result or result[1] != performed_by:
                 return False
             
-            # Delete the escalation and its history
-            cursor.execute('DELETE FROM escalation_history WHERE escalation_id = ?', (escalation_id,))
+            # Delete the escalation, its history and the stays derived from it
+            self._adjust_escalation_counters(cursor, escalation_id, -1)
+            cursor.execute('DELETE FROM escalation_history WHERE escalation_key = ?', (result[0],))
+            cursor.execute('DELETE FROM escalation_status_durations WHERE escalation_id = ?', (escalation_id,))
             cursor.execute('DELETE FROM escalations WHERE id = ?', (escalation_id,))
-            
-            conn.commit()
             return True
     
-    def return_escalation_to_creator(self, escalation_id: str, feedback: str, performed_by: str) -> bool:
-        """Return escalation to creator with feedback"""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # Get the source tier to return escalation to
-            cursor.execute('SELECT source_tier_id FROM escalations WHERE id = ?', (escalation_id,))
-            result = cursor.fetchone()
-            if not result:
-                return False
-            
-            source_tier_id = result[0]
-            
-            cursor.execute('''
-                UPDATE escalations 
-                SET feedback = ?, status = 'Pending Feedback', current_tier_id = ?, 
-                    resolved_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-            ''', (feedback, source_tier_id, escalation_id))
-            
-            self._add_escalation_history(cursor, escalation_id, "Returned to Creator", performed_by, "In Progress", "Pending Feedback", feedback)
-            conn.commit()
-            return True
+    @instrumented
+    @invalidates_cache
+    @queued_write
+    @retry_on_busy
+    def return_escalation_to_creator(self, escalation_id: str, feedback: str, performed_by: str,
+                                     expected_version: Optional[int] = None) -> TransitionResult:
+        """Return an In Progress escalation to its source tier with feedback"""
+        return self._transition(escalation_id, "Returned to Creator", "Pending Feedback", performed_by, '''
+            feedback = ?, current_tier_id = source_tier_id, resolved_at = CURRENT_TIMESTAMP
+        ''', (feedback,), feedback, expected_version)
     
-    def get_escalations(self, tier_id: Optional[str] = None, person_id: Optional[str] = None, 
-                       status_filter: Optional[str] = None) -> pd.DataFrame:
-        """Get escalations with various filters"""
-        base_query = '''
-            SELECT e.*, 
-                   creator.name as created_by_name,
+    
+    # Sort keys accepted by get_escalations, mapped to the SQL they order by.
+    # All of them are non-null so they can also serve as pagination keysets.
+    ESCALATION_SORT_KEYS = {
+        'created_at': 'e.created_at_epoch',
+        'updated_at': 'e.updated_at_epoch',
+        'days_open': 'e.created_at_epoch',
+        'urgency': "CASE e.urgency WHEN 'Critical' THEN 4 WHEN 'High' THEN 3 WHEN 'Medium' THEN 2 ELSE 1 END",
+        'status': 'e.status',
+        'title': 'e.title',
+    }
+    
+    def _escalation_sort_terms(self, sort_by: Optional[List[str]]) -> List[Tuple[str, bool]]:
+        """Resolve sort keys such as ['-urgency', 'created_at'] to (expression, descending) pairs"""
+        terms = []
+        for key in sort_by or ['-created_at']:
+            descending = key.startswith('-')
+            name = key.lstrip('-')
+            if name not in self.ESCALATION_SORT_KEYS:
+                raise ValueError(f"Unknown escalation sort key: {name}")
+            # More days open means an earlier created_at
+            if name == 'days_open':
+                descending = not descending
+            terms.append((self.ESCALATION_SORT_KEYS[name], descending))
+        return terms
+    
+    # Listing rows carry a preview of the description; the full text and feedback
+    # are loaded per escalation by get_escalation_detail
+    ESCALATION_LIST_COLUMNS = '''e.id, e.title,
+                   CASE WHEN length(e.description) > 100
+                        THEN substr(e.description, 1, 100) || '…'
+                        ELSE e.description
+                   END as description_preview,
+                   e.urgency, e.status, e.created_by, e.assigned_to,
+                   e.source_tier_id, e.target_tier_id, e.current_tier_id,
+                   e.created_at, e.updated_at, e.escalated_at, e.resolved_at, e.closed_at,
+                   e.created_at_epoch, e.escalated_at_epoch'''
+    
+    # Columns get_escalations returns on top of the listing columns, as it did
+    # before listings were narrowed
+    ESCALATION_FULL_COLUMNS = ''',
+                   e.description, e.feedback, e.version'''
+    
+    ESCALATION_NAME_COLUMNS = '''creator.name as created_by_name,
                    assignee.name as assigned_to_name,
                    st.name as source_tier_name,
                    tt.name as target_tier_name,
-                   ct.name as current_tier_name,
-                   CAST((julianday('now') - julianday(e.created_at)) AS INTEGER) as days_open,
-                   CASE 
-                       WHEN e.escalated_at IS NOT NULL 
-                       THEN CAST((julianday('now') - julianday(e.escalated_at)) AS INTEGER)
-                       ELSE NULL 
-                   END as days_since_escalation
-            FROM escalations e
-            JOIN people creator ON e.created_by = creator.id
+                   ct.name as current_tier_name'''
+    
+    ESCALATION_JOINS = '''JOIN people creator ON e.created_by = creator.id
             LEFT JOIN people assignee ON e.assigned_to = assignee.id
             JOIN tiers st ON e.source_tier_id = st.id
             LEFT JOIN tiers tt ON e.target_tier_id = tt.id
-            JOIN tiers ct ON e.current_tier_id = ct.id
+            JOIN tiers ct ON e.current_tier_id = ct.id'''
+    
+    # History rows as returned by the API, with the escalation's UUID in place of
+    # the integer key they are stored under ({escalation_id} is a column or '?')
+    HISTORY_COLUMNS = '''eh.id, {escalation_id} as escalation_id, eh.action, eh.performed_by,
+                   eh.from_status, eh.to_status, eh.notes, eh.timestamp, eh.timestamp_epoch'''
+    
+    # Integer key of the escalation whose UUID is bound to the placeholder, for history inserts
+    ESCALATION_KEY = '(SELECT key FROM escalations WHERE id = ?)'
+    
+    def _add_escalation_ages(self, escalations: pd.DataFrame) -> pd.DataFrame:
+        """Replace the epoch columns of listing rows with whole days_open and days_since_escalation"""
+        now = int(time.time())
+        return escalations.assign(
+            days_open=(now - pd.to_numeric(escalations['created_at_epoch'])) // 86400,
+            # NaN for escalations never escalated
+            days_since_escalation=(now - pd.to_numeric(escalations['escalated_at_epoch'])) // 86400,
+        ).drop(columns=['created_at_epoch', 'escalated_at_epoch'])
+    
+    def _escalation_query(self, tier_id: Optional[str] = None, person_id: Optional[str] = None,
+                          status_filter: Optional[str] = None, urgency_filter: Optional[str] = None,
+                          escalated: Optional[bool] = None, days_open_range: Optional[Tuple[int, int]] = None,
+                          include_subtree: bool = False, extra_columns: str = "",
+                          search: Optional[str] = None, archived: bool = False) -> Tuple[str, List]:
+        """Build the filtered escalation listing query (without ORDER BY) and its parameters
+        
+        With `search` (an FTS5 expression) rows come from escalation_search as `s`;
+        with `archived` they come from escalations_archive, which is not indexed for search.
+        """
+        if search:
+            source = 'escalation_search s JOIN escalations e ON e.rowid = s.rowid'
+        else:
+            source = 'escalations_archive e' if archived else 'escalations e'
+        base_query = f'''
+            SELECT {self.ESCALATION_LIST_COLUMNS},
+                   {self.ESCALATION_NAME_COLUMNS}{extra_columns}
+            FROM {source}
+            {self.ESCALATION_JOINS}
             WHERE 1=1
         '''
         
         params = []
-        if tier_id:
+        if search:
+            base_query += ' AND escalation_search MATCH ?'
+            params.append(search)
+        
+        if tier_id and include_subtree:
+            base_query += ' AND e.current_tier_id IN (SELECT descendant_id FROM tier_closure WHERE ancestor_id = ?)'
+            params.append(tier_id)
+        elif tier_id:
             base_query += ' AND e.current_tier_id = ?'
             params.append(tier_id)
         
@@ -436,30 +2193,1410 @@ class DatabaseManager:
             base_query += ' AND e.status = ?'
             params.append(status_filter)
         
-        base_query += ' ORDER BY e.created_at DESC'
+        if urgency_filter and urgency_filter != 'All':
+            base_query += ' AND e.urgency = ?'
+            params.append(urgency_filter)
         
+        if escalated is True:
+            base_query += ' AND e.target_tier_id IS NOT NULL'
+        elif escalated is False:
+            base_query += ' AND e.target_tier_id IS NULL'
+        
+        if days_open_range:
+            # days_open is the whole number of days since created_at, so
+            # min <= days_open <= max  <=>  now-(max+1)d < created_at <= now-min d
+            min_days, max_days = days_open_range
+            now = int(time.time())
+            if min_days is not None:
+                base_query += ' AND e.created_at_epoch <= ?'
+                params.append(now - min_days * 86400)
+            if max_days is not None:
+                base_query += ' AND e.created_at_epoch > ?'
+                params.append(now - (max_days + 1) * 86400)
+        
+        return base_query, params
+    
+    @instrumented
+    @cached_read
+    def get_escalations(self, tier_id: Optional[str] = None, person_id: Optional[str] = None, 
+                       status_filter: Optional[str] = None, urgency_filter: Optional[str] = None,
+                       escalated: Optional[bool] = None, days_open_range: Optional[Tuple[int, int]] = None,
+                       sort_by: Optional[List[str]] = None, include_subtree: bool = False,
+                       archived: bool = False) -> pd.DataFrame:
+        """Get escalations with various filters
+        
+        Rows hold the listing columns plus the full `description`, `feedback` and
+        `version`; get_escalations_page and search_escalations return only the
+        listing columns. With `include_subtree`, `tier_id` matches the tier and every tier below it.
+        `archived` lists archived escalations instead of the live ones.
+        `escalated` keeps only escalated (True) or never escalated (False) items.
+        `days_open_range` is an inclusive (min, max) pair of whole days open and is
+        applied as a created_at range so it can use the listing indexes. `sort_by`
+        takes keys from ESCALATION_SORT_KEYS, prefixed with '-' for descending.
+        """
+        base_query, params = self._escalation_query(tier_id, person_id, status_filter, urgency_filter,
+                                                    escalated, days_open_range, include_subtree,
+                                                    extra_columns=self.ESCALATION_FULL_COLUMNS,
+                                                    archived=archived)
+        terms = self._escalation_sort_terms(sort_by)
+        base_query += ' ORDER BY ' + ', '.join(f"{expr} {'DESC' if desc else 'ASC'}" for expr, desc in terms)
+        
+        with self.get_connection() as conn:
+            return self._add_escalation_ages(pd.read_sql_query(base_query, conn, params=params))
+    
+    @instrumented
+    @cached_read
+    def get_escalations_page(self, tier_id: Optional[str] = None, person_id: Optional[str] = None,
+                            status_filter: Optional[str] = None, urgency_filter: Optional[str] = None,
+                            escalated: Optional[bool] = None, days_open_range: Optional[Tuple[int, int]] = None,
+                            sort_by: Optional[List[str]] = None, page_size: int = 25,
+                            cursor: Optional[Tuple] = None,
+                            include_subtree: bool = False,
+                            archived: bool = False) -> Tuple[pd.DataFrame, Optional[Tuple]]:
+        """Get one page of escalations using keyset pagination
+        
+        Takes the same filters as get_escalations. Rows are ordered by the sort
+        keys followed by the escalation id, and `cursor` is the opaque value
+        returned with the previous page. Returns the page and the cursor for the
+        next page, or None when this is the last page.
+        """
+        terms = self._escalation_sort_terms(sort_by)
+        terms.append(('e.id', terms[-1][1]))
+        sort_columns = ''.join(f",\n                   {expr} as _sort_{i}" for i, (expr, _) in enumerate(terms))
+        base_query, params = self._escalation_query(tier_id, person_id, status_filter, urgency_filter,
+                                                    escalated, days_open_range, include_subtree,
+                                                    extra_columns=sort_columns, archived=archived)
+        
+        if cursor:
+            # Rows strictly after the cursor in (key1, key2, ..., id) order. The
+            # leading bound on the first key lets SQLite seek with an index.
+            first_expr, first_desc = terms[0]
+            base_query += f" AND {first_expr} {'<=' if first_desc else '>='} ?"
+            params.append(cursor[0])
+            clauses = []
+            for i, (expr, desc) in enumerate(terms):
+                parts = [f"{prev_expr} = ?" for prev_expr, _ in terms[:i]]
+                parts.append(f"{expr} {'<' if desc else '>'} ?")
+                clauses.append('(' + ' AND '.join(parts) + ')')
+                params.extend(cursor[:i + 1])
+            base_query += ' AND (' + ' OR '.join(clauses) + ')'
+        
+        base_query += ' ORDER BY ' + ', '.join(f"{expr} {'DESC' if desc else 'ASC'}" for expr, desc in terms)
+        base_query += ' LIMIT ?'
+        params.append(page_size + 1)
+        
+        with self.get_connection() as conn:
+            page = pd.read_sql_query(base_query, conn, params=params)
+        
+        sort_names = [f"_sort_{i}" for i in range(len(terms))]
+        next_cursor = None
+        if len(page) > page_size:
+            page = page.iloc[:page_size]
+            last = page.iloc[-1]
+            next_cursor = tuple(last[name].item() if hasattr(last[name], 'item') else last[name]
+                                for name in sort_names)
+        return self._add_escalation_ages(page.drop(columns=sort_names)), next_cursor
+    
+    @instrumented
+    @cached_read
+    def get_escalation_detail(self, escalation_id: str, include_archived: bool = False) -> Optional[Dict]:
+        """Get one escalation with its full description, feedback and history
+        
+        The escalation's columns come back as a dict with a `history` DataFrame
+        (newest first), or None if it does not exist. With `include_archived`,
+        an escalation not found in the live tables is looked up in the archive.
+        """
+        sources = [('escalations', 'escalation_history')]
+        if include_archived:
+            sources.append(('escalations_archive', 'escalation_history_archive'))
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            for table, history_table in sources:
+                cursor.execute(f'''
+                    SELECT e.*,
+                           {self.ESCALATION_NAME_COLUMNS}
+                    FROM {table} e
+                    {self.ESCALATION_JOINS}
+                    WHERE e.id = ?
+                ''', (escalation_id,))
+                result = cursor.fetchone()
+                if result:
+                    columns = [description[0] for description in cursor.description]
+                    detail = dict(zip(columns, result))
+                    key = detail.pop('key')
+                    now = int(time.time())
+                    detail['days_open'] = (now - detail['created_at_epoch']) // 86400
+                    detail['days_since_escalation'] = ((now - detail['escalated_at_epoch']) // 86400
+                                                       if detail['escalated_at_epoch'] is not None else None)
+                    detail['history'] = pd.read_sql_query(f'''
+                        SELECT {self.HISTORY_COLUMNS.format(escalation_id='?')}, p.name as performed_by_name
+                        FROM {history_table} eh
+                        JOIN people p ON eh.performed_by = p.id
+                        WHERE eh.escalation_key = ?
+                        ORDER BY eh.timestamp DESC
+                    ''', conn, params=(escalation_id, key))
+                    return detail
+        return None
+    
+    @instrumented
+    @cached_read
+    def get_person_summary(self, person_id: str, tier_id: str) -> Dict:
+        """Get My Dashboard metrics for a person without loading their escalations"""
         with self.get_connection() as conn:
-            return pd.read_sql_query(base_query, conn, params=params)
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT COALESCE(SUM(created_by = ?), 0),
+                       COALESCE(SUM(assigned_to = ?), 0),
+                       AVG((? - created_at_epoch) / 86400)
+                FROM escalations
+                WHERE created_by = ? OR assigned_to = ?
+            ''', (person_id, person_id, int(time.time()), person_id, person_id))
+            created_count, assigned_count, avg_days_open = cursor.fetchone()
+            
+            cursor.execute('''
+                SELECT COUNT(*) FROM escalations
+                WHERE current_tier_id = ? AND status = 'Pending Feedback'
+            ''', (tier_id,))
+            pending_feedback = cursor.fetchone()[0]
+        
+        return {
+            'created_count': created_count,
+            'assigned_count': assigned_count,
+            'pending_feedback': pending_feedback,
+            'avg_days_open': avg_days_open or 0,
+        }
+    
+    # Bulk import methods
+    #
+    # Each method validates every row first, then writes all valid rows with
+    # executemany in a single transaction. Invalid rows are reported as
+    # {'row': index, 'error': message} and never abort the rest of the batch.
+    
+    def _insert_valid_rows(self, cursor, sql: str, rows: List[Tuple], row_numbers: List[int],
+                           errors: List[Dict]) -> List[int]:
+        """executemany the rows, falling back to per-row savepoints to isolate constraint failures
+        
+        Returns the positions (within `rows`) that were inserted.
+        """
+        cursor.execute('SAVEPOINT bulk_insert')
+        try:
+            cursor.executemany(sql, rows)
+            cursor.execute('RELEASE bulk_insert')
+            return list(range(len(rows)))
+        except sqlite3.IntegrityError:
+            cursor.execute('ROLLBACK TO bulk_insert')
+            cursor.execute('RELEASE bulk_insert')
+        
+        inserted = []
+        for position, row in enumerate(rows):
+            cursor.execute('SAVEPOINT bulk_row')
+            try:
+                cursor.execute(sql, row)
+                cursor.execute('RELEASE bulk_row')
+                inserted.append(position)
+            except sqlite3.IntegrityError as e:
+                cursor.execute('ROLLBACK TO bulk_row')
+                cursor.execute('RELEASE bulk_row')
+                errors.append({'row': row_numbers[position], 'error': str(e)})
+        return inserted
+    
+    @instrumented
+    @invalidates_cache
+    @exclusive_write
+    def create_tiers_bulk(self, tiers: List[Dict]) -> Dict:
+        """Create many tiers in one transaction
+        
+        Each row needs `name` and `level`, and may give `description` and a parent
+        as `parent_tier_id` or `parent_tier_name` (which may name a tier earlier in
+        the same batch). Returns {'created': [ids], 'errors': [{'row', 'error'}]}.
+        """
+        errors = []
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT id, name FROM tiers')
+            tier_ids_by_name = {name: tier_id for tier_id, name in cursor.fetchall()}
+            known_ids = set(tier_ids_by_name.values())
+            
+            rows, row_numbers = [], []
+            for row_number, tier in enumerate(tiers):
+                name = _clean(tier.get('name'))
+                level = _clean(tier.get('level'))
+                parent_tier_id = _clean(tier.get('parent_tier_id'))
+                parent_tier_name = _clean(tier.get('parent_tier_name'))
+                
+                if not name:
+                    errors.append({'row': row_number, 'error': "Missing tier name"})
+                    continue
+                if name in tier_ids_by_name:
+                    errors.append({'row': row_number, 'error': f"Tier '{name}' already exists"})
+                    continue
+                try:
+                    level = int(float(level))
+                except (TypeError, ValueError):
+                    errors.append({'row': row_number, 'error': f"Invalid level: {level}"})
+                    continue
+                if parent_tier_name and not parent_tier_id:
+                    parent_tier_id = tier_ids_by_name.get(parent_tier_name)
+                    if parent_tier_id is None:
+                        errors.append({'row': row_number, 'error': f"Unknown parent tier '{parent_tier_name}'"})
+                        continue
+                elif parent_tier_id and parent_tier_id not in known_ids:
+                    errors.append({'row': row_number, 'error': f"Unknown parent tier id '{parent_tier_id}'"})
+                    continue
+                
+                tier_id = str(uuid.uuid4())
+                tier_ids_by_name[name] = tier_id
+                known_ids.add(tier_id)
+                rows.append((tier_id, name, level, parent_tier_id, _clean(tier.get('description')) or ""))
+                row_numbers.append(row_number)
+            
+            inserted = self._insert_valid_rows(cursor, '''
+                INSERT INTO tiers (id, name, level, parent_tier_id, description)
+                VALUES (?, ?, ?, ?, ?)
+            ''', rows, row_numbers, errors)
+            # Rows are in file order, so parents are added to the closure before their children
+            self._add_tier_closure(cursor, [rows[position][0] for position in inserted])
+            conn.commit()
+        
+        errors.sort(key=lambda error: error['row'])
+        return {'created': [rows[position][0] for position in inserted], 'errors': errors}
+    
+    @instrumented
+    @invalidates_cache
+    @exclusive_write
+    def create_people_bulk(self, people: List[Dict]) -> Dict:
+        """Create many people in one transaction
+        
+        Each row needs `name`, `email` and a tier as `tier_id` or `tier_name`, and
+        may give a `role` (default 'member'). Returns {'created': [ids],
+        'errors': [{'row', 'error'}]}.
+        """
+        errors = []
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT id, name FROM tiers')
+            tier_ids_by_name = {name: tier_id for tier_id, name in cursor.fetchall()}
+            known_tier_ids = set(tier_ids_by_name.values())
+            cursor.execute('SELECT email FROM people')
+            emails = {row[0] for row in cursor.fetchall()}
+            
+            rows, row_numbers = [], []
+            for row_number, person in enumerate(people):
+                name = _clean(person.get('name'))
+                email = _clean(person.get('email'))
+                tier_id = _clean(person.get('tier_id'))
+                tier_name = _clean(person.get('tier_name'))
+                role = _clean(person.get('role')) or 'member'
+                
+                if not name or not email:
+                    errors.append({'row': row_number, 'error': "Missing name or email"})
+                    continue
+                if email in emails:
+                    errors.append({'row': row_number, 'error': f"Email '{email}' already exists"})
+                    continue
+                if role not in PERSON_ROLES:
+                    errors.append({'row': row_number, 'error': f"Invalid role: {role}"})
+                    continue
+                if not tier_id and tier_name:
+                    tier_id = tier_ids_by_name.get(tier_name)
+                if tier_id not in known_tier_ids:
+                    errors.append({'row': row_number, 'error': f"Unknown tier '{tier_name or tier_id}'"})
+                    continue
+                
+                emails.add(email)
+                rows.append((str(uuid.uuid4()), name, email, tier_id, role))
+                row_numbers.append(row_number)
+            
+            inserted = self._insert_valid_rows(cursor, '''
+                INSERT INTO people (id, name, email, tier_id, role)
+                VALUES (?, ?, ?, ?, ?)
+            ''', rows, row_numbers, errors)
+            conn.commit()
+        
+        errors.sort(key=lambda error: error['row'])
+        return {'created': [rows[position][0] for position in inserted], 'errors': errors}
+    
+    @instrumented
+    @invalidates_cache
+    @exclusive_write
+    def create_escalations_bulk(self, escalations: List[Dict]) -> Dict:
+        """Create many escalations and their history rows in one transaction
+        
+        Each row needs `title`, `urgency` and a creator as `created_by` (person id)
+        or `created_by_email`. Optional: `description`, source tier as
+        `source_tier_id` or `source_tier_name` (default: the creator's tier), and
+        for historical tickets `status` ('Open' or 'Closed'), `created_at` and
+        `closed_at`. Returns {'created': [ids], 'errors': [{'row', 'error'}]}.
+        """
+        errors = []
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT id, name FROM tiers')
+            tier_ids_by_name = {name: tier_id for tier_id, name in cursor.fetchall()}
+            known_tier_ids = set(tier_ids_by_name.values())
+            cursor.execute('SELECT id, email, tier_id FROM people WHERE is_active = 1')
+            people = cursor.fetchall()
+            person_ids_by_email = {email: person_id for person_id, email, _ in people}
+            tier_by_person = {person_id: tier_id for person_id, _, tier_id in people}
+            now = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+            
+            rows, row_numbers = [], []
+            for row_number, escalation in enumerate(escalations):
+                title = _clean(escalation.get('title'))
+                urgency = _clean(escalation.get('urgency')) or 'Medium'
+                status = _clean(escalation.get('status')) or 'Open'
+                created_by = _clean(escalation.get('created_by'))
+                created_by_email = _clean(escalation.get('created_by_email'))
+                source_tier_id = _clean(escalation.get('source_tier_id'))
+                source_tier_name = _clean(escalation.get('source_tier_name'))
+                
+                if not title:
+                    errors.append({'row': row_number, 'error': "Missing title"})
+                    continue
+                if urgency not in URGENCY_LEVELS:
+                    errors.append({'row': row_number, 'error': f"Invalid urgency: {urgency}"})
+                    continue
+                if status not in ('Open', 'Closed'):
+                    errors.append({'row': row_number, 'error': f"Imported status must be Open or Closed, got {status}"})
+                    continue
+                if not created_by and created_by_email:
+                    created_by = person_ids_by_email.get(created_by_email)
+                if created_by not in tier_by_person:
+                    errors.append({'row': row_number, 'error': f"Unknown creator '{created_by_email or created_by}'"})
+                    continue
+                if not source_tier_id and source_tier_name:
+                    source_tier_id = tier_ids_by_name.get(source_tier_name)
+                    if source_tier_id is None:
+                        errors.append({'row': row_number, 'error': f"Unknown source tier '{source_tier_name}'"})
+                        continue
+                source_tier_id = source_tier_id or tier_by_person[created_by]
+                if source_tier_id not in known_tier_ids:
+                    errors.append({'row': row_number, 'error': f"Unknown source tier id '{source_tier_id}'"})
+                    continue
+                try:
+                    created_at = _format_timestamp(escalation.get('created_at')) or now
+                    closed_at = _format_timestamp(escalation.get('closed_at'))
+                except ValueError as e:
+                    errors.append({'row': row_number, 'error': f"Invalid timestamp: {e}"})
+                    continue
+                if status == 'Closed':
+                    closed_at = closed_at or created_at
+                else:
+                    closed_at = None
+                
+                rows.append((str(uuid.uuid4()), title, _clean(escalation.get('description')) or "", urgency, status,
+                             created_by, source_tier_id, source_tier_id, created_at, closed_at or created_at, closed_at))
+                row_numbers.append(row_number)
+            
+            inserted = self._insert_valid_rows(cursor, '''
+                INSERT INTO escalations (id, title, description, urgency, status, created_by,
+                                         source_tier_id, current_tier_id, created_at, updated_at, closed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', rows, row_numbers, errors)
+            created = [rows[position] for position in inserted]
+            
+            # History rows for every created escalation, written in bulk
+            history = []
+            for escalation_id, _, _, _, status, created_by, _, _, created_at, _, closed_at in created:
+                history.append((escalation_id, "Created", created_by, None, "Open", "", created_at))
+                if status == 'Closed':
+                    history.append((escalation_id, "Closed", created_by, "Open", "Closed",
+                                    "Imported as closed", closed_at))
+            cursor.executemany(f'''
+                INSERT INTO escalation_history (escalation_key, action, performed_by, from_status, to_status, notes, timestamp)
+                VALUES ({self.ESCALATION_KEY}, ?, ?, ?, ?, ?, ?)
+            ''', history)
+            
+            self._adjust_escalation_counters_many(cursor, [row[0] for row in created], 1)
+            conn.commit()
+        
+        errors.sort(key=lambda error: error['row'])
+        return {'created': [row[0] for row in created], 'errors': errors}
+    
+    # Counter contribution of one escalation row, in the column order of escalation_counters
+    COUNTER_CONTRIBUTION = '''
+        current_tier_id AS tier_id, status, urgency,
+        ? AS n,
+        ? * (target_tier_id IS NOT NULL) AS escalated,
+        ? * CASE WHEN status = 'Closed' AND closed_at_epoch IS NOT NULL
+                 THEN (closed_at_epoch - created_at_epoch) / 86400.0 ELSE 0 END AS resolution_days
+    '''
+    
+    # Hot and archived counters together, for views that include archived escalations
+    ALL_COUNTERS = '''(
+        SELECT * FROM escalation_counters
+        UNION ALL
+        SELECT * FROM escalation_archive_counters
+    )'''
+    
+    def _adjust_escalation_counters(self, cursor, escalation_id: str, delta: int, archived: bool = False):
+        """Add (delta=1) or remove (delta=-1) an escalation's current row from the tier counters
+        
+        Writers call this with -1 before changing an escalation and with +1 after,
+        inside the same transaction as the change itself. `archived` selects the
+        archive table and its counters.
+        """
+        self._adjust_escalation_counters_many(cursor, [escalation_id], delta, archived)
+    
+    def _adjust_escalation_counters_many(self, cursor, escalation_ids: List[str], delta: int,
+                                         archived: bool = False):
+        """Apply _adjust_escalation_counters to many escalations with one executemany"""
+        counters, source = self._counter_tables(archived)
+        cursor.executemany(f'''
+            INSERT INTO {counters}
+                (tier_id, status, urgency, escalation_count, escalated_count, resolution_days_sum)
+            SELECT {self.COUNTER_CONTRIBUTION}
+            FROM {source} WHERE id = ?
+            ON CONFLICT (tier_id, status, urgency) DO UPDATE SET
+                escalation_count = escalation_count + excluded.escalation_count,
+                escalated_count = escalated_count + excluded.escalated_count,
+                resolution_days_sum = resolution_days_sum + excluded.resolution_days_sum
+        ''', [(delta, delta, delta, escalation_id) for escalation_id in escalation_ids])
+    
+    @staticmethod
+    def _counter_tables(archived: bool) -> Tuple[str, str]:
+        """(counters table, escalations table) for the hot or archived escalations"""
+        return ('escalation_archive_counters', 'escalations_archive') if archived else ('escalation_counters', 'escalations')
+    
+    def _rebuild_escalation_counters(self, cursor):
+        """Recompute every tier counter from the escalations and archive tables"""
+        for archived in (False, True):
+            counters, source = self._counter_tables(archived)
+            cursor.execute(f'DELETE FROM {counters}')
+            cursor.execute(f'''
+                INSERT INTO {counters}
+                    (tier_id, status, urgency, escalation_count, escalated_count, resolution_days_sum)
+                SELECT tier_id, status, urgency, SUM(n), SUM(escalated), SUM(resolution_days)
+                FROM (SELECT {self.COUNTER_CONTRIBUTION.replace('?', '1')} FROM {source})
+                GROUP BY tier_id, status, urgency
+            ''')
+    
+    @instrumented
+    @invalidates_cache
+    @exclusive_write
+    def rebuild_escalation_counters(self) -> int:
+        """Rebuild the per-tier escalation counters, returning the number of counter rows"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            self._rebuild_escalation_counters(cursor)
+            cursor.execute('SELECT (SELECT COUNT(*) FROM escalation_counters) + (SELECT COUNT(*) FROM escalation_archive_counters)')
+            return cursor.fetchone()[0]
+    
+    @instrumented
+    @cached_read
+    def get_escalation_counters(self, tier_id: Optional[str] = None, include_subtree: bool = False,
+                                include_archived: bool = False) -> pd.DataFrame:
+        """Get non-empty escalation counters by tier, status and urgency
+        
+        Average resolution days for a group is resolution_days_sum / escalation_count
+        over its Closed rows. With `include_subtree`, rows for every tier below
+        `tier_id` are returned as well; `include_archived` adds archived escalations.
+        """
+        counters = self.ALL_COUNTERS if include_archived else 'escalation_counters'
+        query = f'''
+            SELECT c.tier_id, t.name as tier_name, c.status, c.urgency,
+                   SUM(c.escalation_count) AS escalation_count,
+                   SUM(c.escalated_count) AS escalated_count,
+                   SUM(c.resolution_days_sum) AS resolution_days_sum
+            FROM {counters} c
+            JOIN tiers t ON c.tier_id = t.id
+            WHERE c.escalation_count > 0
+        '''
+        params = []
+        if tier_id and include_subtree:
+            query += ' AND c.tier_id IN (SELECT descendant_id FROM tier_closure WHERE ancestor_id = ?)'
+            params.append(tier_id)
+        elif tier_id:
+            query += ' AND c.tier_id = ?'
+            params.append(tier_id)
+        query += ' GROUP BY c.tier_id, t.name, c.status, c.urgency'
+        
+        with self.get_connection() as conn:
+            return pd.read_sql_query(query, conn, params=params)
+    
+    # Full-text search methods
+    
+    # Space-separated tokens placing an escalation in the hierarchy: 'c<tier>' for
+    # its current tier and 'a<tier>' for that tier and every ancestor, so tier
+    # scopes are matched by the FTS index itself
+    SEARCH_TIER_PATH = '''(
+        SELECT group_concat(CASE WHEN c.depth = 0 THEN 'c' || replace(c.ancestor_id, '-', '') || ' ' ELSE '' END
+                            || 'a' || replace(c.ancestor_id, '-', ''), ' ')
+        FROM tier_closure c WHERE c.descendant_id = {tier_id}
+    )'''
+    
+    SEARCH_TRIGGERS = {
+        'escalation_search_insert': f'''AFTER INSERT ON escalations BEGIN
+                INSERT INTO escalation_search (rowid, title, description, feedback, notes, tier_path)
+                VALUES (new.rowid, new.title, new.description, new.feedback, '',
+                        {SEARCH_TIER_PATH.format(tier_id='new.current_tier_id')});
+            END''',
+        'escalation_search_update': f'''AFTER UPDATE OF title, description, feedback, current_tier_id ON escalations BEGIN
+                UPDATE escalation_search
+                SET title = new.title, description = new.description, feedback = new.feedback,
+                    tier_path = {SEARCH_TIER_PATH.format(tier_id='new.current_tier_id')}
+                WHERE rowid = new.rowid;
+            END''',
+        'escalation_search_delete': '''AFTER DELETE ON escalations BEGIN
+                DELETE FROM escalation_search WHERE rowid = old.rowid;
+            END''',
+        'escalation_search_history': '''AFTER INSERT ON escalation_history
+            WHEN new.notes IS NOT NULL AND new.notes != '' BEGIN
+                UPDATE escalation_search
+                SET notes = trim(notes || ' ' || new.notes)
+                WHERE rowid = new.escalation_key;
+            END''',
+    }
+    
+    # bm25 weights for title, description, feedback, notes and tier_path
+    SEARCH_RANK = 'bm25(10.0, 4.0, 2.0, 1.0, 0.0)'
+    
+    # Largest match count ordered by relevance. bm25 costs tens of microseconds a
+    # row, so broader searches are listed newest first straight from the index.
+    SEARCH_RANKED_MATCHES = 500
+    
+    def _create_search_triggers(self, cursor):
+        for name, body in self.SEARCH_TRIGGERS.items():
+            cursor.execute(f'CREATE TRIGGER IF NOT EXISTS {name} {body}')
+    
+    def _rebuild_search_index(self, cursor):
+        """Re-index every escalation with its history notes and tier path"""
+        cursor.execute('DELETE FROM escalation_search')
+        cursor.execute(f'''
+            INSERT INTO escalation_search (rowid, title, description, feedback, notes, tier_path)
+            SELECT e.rowid, e.title, e.description, e.feedback,
+                   COALESCE((SELECT group_concat(h.notes, ' ') FROM escalation_history h
+                             WHERE h.escalation_key = e.key AND h.notes != ''), ''),
+                   {self.SEARCH_TIER_PATH.format(tier_id='e.current_tier_id')}
+            FROM escalations e
+        ''')
+        cursor.execute("INSERT INTO escalation_search (escalation_search, rank) VALUES ('rank', ?)",
+                       (self.SEARCH_RANK,))
+        cursor.execute("INSERT INTO escalation_search (escalation_search) VALUES ('optimize')")
+    
+    def _refresh_search_tier_paths(self, cursor, tier_id: str):
+        """Recompute tier paths for escalations in a tier's subtree after it moved"""
+        cursor.execute(f'''
+            UPDATE escalation_search
+            SET tier_path = (SELECT {self.SEARCH_TIER_PATH.format(tier_id='e.current_tier_id')}
+                             FROM escalations e WHERE e.rowid = escalation_search.rowid)
+            WHERE rowid IN (SELECT e.rowid FROM escalations e
+                            WHERE e.current_tier_id IN (SELECT descendant_id FROM tier_closure WHERE ancestor_id = ?))
+        ''', (tier_id,))
+    
+    @instrumented
+    @invalidates_cache
+    @exclusive_write
+    def rebuild_search_index(self) -> int:
+        """Rebuild the full-text search index, returning the number of indexed escalations"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            self._rebuild_search_index(cursor)
+            conn.commit()
+            cursor.execute('SELECT COUNT(*) FROM escalation_search')
+            return cursor.fetchone()[0]
+    
+    @contextmanager
+    def deferred_search_index(self):
+        """Suspend search index triggers for a bulk load and rebuild the index once afterwards
+        
+        Writes made by other sessions in the meantime are picked up by the rebuild.
+        """
+        with self.get_connection() as conn:
+            for name in self.SEARCH_TRIGGERS:
+                conn.execute(f'DROP TRIGGER IF EXISTS {name}')
+            conn.commit()
+        try:
+            yield
+        finally:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                self._create_search_triggers(cursor)
+                self._rebuild_search_index(cursor)
+                conn.commit()
+            if self.cache is not None:
+                self.cache.bump()
+    
+    @staticmethod
+    def _search_expression(text: str, tier_scope: Optional[str] = None,
+                           include_subtree: bool = True) -> Optional[str]:
+        """Turn free text into an FTS5 query: every word must match, and a trailing * makes a word a prefix"""
+        terms = [f'"{word}"{star}' for word, star in re.findall(r'(\w+)(\*?)', text)]
+        if not terms:
+            return None
+        expression = '{title description feedback notes} : (' + ' '.join(terms) + ')'
+        if tier_scope:
+            scope_token = ('a' if include_subtree else 'c') + tier_scope.replace('-', '')
+            expression += f' AND tier_path : "{scope_token}"'
+        return expression
+    
+    @instrumented
+    @cached_read
+    def search_escalations(self, query: str, tier_scope: Optional[str] = None, include_subtree: bool = True,
+                           person_id: Optional[str] = None, status_filter: Optional[str] = None,
+                           urgency_filter: Optional[str] = None, escalated: Optional[bool] = None,
+                           days_open_range: Optional[Tuple[int, int]] = None, page_size: int = 25,
+                           cursor: Optional[Tuple] = None) -> Tuple[pd.DataFrame, Optional[Tuple]]:
+        """Search escalation titles, descriptions, feedback and history notes
+        
+        `tier_scope` limits results to escalations currently in that tier and, with
+        `include_subtree`, the tiers below it. The other filters match
+        get_escalations. Up to SEARCH_RANKED_MATCHES matches are ordered by bm25
+        relevance; broader searches list the newest matches first. Returns one page
+        with a `search_snippet` column and the cursor for the next page, like
+        get_escalations_page.
+        """
+        expression = self._search_expression(query, tier_scope, include_subtree)
+        if expression is None:
+            return pd.DataFrame(), None
+        
+        filters = (None, person_id, status_filter, urgency_filter, escalated, days_open_range)
+        with self.get_connection() as conn:
+            # Count matches up to the limit; rowid order streams straight from the index
+            count_query, params = self._escalation_query(*filters, search=expression)
+            count = conn.execute(f'SELECT COUNT(*) FROM ({count_query} ORDER BY s.rowid DESC LIMIT ?)',
+                                 params + [self.SEARCH_RANKED_MATCHES + 1]).fetchone()[0]
+            ranked = count <= self.SEARCH_RANKED_MATCHES
+            
+            # Pages are ordered by rank (0 when unranked), then newest first
+            rank_expression = 's.rank' if ranked else '0'
+            page_query, params = self._escalation_query(*filters, search=expression, extra_columns=f''',
+                   {rank_expression} as _search_rank,
+                   s.rowid as _search_rowid''')
+            if cursor:
+                page_query += f' AND ({rank_expression} > ? OR ({rank_expression} = ? AND s.rowid < ?))'
+                params.extend([cursor[0], cursor[0], cursor[1]])
+            page_query += ' ORDER BY s.rank, s.rowid DESC LIMIT ?' if ranked else ' ORDER BY s.rowid DESC LIMIT ?'
+            params.append(page_size + 1)
+            page = pd.read_sql_query(page_query, conn, params=params)
+            
+            # Snippets only for the rows shown
+            snippets = [conn.execute('''
+                SELECT snippet(escalation_search, -1, '**', '**', '…', 16)
+                FROM escalation_search WHERE escalation_search MATCH ? AND rowid = ?
+            ''', (expression, int(rowid))).fetchone()[0] for rowid in page['_search_rowid'].iloc[:page_size]]
+        
+        next_cursor = None
+        if len(page) > page_size:
+            page = page.iloc[:page_size]
+            last = page.iloc[-1]
+            next_cursor = (float(last['_search_rank']), int(last['_search_rowid']))
+        page = self._add_escalation_ages(page.drop(columns=['_search_rank', '_search_rowid']))
+        page['search_snippet'] = snippets
+        return page, next_cursor
+    
+    # Archive methods
+    def _table_columns(self, cursor, table: str) -> List[str]:
+        cursor.execute(f'PRAGMA table_info({table})')
+        return [row[1] for row in cursor.fetchall()]
+    
+    def _move_escalations(self, cursor, escalation_ids: List[str], archive: bool):
+        """Move escalations with their history between the hot and archive tables
+        
+        Counters move with them, and the search index follows through its triggers.
+        """
+        if archive:
+            source, target = 'escalations', 'escalations_archive'
+            history_source, history_target = 'escalation_history', 'escalation_history_archive'
+        else:
+            source, target = 'escalations_archive', 'escalations'
+            history_source, history_target = 'escalation_history_archive', 'escalation_history'
+        # The archive tables carry every hot column (plus archived_at on escalations)
+        columns = ', '.join(self._table_columns(cursor, 'escalations'))
+        history_columns = ', '.join(self._table_columns(cursor, 'escalation_history'))
+        placeholders = ', '.join('?' * len(escalation_ids))
+        keys = f'SELECT key FROM {source} WHERE id IN ({placeholders})'
+        
+        self._adjust_escalation_counters_many(cursor, escalation_ids, -1, archived=not archive)
+        cursor.execute(f'''
+            INSERT INTO {target} ({columns})
+            SELECT {columns} FROM {source} WHERE id IN ({placeholders})
+        ''', escalation_ids)
+        cursor.execute(f'''
+            INSERT INTO {history_target} ({history_columns})
+            SELECT {history_columns} FROM {history_source} WHERE escalation_key IN ({keys})
+        ''', escalation_ids)
+        cursor.execute(f'DELETE FROM {history_source} WHERE escalation_key IN ({keys})', escalation_ids)
+        cursor.execute(f'DELETE FROM {source} WHERE id IN ({placeholders})', escalation_ids)
+        self._adjust_escalation_counters_many(cursor, escalation_ids, 1, archived=archive)
+    
+    @instrumented
+    @invalidates_cache
+    @exclusive_write
+    def archive_closed_escalations(self, older_than_days: int = 90, batch_size: int = 500) -> int:
+        """Move Closed escalations not touched for `older_than_days` into the archive tables
+        
+        Each batch is its own transaction so writers are never blocked for long.
+        Returns the number of escalations archived.
+        """
+        cutoff = int(time.time()) - older_than_days * 86400
+        archived = 0
+        while True:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    SELECT id FROM escalations
+                    WHERE status = 'Closed' AND closed_at_epoch < ? AND updated_at_epoch < ?
+                    LIMIT ?
+                ''', (cutoff, cutoff, batch_size))
+                escalation_ids = [row[0] for row in cursor.fetchall()]
+                if not escalation_ids:
+                    break
+                self._move_escalations(cursor, escalation_ids, archive=True)
+                conn.commit()
+            archived += len(escalation_ids)
+        return archived
+    
+    @instrumented
+    @invalidates_cache
+    @queued_write
+    def restore_escalation(self, escalation_id: str) -> bool:
+        """Move an archived escalation and its history back to the hot tables
+        
+        updated_at is set to now so the next archival run does not move it straight back.
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT 1 FROM escalations_archive WHERE id = ?', (escalation_id,))
+            if not cursor.fetchone():
+                return False
+            cursor.execute('UPDATE escalations_archive SET updated_at = CURRENT_TIMESTAMP, version = version + 1 '
+                           'WHERE id = ?', (escalation_id,))
+            self._move_escalations(cursor, [escalation_id], archive=False)
+        return True
+    
+    @instrumented
+    @cached_read
+    def get_archive_summary(self) -> Dict:
+        """Get the number of archived escalations and the range of their closing dates"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT COALESCE(SUM(escalation_count), 0) FROM escalation_archive_counters')
+            archived_count = cursor.fetchone()[0]
+            cursor.execute('SELECT MIN(closed_at), MAX(closed_at) FROM escalations_archive')
+            oldest_closed_at, newest_closed_at = cursor.fetchone()
+        return {
+            'archived_count': archived_count,
+            'oldest_closed_at': oldest_closed_at,
+            'newest_closed_at': newest_closed_at,
+        }
+    
+    # SLA methods
+    # Statuses whose age counts against the SLA; Pending Feedback waits on the creator
+    SLA_STATUSES = ('Open', 'In Progress')
+    
+    DEFAULT_SLA_RULES = (
+        ('Critical', 4),
+        ('High', 24),
+        ('Medium', 72),
+        ('Low', 168),
+    )
+    
+    def _sla_breach_query(self, select: str) -> str:
+        """Escalations in one (status, urgency) created before a cutoff with no breach recorded
+        
+        A breach is recorded once per status and current tier, so an escalation
+        that moves on can breach again.
+        """
+        return f'''
+            SELECT {select}
+            FROM escalations e
+            WHERE e.status = ? AND e.urgency = ? AND e.created_at_epoch < ?
+              AND NOT EXISTS (SELECT 1 FROM sla_breaches b
+                              WHERE b.escalation_id = e.id AND b.status = e.status
+                                AND b.tier_id = e.current_tier_id)
+        '''
+    
+    def _sla_cutoffs(self, cursor, now: datetime) -> List[Tuple[str, str, int, bool]]:
+        """(status, urgency, created_at epoch cutoff, auto_escalate) for every SLA rule"""
+        cursor.execute('SELECT urgency, max_open_hours, auto_escalate FROM sla_rules')
+        return [(status, urgency, int((now - timedelta(hours=max_open_hours)).timestamp()),
+                 bool(auto_escalate) and status == 'Open')
+                for urgency, max_open_hours, auto_escalate in cursor.fetchall()
+                for status in self.SLA_STATUSES]
+    
+    def _sla_tier_lead(self, cursor, tier_id: str) -> Optional[str]:
+        """The active person in a tier who handles SLA auto-escalations, preferring leads and managers"""
+        cursor.execute('''
+            SELECT p.id FROM people p
+            WHERE p.tier_id = ? AND p.is_active = 1
+            ORDER BY CASE p.role WHEN 'lead' THEN 0 WHEN 'manager' THEN 1 WHEN 'admin' THEN 2 ELSE 3 END, p.name
+            LIMIT 1
+        ''', (tier_id,))
+        result = cursor.fetchone()
+        return result[0] if result else None
+    
+    def _sla_escalation_target(self, cursor, tier_id: str) -> Tuple[Optional[str], Optional[str]]:
+        """Tier an SLA breach in tier_id escalates to, and the person to assign there
+        
+        Like the Escalate form, only tiers at a higher level qualify (in this model
+        a tier's parent is the level below it). The tier's own sub-tiers come
+        first, then the nearest levels; the first with someone active is picked.
+        Returns (None, None) when no tier is higher, or (tier id, None) when none
+        of the higher tiers has an active person.
+        """
+        cursor.execute('''
+            SELECT t.id
+            FROM tiers t JOIN tiers breached ON breached.id = ?
+            WHERE t.level > breached.level
+            ORDER BY t.parent_tier_id IS breached.id DESC, t.level, t.name
+        ''', (tier_id,))
+        candidates = [row[0] for row in cursor.fetchall()]
+        for candidate in candidates:
+            assignee = self._sla_tier_lead(cursor, candidate)
+            if assignee is not None:
+                return candidate, assignee
+        return (candidates[0] if candidates else None), None
+    
+    @instrumented
+    @exclusive_write
+    def scan_sla_breaches(self, batch_size: int = 500, max_batches: int = 20) -> Dict:
+        """Record SLA breaches and apply auto-escalation rules
+        
+        An Open or In Progress escalation breaches when it was created more than
+        its urgency's max_open_hours ago. Each batch of up to `batch_size`
+        breaches is recorded in its own transaction; Open breaches whose rule has
+        auto_escalate set are then escalated to a higher tier (see
+        _sla_escalation_target). The history records the escalation under its
+        assignee, or else the lead of the tier it breached in, rather than its
+        creator. Returns counts for this run and the backlog of breaches left for
+        the next.
+        """
+        start = time.perf_counter()
+        now = datetime.now(timezone.utc)
+        recorded = escalated = 0
+        # Per tier for this run: (target tier, assignee) and the breached tier's lead
+        targets, leads = {}, {}
+        for _ in range(max_batches):
+            breaches, to_escalate = [], []
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                for status, urgency, cutoff, auto_escalate in self._sla_cutoffs(cursor, now):
+                    if len(breaches) >= batch_size:
+                        break
+                    cursor.execute(self._sla_breach_query(
+                        "e.id, e.current_tier_id, e.assigned_to, e.created_by, (? - e.created_at_epoch) / 3600.0")
+                        + ' LIMIT ?', (int(now.timestamp()), status, urgency, cutoff,
+                                       batch_size - len(breaches)))
+                    for escalation_id, tier_id, assigned_to, created_by, hours_open in cursor.fetchall():
+                        action = 'Recorded'
+                        if auto_escalate:
+                            if tier_id not in targets:
+                                targets[tier_id] = self._sla_escalation_target(cursor, tier_id)
+                            target_tier_id, assignee = targets[tier_id]
+                            if target_tier_id is None:
+                                action = 'No higher tier'
+                            elif assignee is None:
+                                action = 'No one in higher tier'
+                            else:
+                                action = 'Auto-escalated'
+                                if tier_id not in leads:
+                                    leads[tier_id] = self._sla_tier_lead(cursor, tier_id)
+                                # Open escalations are rarely assigned; the creator is the last resort
+                                performed_by = assigned_to or leads[tier_id] or created_by
+                                to_escalate.append((escalation_id, target_tier_id, assignee, performed_by,
+                                                    hours_open))
+                        breaches.append((escalation_id, status, urgency, tier_id, hours_open, action))
+                if not breaches:
+                    break
+                cursor.executemany('''
+                    INSERT OR IGNORE INTO sla_breaches (escalation_id, status, urgency, tier_id, hours_open, action)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                ''', breaches)
+                conn.commit()
+            recorded += len(breaches)
+            
+            for escalation_id, target_tier_id, assignee, performed_by, hours_open in to_escalate:
+                # Refused when someone acted on the escalation after the breach was read
+                if self.escalate_to_next_tier(escalation_id, target_tier_id, assignee, performed_by,
+                                              notes=f"Auto-escalated: open {hours_open:.0f}h, past the SLA"):
+                    escalated += 1
+            if len(breaches) < batch_size:
+                break
+        
+        if recorded and self.cache is not None:
+            self.cache.bump()
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            backlog = 0
+            for status, urgency, cutoff, _ in self._sla_cutoffs(cursor, now):
+                cursor.execute(self._sla_breach_query('COUNT(*)'), (status, urgency, cutoff))
+                backlog += cursor.fetchone()[0]
+        return {
+            'breaches_recorded': recorded,
+            'auto_escalated': escalated,
+            'backlog': backlog,
+            'duration_ms': (time.perf_counter() - start) * 1000,
+        }
+    
+    def start_sla_scanner(self, interval_seconds: float = 60.0, batch_size: int = 500) -> SLAScanner:
+        """Start the background SLA scanner once for this DatabaseManager and return it
+        
+        Later calls return the running scanner, so every app rerun can call this.
+        """
+        with self._sla_scanner_lock:
+            if self._sla_scanner is None or not self._sla_scanner.is_alive():
+                self._sla_scanner = SLAScanner(self, interval_seconds, batch_size)
+                self._sla_scanner.start()
+            return self._sla_scanner
+    
+    def get_sla_scanner_status(self) -> Optional[Dict]:
+        """Get the background SLA scanner's status, or None when it has not been started"""
+        return self._sla_scanner.status() if self._sla_scanner is not None else None
+    
+    @instrumented
+    @cached_read
+    def get_sla_rules(self) -> pd.DataFrame:
+        """Get the SLA threshold and auto-escalation flag for every urgency"""
+        with self.get_connection() as conn:
+            return pd.read_sql_query('''
+                SELECT urgency, max_open_hours, auto_escalate
+                FROM sla_rules
+                ORDER BY max_open_hours
+            ''', conn)
+    
+    @instrumented
+    @invalidates_cache
+    @queued_write
+    def update_sla_rule(self, urgency: str, max_open_hours: float, auto_escalate: bool) -> bool:
+        """Change the SLA threshold and auto-escalation flag for an urgency"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                UPDATE sla_rules SET max_open_hours = ?, auto_escalate = ?
+                WHERE urgency = ?
+            ''', (max_open_hours, int(auto_escalate), urgency))
+            return cursor.rowcount > 0
+    
+    @instrumented
+    @cached_read
+    def get_sla_breaches(self, limit: int = 100) -> pd.DataFrame:
+        """Get the most recently detected SLA breaches with escalation and tier names"""
+        with self.get_connection() as conn:
+            return pd.read_sql_query('''
+                SELECT b.*, e.title, t.name as tier_name
+                FROM sla_breaches b
+                LEFT JOIN escalations e ON e.id = b.escalation_id
+                LEFT JOIN tiers t ON t.id = b.tier_id
+                ORDER BY b.id DESC
+                LIMIT ?
+            ''', conn, params=(limit,))
+    
+    # Daily snapshot methods
+    SNAPSHOT_STATUSES = ('Open', 'In Progress', 'Pending Feedback', 'Closed')
+    SNAPSHOT_URGENCIES = ('Low', 'Medium', 'High', 'Critical')
+    # End-of-day escalation counts per status and urgency, e.g. open_low or pending_feedback_critical
+    SNAPSHOT_STATE_COLUMNS = tuple(f"{status.lower().replace(' ', '_')}_{urgency.lower()}"
+                                   for status, urgency in itertools.product(SNAPSHOT_STATUSES, SNAPSHOT_URGENCIES))
+    # Counts of events during the day, and resolution days of the escalations closed that day
+    SNAPSHOT_FLOW_COLUMNS = ('created_count', 'escalated_count', 'closed_count')
+    SNAPSHOT_RESOLUTION_COLUMNS = ('resolution_p50_days', 'resolution_p90_days')
+    
+    # Tie-break for history events recorded in the same second
+    HISTORY_ACTION_ORDER = {'Created': 0, 'Escalated': 1, 'Feedback Provided': 2, 'Returned to Creator': 3, 'Closed': 4}
+    
+    def _load_history_events(self, conn, since: Optional[str] = None) -> pd.DataFrame:
+        """Every live and archived history event with its escalation's fixed attributes
+        
+        With `since`, only escalations with an event on or after that time are loaded.
+        Events are sorted by escalation and time, and carry the escalation's
+        status and tier after (`status`, `tier_id`) and before (`tier_before`)
+        the event. Escalations only change tier when they are created,
+        escalated (to target_tier_id) or returned (to source_tier_id).
+        """
+        where, params = '', []
+        if since:
+            where = '''WHERE {key} IN (SELECT escalation_key FROM escalation_history WHERE timestamp >= ?
+                                 UNION
+                                 SELECT escalation_key FROM escalation_history_archive WHERE timestamp >= ?)'''
+            params = [since, since]
+        # Two plain scans and a merge on the integer keys in pandas are faster than joining in SQLite
+        history = pd.read_sql_query(f'''
+            SELECT escalation_key, action, to_status, timestamp_epoch AS timestamp
+            FROM escalation_history {where.format(key='escalation_key')}
+            UNION ALL
+            SELECT escalation_key, action, to_status, timestamp_epoch AS timestamp
+            FROM escalation_history_archive {where.format(key='escalation_key')}
+        ''', conn, params=params * 2)
+        escalations = pd.read_sql_query(f'''
+            SELECT key AS escalation_key, id AS escalation_id, urgency, source_tier_id, target_tier_id,
+                   created_at_epoch AS created_at
+            FROM escalations {where.format(key='key')}
+            UNION ALL
+            SELECT key AS escalation_key, id AS escalation_id, urgency, source_tier_id, target_tier_id,
+                   created_at_epoch AS created_at
+            FROM escalations_archive {where.format(key='key')}
+        ''', conn, params=params * 2)
+        events = history.merge(escalations, on='escalation_key')
+        events['timestamp'] = pd.to_datetime(events['timestamp'], unit='s')
+        events['created_at'] = pd.to_datetime(events['created_at'], unit='s')
+        steps = events['action'].map(self.HISTORY_ACTION_ORDER).fillna(len(self.HISTORY_ACTION_ORDER)).to_numpy()
+        order = np.lexsort((steps, events['timestamp'].to_numpy(), events['escalation_key'].to_numpy()))
+        events = events.take(order).reset_index(drop=True)
+        
+        # Rows are grouped by escalation, so a forward fill never crosses escalations
+        # once every escalation's first row has a value
+        first = events['escalation_key'].ne(events['escalation_key'].shift())
+        action = events['action']
+        tier_id = pd.Series(np.select(
+            [action == 'Created', action == 'Escalated', action == 'Returned to Creator'],
+            [events['source_tier_id'], events['target_tier_id'], events['source_tier_id']],
+            default=None), index=events.index)
+        events['tier_id'] = tier_id.where(~first | tier_id.notna(), events['source_tier_id']).ffill()
+        events['status'] = events['to_status'].where(~first | events['to_status'].notna(), 'Open').ffill()
+        events['tier_before'] = events['tier_id'].shift().where(~first, events['tier_id'])
+        events['first'] = first
+        return events
+    
+    def _compute_daily_snapshots(self, events: pd.DataFrame, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+        """Per (snapshot_date, tier_id) rows for every day from start to end, from sorted history events"""
+        if events.empty:
+            return pd.DataFrame(columns=['snapshot_date', 'tier_id'] + list(self.SNAPSHOT_STATE_COLUMNS) +
+                                list(self.SNAPSHOT_FLOW_COLUMNS) + list(self.SNAPSHOT_RESOLUTION_COLUMNS))
+        days = pd.date_range(start, end, freq='D')
+        one_day = pd.Timedelta(days=1)
+        
+        # Each event's state holds until the escalation's next event; it is the
+        # end-of-day state for days [day of event, day of next event)
+        next_timestamp = events['timestamp'].shift(-1).where(~events['first'].shift(-1, fill_value=True))
+        first_day = events['timestamp'].dt.normalize().clip(lower=start)
+        stop_day = next_timestamp.dt.normalize().fillna(end + one_day).clip(upper=end + one_day)
+        spans = events.assign(first_day=first_day, stop_day=stop_day)[first_day < stop_day]
+        state_key = ['tier_id', 'status', 'urgency']
+        deltas = pd.concat([
+            spans[state_key].assign(day=spans['first_day'], delta=1),
+            spans.loc[spans['stop_day'] <= end, state_key].assign(day=spans['stop_day'], delta=-1),
+        ])
+        state = (deltas.groupby(['day'] + state_key)['delta'].sum()
+                 .unstack(state_key, fill_value=0)
+                 .reindex(days, fill_value=0)
+                 .cumsum())
+        state.index.name = 'day'
+        state = state.stack('tier_id', future_stack=True).fillna(0)
+        state.columns = [f"{status.lower().replace(' ', '_')}_{urgency.lower()}" for status, urgency in state.columns]
+        state = state.reindex(columns=list(self.SNAPSHOT_STATE_COLUMNS), fill_value=0)
+        
+        # Events during the range
+        day_events = events[(events['timestamp'] >= start) & (events['timestamp'] < end + one_day)]
+        day_events = day_events.assign(day=day_events['timestamp'].dt.normalize())
+        created = day_events[day_events['action'] == 'Created'].groupby(['day', 'tier_id']).size()
+        escalated = day_events[day_events['action'] == 'Escalated'].groupby(['day', 'tier_before']).size()
+        closed = day_events[day_events['action'] == 'Closed']
+        closed = closed.assign(resolution_days=(closed['timestamp'] - closed['created_at']) / one_day)
+        closed_by_tier = closed.groupby(['day', 'tier_before'])['resolution_days']
+        flows = pd.DataFrame({
+            'created_count': created.rename_axis(['day', 'tier_id']),
+            'escalated_count': escalated.rename_axis(['day', 'tier_id']),
+            'closed_count': closed_by_tier.size().rename_axis(['day', 'tier_id']),
+            'resolution_p50_days': closed_by_tier.quantile(0.5).rename_axis(['day', 'tier_id']),
+            'resolution_p90_days': closed_by_tier.quantile(0.9).rename_axis(['day', 'tier_id']),
+        })
+        
+        snapshots = state.join(flows, how='outer')
+        counts = list(self.SNAPSHOT_STATE_COLUMNS) + list(self.SNAPSHOT_FLOW_COLUMNS)
+        snapshots[counts] = snapshots[counts].fillna(0).astype(int)
+        # Tiers with nothing in them that day are left out
+        snapshots = snapshots[snapshots[counts].any(axis=1)].reset_index()
+        snapshots['day'] = snapshots['day'].dt.strftime('%Y-%m-%d')
+        return snapshots.rename(columns={'day': 'snapshot_date'})
+    
+    def _write_daily_snapshots(self, cursor, snapshots: pd.DataFrame, start: pd.Timestamp, end: pd.Timestamp):
+        """Replace the stored snapshots for start..end with these rows"""
+        columns = ['snapshot_date', 'tier_id'] + list(self.SNAPSHOT_STATE_COLUMNS) + \
+                  list(self.SNAPSHOT_FLOW_COLUMNS) + list(self.SNAPSHOT_RESOLUTION_COLUMNS)
+        cursor.execute('DELETE FROM daily_tier_snapshots WHERE snapshot_date BETWEEN ? AND ?',
+                       (start.strftime('%Y-%m-%d'), end.strftime('%Y-%m-%d')))
+        cursor.executemany(f'''
+            INSERT INTO daily_tier_snapshots ({', '.join(columns)})
+            VALUES ({', '.join('?' * len(columns))})
+        ''', snapshots[columns].astype(object).where(snapshots[columns].notna(), None).itertuples(index=False))
+    
+    @instrumented
+    @invalidates_cache
+    @exclusive_write
+    def build_daily_snapshots(self, start_date: Optional[str] = None, end_date: Optional[str] = None) -> int:
+        """Write the daily tier snapshots for start_date..end_date (inclusive), replacing existing rows
+        
+        Snapshots are replayed from the whole live and archived escalation
+        history, so the job is idempotent and also backfills: start_date
+        defaults to the day of the first history event and end_date to today
+        (UTC). Returns the number of rows written.
+        """
+        with self.get_connection() as conn:
+            events = self._load_history_events(conn)
+            if events.empty:
+                return 0
+            start = pd.Timestamp(start_date) if start_date else events['timestamp'].min().normalize()
+            end = pd.Timestamp(end_date) if end_date else pd.Timestamp(datetime.now(timezone.utc).date())
+            snapshots = self._compute_daily_snapshots(events, start, end)
+            self._write_daily_snapshots(conn.cursor(), snapshots, start, end)
+            conn.commit()
+            return len(snapshots)
+    
+    @instrumented
+    @invalidates_cache
+    @exclusive_write
+    def snapshot_daily(self) -> int:
+        """Refresh yesterday's and today's snapshots; run daily or more often
+        
+        Only escalations with history since yesterday are replayed. Their states
+        on the day before yesterday are swapped out of that day's stored
+        snapshot, which then stands in for every other escalation. Without that
+        snapshot this falls back to a full build_daily_snapshots of the two days.
+        Rows of escalations deleted since the base day linger until a full rebuild.
+        """
+        end = pd.Timestamp(datetime.now(timezone.utc).date())
+        start = end - pd.Timedelta(days=1)
+        base_day = start - pd.Timedelta(days=1)
+        state = list(self.SNAPSHOT_STATE_COLUMNS)
+        with self.get_connection() as conn:
+            base = pd.read_sql_query('SELECT * FROM daily_tier_snapshots WHERE snapshot_date = ?', conn,
+                                     params=(base_day.strftime('%Y-%m-%d'),))
+            if base.empty:
+                return self.build_daily_snapshots(start.strftime('%Y-%m-%d'), end.strftime('%Y-%m-%d'))
+            
+            events = self._load_history_events(conn, since=start.strftime('%Y-%m-%d'))
+            recent = self._compute_daily_snapshots(events, base_day, end)
+            
+            def recent_rows(day):
+                return recent[recent['snapshot_date'] == day].drop(columns='snapshot_date').set_index('tier_id')
+            
+            offset = base.set_index('tier_id')[state].sub(recent_rows(base_day.strftime('%Y-%m-%d'))[state],
+                                                          fill_value=0)
+            days = []
+            for day in pd.date_range(start, end, freq='D').strftime('%Y-%m-%d'):
+                day_rows = recent_rows(day)
+                day_rows = day_rows.reindex(offset.index.union(day_rows.index))
+                day_rows[state] = day_rows[state].fillna(0).add(offset.reindex(day_rows.index, fill_value=0))
+                days.append(day_rows.assign(snapshot_date=day))
+            snapshots = pd.concat(days).rename_axis('tier_id').reset_index()
+            counts = state + list(self.SNAPSHOT_FLOW_COLUMNS)
+            snapshots[counts] = snapshots[counts].fillna(0).astype(int)
+            snapshots = snapshots[snapshots[counts].any(axis=1)]
+            
+            self._write_daily_snapshots(conn.cursor(), snapshots, start, end)
+            conn.commit()
+            return len(snapshots)
+    
+    @instrumented
+    @cached_read
+    def get_daily_snapshots(self, start_date: Optional[str] = None, end_date: Optional[str] = None,
+                            tier_id: Optional[str] = None, include_subtree: bool = False) -> pd.DataFrame:
+        """Get one row per day of snapshot totals, for all tiers or one tier (and its subtree)
+        
+        Besides the stored columns, `<status>_total` sums each status over the
+        urgencies. Resolution percentiles cannot be combined across tiers, so
+        they are only filled in for a single tier without its subtree.
+        """
+        sums = ', '.join(f"SUM({column}) AS {column}"
+                         for column in self.SNAPSHOT_STATE_COLUMNS + self.SNAPSHOT_FLOW_COLUMNS)
+        single_tier = bool(tier_id) and not include_subtree
+        resolution = ', '.join(f"{f'MAX({column})' if single_tier else 'NULL'} AS {column}"
+                               for column in self.SNAPSHOT_RESOLUTION_COLUMNS)
+        query = f'''
+            SELECT snapshot_date, {sums}, {resolution}
+            FROM daily_tier_snapshots
+            WHERE 1=1
+        '''
+        params = []
+        if start_date:
+            query += ' AND snapshot_date >= ?'
+            params.append(start_date)
+        if end_date:
+            query += ' AND snapshot_date <= ?'
+            params.append(end_date)
+        if tier_id and include_subtree:
+            query += ' AND tier_id IN (SELECT descendant_id FROM tier_closure WHERE ancestor_id = ?)'
+            params.append(tier_id)
+        elif tier_id:
+            query += ' AND tier_id = ?'
+            params.append(tier_id)
+        query += ' GROUP BY snapshot_date ORDER BY snapshot_date'
+        
+        with self.get_connection() as conn:
+            snapshots = pd.read_sql_query(query, conn, params=params)
+        for status in self.SNAPSHOT_STATUSES:
+            slug = status.lower().replace(' ', '_')
+            snapshots[f"{slug}_total"] = snapshots[[f"{slug}_{urgency.lower()}"
+                                                    for urgency in self.SNAPSHOT_URGENCIES]].sum(axis=1)
+        return snapshots
+    
+    # Time-in-status methods
+    def _compute_status_durations(self, events: pd.DataFrame) -> pd.DataFrame:
+        """One row per stay of an escalation in a status and tier, from sorted history events
+        
+        A stay ends at the escalation's next event, which is recorded as ended_by
+        along with the tier it moved to. Stays that have not ended yet have no
+        ended_at or duration. Closed is final, so it has no stays.
+        """
+        positions = np.arange(len(events))
+        first = events['first'].to_numpy()
+        last = np.append(first[1:], True)
+        # Position of each escalation's first event, to number events within an escalation
+        group_start = np.maximum.accumulate(np.where(first, positions, 0))
+        
+        durations = pd.DataFrame({
+            'escalation_id': events['escalation_id'],
+            'seq': positions - group_start,
+            'status': events['status'],
+            'tier_id': events['tier_id'],
+            'urgency': events['urgency'],
+            'started_at': events['timestamp'],
+            'ended_at': events['timestamp'].shift(-1).where(~last),
+            'ended_by': events['action'].shift(-1).where(~last),
+            'next_tier_id': events['tier_id'].shift(-1).where(~last),
+        })
+        durations['duration_hours'] = (durations['ended_at'] - durations['started_at']) / pd.Timedelta(hours=1)
+        durations = durations[durations['status'] != 'Closed']
+        for column in ('started_at', 'ended_at'):
+            durations[column] = durations[column].dt.strftime('%Y-%m-%d %H:%M:%S')
+        return durations
+    
+    @instrumented
+    @exclusive_write
+    def refresh_status_durations(self, full: bool = False) -> int:
+        """Extend escalation_status_durations with the history recorded since the last refresh
+        
+        Escalations with new events are recomputed from their whole history;
+        `full` recomputes every escalation. Returns the number of rows written.
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT setting_value FROM admin_settings WHERE setting_name = "status_durations_through"')
+            result = cursor.fetchone()
+            since = None if full or not result else result[0]
+            events = self._load_history_events(conn, since=since)
+            if events.empty:
+                return 0
+            durations = self._compute_status_durations(events)
+            
+            if since is None:
+                cursor.execute('DELETE FROM escalation_status_durations')
+            else:
+                cursor.executemany('DELETE FROM escalation_status_durations WHERE escalation_id = ?',
+                                   ((escalation_id,) for escalation_id in events['escalation_id'].unique()))
+            columns = list(durations.columns)
+            cursor.executemany(f'''
+                INSERT INTO escalation_status_durations ({', '.join(columns)})
+                VALUES ({', '.join('?' * len(columns))})
+            ''', durations.astype(object).where(durations.notna(), None).itertuples(index=False))
+            # Events in the same second as the watermark are replayed again next time, which is harmless
+            cursor.execute('''
+                INSERT INTO admin_settings (setting_name, setting_value) VALUES ("status_durations_through", ?)
+                ON CONFLICT (setting_name) DO UPDATE SET setting_value = excluded.setting_value,
+                                                         updated_at = CURRENT_TIMESTAMP
+            ''', (events['timestamp'].max().strftime('%Y-%m-%d %H:%M:%S'),))
+            conn.commit()
+        if self.cache is not None:
+            self.cache.bump()
+        return len(durations)
+    
+    @instrumented
+    @cached_read
+    def get_time_in_status(self, tier_id: Optional[str] = None, include_subtree: bool = False) -> pd.DataFrame:
+        """Get completed stays per tier and status: count, average and total hours
+        
+        With `tier_id` only stays in that tier (and with `include_subtree` the
+        tiers below it) are counted.
+        """
+        query = '''
+            SELECT d.tier_id, t.name AS tier_name, d.status,
+                   COUNT(*) AS stays,
+                   AVG(d.duration_hours) AS avg_hours,
+                   SUM(d.duration_hours) AS total_hours
+            FROM escalation_status_durations d
+            JOIN tiers t ON t.id = d.tier_id
+            WHERE d.duration_hours IS NOT NULL
+        '''
+        params = []
+        if tier_id and include_subtree:
+            query += ' AND d.tier_id IN (SELECT descendant_id FROM tier_closure WHERE ancestor_id = ?)'
+            params.append(tier_id)
+        elif tier_id:
+            query += ' AND d.tier_id = ?'
+            params.append(tier_id)
+        query += ' GROUP BY d.tier_id, t.name, d.status'
+        
+        with self.get_connection() as conn:
+            return pd.read_sql_query(query, conn, params=params)
+    
+    @instrumented
+    @cached_read
+    def get_handoff_latency(self) -> pd.DataFrame:
+        """Get hours escalations stayed Open in a tier before being escalated, per source and target tier"""
+        with self.get_connection() as conn:
+            return pd.read_sql_query('''
+                SELECT st.name AS from_tier_name, tt.name AS to_tier_name,
+                       COUNT(*) AS handoffs,
+                       AVG(d.duration_hours) AS avg_hours,
+                       MAX(d.duration_hours) AS max_hours
+                FROM escalation_status_durations d
+                JOIN tiers st ON st.id = d.tier_id
+                JOIN tiers tt ON tt.id = d.next_tier_id
+                WHERE d.status = 'Open' AND d.ended_by = 'Escalated'
+                GROUP BY d.tier_id, d.next_tier_id
+                ORDER BY avg_hours DESC
+            ''', conn)
+    
+    @instrumented
+    @cached_read
+    def get_feedback_round_trip(self) -> pd.DataFrame:
+        """Get hours from escalation until feedback came back, per tier that gave the feedback"""
+        with self.get_connection() as conn:
+            return pd.read_sql_query('''
+                SELECT t.name AS tier_name, d.urgency,
+                       COUNT(*) AS round_trips,
+                       AVG(d.duration_hours) AS avg_hours,
+                       MAX(d.duration_hours) AS max_hours
+                FROM escalation_status_durations d
+                JOIN tiers t ON t.id = d.tier_id
+                WHERE d.status = 'In Progress' AND d.ended_by IN ('Returned to Creator', 'Feedback Provided')
+                GROUP BY d.tier_id, d.urgency
+                ORDER BY avg_hours DESC
+            ''', conn)
     
     def _add_escalation_history(self, cursor, escalation_id: str, action: str, performed_by: str, 
                                from_status: Optional[str], to_status: Optional[str], notes: str = ""):
         """Add an entry to the escalation history"""
-        history_id = str(uuid.uuid4())
-        cursor.execute('''
-            INSERT INTO escalation_history (id, escalation_id, action, performed_by, from_status, to_status, notes)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (history_id, escalation_id, action, performed_by, from_status, to_status, notes))
+        cursor.execute(f'''
+            INSERT INTO escalation_history (escalation_key, action, performed_by, from_status, to_status, notes)
+            VALUES ({self.ESCALATION_KEY}, ?, ?, ?, ?, ?)
+        ''', (escalation_id, action, performed_by, from_status, to_status, notes))
     
-    def get_escalation_history(self, escalation_id: str) -> pd.DataFrame:
-        """Get history for a specific escalation"""
+    @instrumented
+    @cached_read
+    def get_escalation_history(self, escalation_id: str, include_archived: bool = False) -> pd.DataFrame:
+        """Get history for a specific escalation, optionally looking in the archive too"""
+        sources = [('escalations', 'escalation_history')]
+        if include_archived:
+            sources.append(('escalations_archive', 'escalation_history_archive'))
+        query = ' UNION ALL '.join(f'''
+            SELECT {self.HISTORY_COLUMNS.format(escalation_id='e.id')}, p.name as performed_by_name
+            FROM {table} e
+            JOIN {history_table} eh ON eh.escalation_key = e.key
+            JOIN people p ON eh.performed_by = p.id
+            WHERE e.id = ?
+        ''' for table, history_table in sources)
         with self.get_connection() as conn:
-            return pd.read_sql_query('''
-                SELECT eh.*, p.name as performed_by_name
-                FROM escalation_history eh
-                JOIN people p ON eh.performed_by = p.id
-                WHERE eh.escalation_id = ?
-                ORDER BY eh.timestamp DESC
-            ''', conn, params=(escalation_id,))
+            return pd.read_sql_query(f'{query} ORDER BY timestamp DESC', conn,
+                                     params=[escalation_id] * len(sources))
+
+# The app's shared database manager, opened on first use so that importing this
+# module (e.g. from manage.py with another --db) never creates or migrates the
+# default database file
+_default_db = None
+_default_db_lock = threading.Lock()
+
+def get_db() -> DatabaseManager:
+    """Get the shared DatabaseManager for accountability_dashboard.db, creating it on the first call"""
+    global _default_db
+    with _default_db_lock:
+        if _default_db is None:
+            _default_db = DatabaseManager()
+        return _default_db
 
-# Initialize database manager
-db = DatabaseManager()
\ No newline at end of file
+def __getattr__(name):
+    # `from database import db` still works, and opens the default database only then
+    if name == 'db':
+        return get_db()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
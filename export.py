@@ -0,0 +1,176 @@
+"""
+Columnar Export for Tiered Accountability Dashboard
+
+Writes escalations, escalation history, tiers and people as Parquet files so
+heavy reporting can run without touching the live SQLite database, and loads
+them back memory-mapped:
+
+    python3 manage.py export-parquet --out analytics_export
+    
+    from export import load_export
+    escalations = load_export("analytics_export", "escalations", months=["2025-01", "2025-02"])
+
+Escalations and their history are partitioned by month and source tier
+(month=YYYY-MM/tier=<tier id>/) and appended incrementally: each run only
+writes rows updated since the previous one. Tiers and people are small and
+are rewritten on every run. Needs pyarrow (pip install pyarrow).
+"""
+
+import json
+import os
+import shutil
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:
+    # Only the export needs pyarrow, so the dashboard runs without it
+    pa = ds = pq = None
+
+from database import DatabaseManager
+
+STATE_FILE = "_export_state.json"
+CHUNK_SIZE = 100000
+
+ESCALATION_COLUMNS = ['id', 'title', 'description', 'urgency', 'status', 'created_by', 'assigned_to',
+                      'source_tier_id', 'target_tier_id', 'current_tier_id', 'created_at', 'updated_at',
+                      'escalated_at', 'resolved_at', 'closed_at', 'feedback']
+HISTORY_COLUMNS = ['id', 'escalation_id', 'action', 'performed_by', 'from_status', 'to_status', 'notes', 'timestamp']
+TIMESTAMP_COLUMNS = {'created_at', 'updated_at', 'escalated_at', 'resolved_at', 'closed_at', 'timestamp'}
+
+# Partitioned tables: (query over the live and archived rows, with a watermark parameter for
+# each, and the watermark column that also picks the latest copy of a row appended twice)
+PARTITIONED_TABLES = {
+    'escalations': (' UNION ALL '.join(f'''
+        SELECT {', '.join(ESCALATION_COLUMNS)},
+               strftime('%Y-%m', created_at) AS month, source_tier_id AS tier
+        FROM {table}
+        WHERE updated_at >= ?
+    ''' for table in ('escalations', 'escalations_archive')), 'updated_at'),
+    # History is stored by escalation key; ids are integers since migration 4, exported
+    # as text so files appended before it still share one schema
+    'escalation_history': (' UNION ALL '.join(f'''
+        SELECT CAST(h.id AS TEXT) AS id, e.id AS escalation_id,
+               {', '.join('h.' + column for column in HISTORY_COLUMNS[2:])},
+               strftime('%Y-%m', h.timestamp) AS month, e.source_tier_id AS tier
+        FROM {history} h
+        JOIN {escalations} e ON e.key = h.escalation_key
+        WHERE h.timestamp >= ?
+    ''' for history, escalations in (('escalation_history', 'escalations'),
+                                     ('escalation_history_archive', 'escalations_archive'))), 'timestamp'),
+}
+
+SNAPSHOT_TABLES = {
+    'tiers': 'SELECT id, name, level, parent_tier_id, description, created_at FROM tiers',
+    'people': 'SELECT id, name, email, tier_id, role, created_at FROM people',
+}
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError("Parquet export needs pyarrow: pip install pyarrow")
+
+def _schema(columns: List[str]) -> "pa.Schema":
+    """Fix every column's type so chunks with all-NULL columns still match the other files"""
+    return pa.schema([(column, pa.timestamp('us') if column in TIMESTAMP_COLUMNS
+                       else pa.int64() if column == 'level' else pa.string())
+                      for column in columns])
+
+def _to_arrow(chunk: pd.DataFrame) -> "pa.Table":
+    chunk = chunk.assign(**{column: pd.to_datetime(chunk[column], format='ISO8601')
+                            for column in TIMESTAMP_COLUMNS.intersection(chunk.columns)})
+    return pa.Table.from_pandas(chunk, schema=_schema(list(chunk.columns)), preserve_index=False)
+
+def _read_state(out_dir: str) -> Dict:
+    path = os.path.join(out_dir, STATE_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+def _write_state(out_dir: str, state: Dict):
+    path = os.path.join(out_dir, STATE_FILE)
+    with open(path + '.tmp', 'w') as f:
+        json.dump(state, f, indent=2)
+    os.replace(path + '.tmp', path)
+
+def export_parquet(db: DatabaseManager, out_dir: str, full: bool = False) -> Dict[str, int]:
+    """Export the database to Parquet under `out_dir` and return the rows written per table
+    
+    Escalations updated and history recorded since the previous export are
+    appended as new files; `full` (or a first export) rewrites everything, which
+    also drops escalations deleted since and compacts the appended files.
+    Watermarks are kept in out_dir/_export_state.json.
+    """
+    _require_pyarrow()
+    os.makedirs(out_dir, exist_ok=True)
+    state = {} if full else _read_state(out_dir)
+    run_id = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S')
+    counts = {}
+    
+    with db.get_connection() as conn:
+        for table, (query, watermark_column) in PARTITIONED_TABLES.items():
+            root = os.path.join(out_dir, table)
+            if table not in state and os.path.exists(root):
+                shutil.rmtree(root)
+            # Rows in the same second as the watermark are written again; load_export keeps one copy
+            since = state.get(table, '')
+            written = 0
+            for index, chunk in enumerate(pd.read_sql_query(query, conn, params=(since, since),
+                                                             chunksize=CHUNK_SIZE)):
+                pq.write_to_dataset(_to_arrow(chunk), root, partition_cols=['month', 'tier'],
+                                    basename_template=f"part-{run_id}-{index}-{{i}}.parquet")
+                latest = pd.to_datetime(chunk[watermark_column], format='ISO8601').max()
+                state[table] = max(state.get(table, ''), latest.strftime('%Y-%m-%d %H:%M:%S'))
+                written += len(chunk)
+            state.setdefault(table, since)
+            counts[table] = written
+        
+        for table, query in SNAPSHOT_TABLES.items():
+            arrow_table = _to_arrow(pd.read_sql_query(query, conn))
+            path = os.path.join(out_dir, f"{table}.parquet")
+            pq.write_table(arrow_table, path + '.tmp')
+            os.replace(path + '.tmp', path)
+            counts[table] = arrow_table.num_rows
+    
+    state['exported_at'] = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+    _write_state(out_dir, state)
+    return counts
+
+def load_export(out_dir: str, table: str, months: Optional[List[str]] = None,
+                tier_ids: Optional[List[str]] = None, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """Load an exported table into pandas, memory-mapping the Parquet files
+    
+    For escalations and escalation_history, `months` ('YYYY-MM') and
+    `tier_ids` (source tiers) prune partitions before any file is read, and
+    rows appended by more than one export are returned once, latest version.
+    """
+    _require_pyarrow()
+    if table in SNAPSHOT_TABLES:
+        return pq.read_table(os.path.join(out_dir, f"{table}.parquet"), columns=columns,
+                             memory_map=True).to_pandas()
+    if table not in PARTITIONED_TABLES:
+        raise ValueError(f"Unknown export table: {table}")
+    
+    filters = []
+    if months:
+        filters.append(('month', 'in', list(months)))
+    if tier_ids:
+        filters.append(('tier', 'in', list(tier_ids)))
+    watermark_column = PARTITIONED_TABLES[table][1]
+    read_columns = None
+    if columns:
+        read_columns = list(dict.fromkeys([*columns, 'id', watermark_column]))
+    partitioning = ds.partitioning(pa.schema([('month', pa.string()), ('tier', pa.string())]), flavor='hive')
+    arrow_table = pq.read_table(os.path.join(out_dir, table), columns=read_columns, filters=filters or None,
+                                partitioning=partitioning, memory_map=True)
+    
+    df = arrow_table.to_pandas()
+    df = df.sort_values(watermark_column, kind='stable').drop_duplicates('id', keep='last')
+    if columns:
+        df = df[columns]
+    return df.reset_index(drop=True)
@@ -0,0 +1,238 @@
+"""
+Synthetic Data Generator for Tiered Accountability Dashboard
+
+Creates a deep tier hierarchy, people and escalations with realistic status,
+urgency and history distributions. Output is fully determined by the seed and
+the --as-of date (default: today), so two runs with the same arguments produce
+identical databases.
+
+    python3 generate_data.py --db load_test.db --tiers 200 --people 5000 --escalations 100000
+"""
+
+import argparse
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from database import DatabaseManager
+
+URGENCY_WEIGHTS = {'Low': 30, 'Medium': 40, 'High': 20, 'Critical': 10}
+ROLE_WEIGHTS = {'member': 85, 'lead': 10, 'manager': 4, 'admin': 1}
+
+# Where each escalation ends up: (final status, share of escalations)
+OUTCOME_WEIGHTS = {
+    'Open': 25,
+    'In Progress': 15,
+    'Pending Feedback': 15,
+    'Closed': 45,
+}
+
+def _uuid(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+def _timestamp(value: datetime) -> str:
+    return value.strftime('%Y-%m-%d %H:%M:%S')
+
+def _epoch(value: datetime) -> int:
+    return int(value.replace(tzinfo=timezone.utc).timestamp())
+
+def _generate_tiers(rng, count, branching):
+    """Build a tree where every tier has up to `branching` children one level down"""
+    tiers = []
+    for index in range(count):
+        parent = tiers[(index - 1) // branching] if index else None
+        level = parent['level'] + 1 if parent else 1
+        tiers.append({
+            'id': _uuid(rng),
+            'name': f"Tier L{level}-{index:04d}",
+            'level': level,
+            'parent_tier_id': parent['id'] if parent else None,
+            'description': f"Generated tier {index} at level {level}",
+            'children': [],
+        })
+        if parent:
+            parent['children'].append(tiers[-1])
+    return tiers
+
+def _generate_people(rng, count, tiers):
+    roles = list(ROLE_WEIGHTS)
+    role_weights = list(ROLE_WEIGHTS.values())
+    people = []
+    for index in range(count):
+        # Every tier gets at least one person before the rest are spread randomly
+        tier = tiers[index] if index < len(tiers) else rng.choice(tiers)
+        people.append({
+            'id': _uuid(rng),
+            'name': f"Person {index:06d}",
+            'email': f"person{index:06d}@example.com",
+            'tier_id': tier['id'],
+            'role': rng.choices(roles, role_weights)[0],
+        })
+    return people
+
+def _generate_escalation(rng, index, key, creator, tiers_by_id, people_by_tier, now, days):
+    """Simulate one escalation's workflow, returning its row and history rows (by escalation key)"""
+    source_tier = tiers_by_id[creator['tier_id']]
+    outcome = rng.choices(list(OUTCOME_WEIGHTS), list(OUTCOME_WEIGHTS.values()))[0]
+    created_at = now - timedelta(seconds=rng.randint(0, days * 86400))
+    row = {
+        'key': key,
+        'id': _uuid(rng),
+        'title': f"Generated escalation {index:07d}",
+        'description': f"Synthetic issue {index} raised in {source_tier['name']}. " * rng.randint(1, 6),
+        'urgency': rng.choices(list(URGENCY_WEIGHTS), list(URGENCY_WEIGHTS.values()))[0],
+        'status': 'Open',
+        'created_by': creator['id'],
+        'assigned_to': None,
+        'source_tier_id': source_tier['id'],
+        'target_tier_id': None,
+        'current_tier_id': source_tier['id'],
+        'created_at': created_at,
+        'updated_at': created_at,
+        'escalated_at': None,
+        'resolved_at': None,
+        'closed_at': None,
+        'feedback': None,
+    }
+    history = [(key, "Created", creator['id'], None, "Open", "", created_at)]
+    
+    def later(start):
+        return min(start + timedelta(hours=rng.expovariate(1 / 36)), now)
+    
+    if outcome == 'Open':
+        return row, history
+    
+    # Escalate to a tier one level down the hierarchy when there is one
+    targets = [tier for tier in source_tier['children'] if people_by_tier.get(tier['id'])]
+    escalated = bool(targets) and (outcome != 'Closed' or rng.random() < 0.7)
+    if escalated:
+        target = rng.choice(targets)
+        assignee = rng.choice(people_by_tier[target['id']])
+        row['escalated_at'] = later(created_at)
+        row.update(status='In Progress', target_tier_id=target['id'], assigned_to=assignee['id'],
+                   current_tier_id=target['id'], updated_at=row['escalated_at'])
+        history.append((key, "Escalated", creator['id'], "Open", "In Progress", "", row['escalated_at']))
+        if outcome == 'In Progress':
+            return row, history
+        
+        feedback = f"Resolved by {assignee['name']} after investigation."
+        row['resolved_at'] = later(row['escalated_at'])
+        row.update(status='Pending Feedback', feedback=feedback, current_tier_id=source_tier['id'],
+                   updated_at=row['resolved_at'])
+        history.append((key, "Returned to Creator", assignee['id'], "In Progress", "Pending Feedback",
+                        feedback, row['resolved_at']))
+        if outcome == 'Pending Feedback':
+            return row, history
+    
+    if outcome == 'Closed':
+        previous_status = row['status']
+        row['closed_at'] = later(row['resolved_at'] or created_at)
+        row.update(status='Closed', updated_at=row['closed_at'])
+        history.append((key, "Closed", creator['id'], previous_status, "Closed", "", row['closed_at']))
+    return row, history
+
+def generate_data(db: DatabaseManager, tiers: int = 20, people: int = 200, escalations: int = 2000,
+                  seed: int = 42, branching: int = 3, days: int = 365, as_of: datetime = None,
+                  batch_size: int = 10000) -> dict:
+    """Populate an empty database with synthetic data and return the row counts
+    
+    Timestamps fall in the `days` before `as_of` (UTC, default: start of today).
+    """
+    rng = random.Random(seed)
+    now = as_of or datetime.now(timezone.utc).replace(tzinfo=None, hour=0, minute=0, second=0, microsecond=0)
+    
+    tier_rows = _generate_tiers(rng, tiers, branching)
+    people_rows = _generate_people(rng, people, tier_rows)
+    tiers_by_id = {tier['id']: tier for tier in tier_rows}
+    people_by_tier = {}
+    for person in people_rows:
+        people_by_tier.setdefault(person['tier_id'], []).append(person)
+    
+    with db.get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.executemany('''
+            INSERT INTO tiers (id, name, level, parent_tier_id, description)
+            VALUES (?, ?, ?, ?, ?)
+        ''', [(t['id'], t['name'], t['level'], t['parent_tier_id'], t['description']) for t in tier_rows])
+        cursor.executemany('''
+            INSERT INTO people (id, name, email, tier_id, role)
+            VALUES (?, ?, ?, ?, ?)
+        ''', [(p['id'], p['name'], p['email'], p['tier_id'], p['role']) for p in people_rows])
+    
+    # The search index takes escalation tier paths from the closure
+    db.rebuild_tier_closure()
+    
+    history_count = 0
+    # Keys are assigned here so history rows can reference escalations in the same batch
+    with db.get_connection() as conn:
+        last_key = conn.execute("SELECT COALESCE(MAX(seq), 0) FROM sqlite_sequence "
+                                "WHERE name = 'escalations'").fetchone()[0]
+    # Indexing the batches as they are written is slower than one rebuild at the end
+    with db.deferred_search_index():
+        for start in range(0, escalations, batch_size):
+            escalation_batch, history_batch = [], []
+            for index in range(start, min(start + batch_size, escalations)):
+                row, history = _generate_escalation(rng, index, last_key + index + 1, rng.choice(people_rows),
+                                                    tiers_by_id, people_by_tier, now, days)
+                escalation_batch.append(row)
+                history_batch.extend(history)
+            
+            # Epoch columns are written directly, which skips the triggers that would fill them
+            timestamp_columns = ('created_at', 'updated_at', 'escalated_at', 'resolved_at', 'closed_at')
+            with db.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.executemany('''
+                    INSERT INTO escalations (key, id, title, description, urgency, status, created_by, assigned_to,
+                                             source_tier_id, target_tier_id, current_tier_id, created_at, updated_at,
+                                             escalated_at, resolved_at, closed_at, feedback,
+                                             created_at_epoch, updated_at_epoch, escalated_at_epoch,
+                                             resolved_at_epoch, closed_at_epoch)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', [(e['key'], e['id'], e['title'], e['description'], e['urgency'], e['status'], e['created_by'],
+                       e['assigned_to'], e['source_tier_id'], e['target_tier_id'], e['current_tier_id'],
+                       *(_timestamp(e[column]) if e[column] else None for column in timestamp_columns),
+                       e['feedback'],
+                       *(_epoch(e[column]) if e[column] else None for column in timestamp_columns))
+                      for e in escalation_batch])
+                cursor.executemany('''
+                    INSERT INTO escalation_history (escalation_key, action, performed_by, from_status, to_status, notes,
+                                                    timestamp, timestamp_epoch)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ''', [(*h[:-1], _timestamp(h[-1]), _epoch(h[-1])) for h in history_batch])
+            history_count += len(history_batch)
+    
+    # Rows were written directly, so derived tables are rebuilt in one pass
+    db.rebuild_escalation_counters()
+    db.build_daily_snapshots(end_date=now.date().isoformat())
+    db.refresh_status_durations(full=True)
+    with db.get_connection() as conn:
+        conn.execute('ANALYZE')
+    
+    return {'tiers': tiers, 'people': people, 'escalations': escalations, 'history': history_count}
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic data for load testing")
+    parser.add_argument("--db", default="load_test.db", help="Path to a new SQLite database")
+    parser.add_argument("--tiers", type=int, default=20)
+    parser.add_argument("--people", type=int, default=200)
+    parser.add_argument("--escalations", type=int, default=2000)
+    parser.add_argument("--branching", type=int, default=3, help="Child tiers per tier")
+    parser.add_argument("--days", type=int, default=365, help="Spread of created_at into the past")
+    parser.add_argument("--as-of", type=datetime.fromisoformat, default=None,
+                        help="End of the generated timeline (UTC), default start of today")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    
+    print(f"🔧 Generating data into {args.db} (seed {args.seed})...")
+    start = time.perf_counter()
+    db = DatabaseManager(args.db)
+    try:
+        counts = generate_data(db, args.tiers, args.people, args.escalations, args.seed, args.branching,
+                               args.days, args.as_of)
+    finally:
+        db.close()
+    print(f"✅ Created {counts['tiers']} tiers, {counts['people']} people, {counts['escalations']} escalations "
+          f"and {counts['history']} history rows in {time.perf_counter() - start:.1f}s")
+
+if __name__ == "__main__":
+    main()
@@ -5,10 +5,11 @@ This script creates sample tiers, people, and escalations to demonstrate
 the application functionality. Run this after the first app startup.
 """
 
-from database import db
+from database import get_db
 
 def init_sample_data():
     """Initialize sample data for demonstration"""
+    db = get_db()
     
     print("🔧 Initializing sample data for Tiered Accountability Dashboard...")
     
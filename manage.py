@@ -0,0 +1,164 @@
+"""
+Maintenance Commands for Tiered Accountability Dashboard
+
+Run database maintenance tasks from the command line, for example after
+upgrading an existing accountability_dashboard.db:
+
+    python3 manage.py migrate [--dry-run | --status]
+    python3 manage.py rebuild-counters
+    python3 manage.py rebuild-tier-closure
+    python3 manage.py rebuild-search-index
+    python3 manage.py archive --days 90
+    python3 manage.py restore <escalation id>
+    python3 manage.py sla-scan
+    python3 manage.py snapshot [--backfill]
+    python3 manage.py status-durations [--full]
+    python3 manage.py export-parquet --out analytics_export [--full]
+"""
+
+import argparse
+from database import DatabaseManager
+
+def migrate(db, args):
+    """Apply pending schema migrations before starting the app, or report what they would do"""
+    if args.status:
+        for migration in db.get_schema_migrations():
+            state = (f"applied {migration['applied_at']}, {migration['rows_touched']} rows in "
+                     f"{migration['duration_ms'] / 1000:.1f}s" if migration['applied_at'] else "pending")
+            print(f"{migration['version']:>4}  {migration['description']}: {state}")
+        return
+    if args.dry_run:
+        print("🔍 Estimating pending migrations (nothing is changed)...")
+        report = db.migrate(dry_run=True, batch_size=args.batch_size)
+        for migration in report:
+            print(f"{migration['version']:>4}  {migration['description']}: "
+                  f"~{migration['rows']} rows, ~{migration['seconds']:.1f}s")
+        print(f"✅ {len(report)} pending migrations, ~{sum(m['rows'] for m in report)} rows, "
+              f"~{sum(m['seconds'] for m in report):.1f}s")
+        return
+    print("🔧 Applying pending migrations...")
+    for migration in db.migrate(batch_size=args.batch_size):
+        print(f"{migration['version']:>4}  {migration['description']}: "
+              f"{migration['rows']} rows in {migration['seconds']:.1f}s")
+    print("🔧 Creating missing tables and indexes...")
+    db.init_database()
+    print("✅ Database is up to date")
+
+def rebuild_counters(db, args):
+    """Rebuild the per-tier escalation counters from the escalations table"""
+    print("🔧 Rebuilding escalation counters...")
+    rows = db.rebuild_escalation_counters()
+    print(f"✅ Rebuilt {rows} counter rows")
+
+def rebuild_tier_closure(db, args):
+    """Rebuild the tier ancestor/descendant closure table from parent_tier_id"""
+    print("🔧 Rebuilding tier closure...")
+    rows = db.rebuild_tier_closure()
+    print(f"✅ Rebuilt {rows} ancestor/descendant pairs")
+
+def rebuild_search_index(db, args):
+    """Re-index every escalation for full-text search"""
+    print("🔧 Rebuilding search index...")
+    rows = db.rebuild_search_index()
+    print(f"✅ Indexed {rows} escalations")
+
+def archive(db, args):
+    """Move old Closed escalations and their history into the archive tables"""
+    print(f"🔧 Archiving escalations closed more than {args.days} days ago...")
+    archived = db.archive_closed_escalations(args.days, args.batch_size)
+    print(f"✅ Archived {archived} escalations")
+
+def restore(db, args):
+    """Move an archived escalation and its history back to the live tables"""
+    if db.restore_escalation(args.escalation_id):
+        print(f"✅ Restored escalation {args.escalation_id}")
+    else:
+        print(f"❌ Escalation {args.escalation_id} is not in the archive")
+
+def sla_scan(db, args):
+    """Record SLA breaches and apply auto-escalation rules once, e.g. from cron"""
+    print("🔧 Scanning for SLA breaches...")
+    result = db.scan_sla_breaches(args.batch_size, args.max_batches)
+    print(f"✅ Recorded {result['breaches_recorded']} breaches, auto-escalated {result['auto_escalated']} "
+          f"in {result['duration_ms']:.0f} ms ({result['backlog']} left)")
+
+def snapshot(db, args):
+    """Write daily tier snapshots: yesterday and today, or every day of the history with --backfill"""
+    if args.backfill or args.start or args.end:
+        print("🔧 Rebuilding daily snapshots from escalation history...")
+        rows = db.build_daily_snapshots(args.start, args.end)
+    else:
+        print("🔧 Refreshing yesterday's and today's snapshots...")
+        rows = db.snapshot_daily()
+    print(f"✅ Wrote {rows} snapshot rows")
+
+def status_durations(db, args):
+    """Extend the time-in-status table with new history, or recompute it all with --full"""
+    print("🔧 Refreshing time in status from escalation history...")
+    rows = db.refresh_status_durations(args.full)
+    print(f"✅ Wrote {rows} status duration rows")
+
+def export_parquet(db, args):
+    """Append escalations and history changed since the last export to partitioned Parquet files"""
+    from export import export_parquet as export
+    print(f"🔧 Exporting to {args.out}...")
+    try:
+        counts = export(db, args.out, args.full)
+    except ImportError as e:
+        print(f"❌ {e}")
+        return
+    print(f"✅ Wrote {counts['escalations']} escalations, {counts['escalation_history']} history rows, "
+          f"{counts['tiers']} tiers and {counts['people']} people")
+
+def main():
+    parser = argparse.ArgumentParser(description="Tiered Accountability Dashboard maintenance commands")
+    parser.add_argument("--db", default="accountability_dashboard.db", help="Path to the SQLite database")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    migrate_parser = subparsers.add_parser("migrate", help="Apply pending schema migrations")
+    migrate_parser.add_argument("--dry-run", action="store_true", help="Estimate rows touched and time only")
+    migrate_parser.add_argument("--status", action="store_true", help="List applied and pending migrations")
+    migrate_parser.add_argument("--batch-size", type=int, default=5000, help="Rows backfilled per transaction")
+    subparsers.add_parser("rebuild-counters", help="Rebuild per-tier escalation counters")
+    subparsers.add_parser("rebuild-tier-closure", help="Rebuild the tier hierarchy closure table")
+    subparsers.add_parser("rebuild-search-index", help="Rebuild the escalation full-text search index")
+    archive_parser = subparsers.add_parser("archive", help="Archive Closed escalations older than --days")
+    archive_parser.add_argument("--days", type=int, default=90, help="Minimum days since closed and last update")
+    archive_parser.add_argument("--batch-size", type=int, default=500, help="Escalations moved per transaction")
+    restore_parser = subparsers.add_parser("restore", help="Restore an archived escalation")
+    restore_parser.add_argument("escalation_id")
+    sla_parser = subparsers.add_parser("sla-scan", help="Record SLA breaches and apply auto-escalation rules")
+    sla_parser.add_argument("--batch-size", type=int, default=500, help="Breaches recorded per transaction")
+    sla_parser.add_argument("--max-batches", type=int, default=20, help="Batches per run")
+    snapshot_parser = subparsers.add_parser("snapshot", help="Write daily tier snapshots for trend charts")
+    snapshot_parser.add_argument("--backfill", action="store_true", help="Replay the whole history")
+    snapshot_parser.add_argument("--start", help="First day to rebuild (YYYY-MM-DD)")
+    snapshot_parser.add_argument("--end", help="Last day to rebuild (YYYY-MM-DD), default today")
+    durations_parser = subparsers.add_parser("status-durations", help="Refresh time-in-status analytics")
+    durations_parser.add_argument("--full", action="store_true", help="Recompute every escalation")
+    export_parser = subparsers.add_parser("export-parquet", help="Export to partitioned Parquet for analytics")
+    export_parser.add_argument("--out", default="analytics_export", help="Export directory")
+    export_parser.add_argument("--full", action="store_true", help="Rewrite the whole export")
+    
+    args = parser.parse_args()
+    # migrate applies the schema changes itself, so it opens the database without initializing it
+    db = DatabaseManager(args.db, initialize=args.command != "migrate")
+    commands = {
+        "migrate": migrate,
+        "rebuild-counters": rebuild_counters,
+        "rebuild-tier-closure": rebuild_tier_closure,
+        "rebuild-search-index": rebuild_search_index,
+        "archive": archive,
+        "restore": restore,
+        "sla-scan": sla_scan,
+        "snapshot": snapshot,
+        "status-durations": status_durations,
+        "export-parquet": export_parquet,
+    }
+    try:
+        commands[args.command](db, args)
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Shared fixtures for the DatabaseManager tests
+
+Each test module gets its own small generated database in a temporary
+directory; none of them touch the checked-in accountability_dashboard.db.
+Run from the repository root with `python -m pytest`.
+"""
+
+import os
+import shutil
+import sys
+from datetime import datetime
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from database import DatabaseManager  # noqa: E402
+from generate_data import generate_data  # noqa: E402
+
+AS_OF = datetime(2026, 1, 1)
+
+@pytest.fixture(scope="module")
+def seeded_db(tmp_path_factory):
+    """30 tiers, 300 people and 3000 escalations with their history, uncached"""
+    path = tmp_path_factory.mktemp("db") / "test.db"
+    db = DatabaseManager(str(path), pool_size=60, cache_size=0)
+    generate_data(db, tiers=30, people=300, escalations=3000, as_of=AS_OF)
+    yield db
+    db.close()
+
+@pytest.fixture
+def baseline_db(tmp_path):
+    """Path to a copy of the checked-in sample database, which has the original schema"""
+    path = tmp_path / "baseline.db"
+    shutil.copy(os.path.join(REPO_ROOT, "accountability_dashboard.db"), path)
+    return str(path)
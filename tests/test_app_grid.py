@@ -0,0 +1,155 @@
+"""
+Renders the Manage Escalations grid with Streamlit's AppTest
+
+The grid runs in a browser frame, so its selection is injected into the
+st_aggrid response the app reads. The app's shared manager is swapped for one
+on a temporary database of recent escalations, so the default "Days Open"
+filter still leaves several 500-row pages in one tier.
+"""
+
+import os
+
+import pytest
+
+pytest.importorskip("streamlit")
+st_aggrid = pytest.importorskip("st_aggrid")
+pytest.importorskip("streamlit_option_menu")
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+import database  # noqa: E402
+from generate_data import generate_data  # noqa: E402
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+GRID = "manage_escalations_grid"
+
+@pytest.fixture(scope="module")
+def db(tmp_path_factory):
+    """The manager app.py gets from get_db(), on a generated database"""
+    db = database.DatabaseManager(str(tmp_path_factory.mktemp("app") / "app.db"))
+    generate_data(db, tiers=8, people=60, escalations=6000, days=30)
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(database, "_default_db", db)
+        yield db
+    db.close()
+
+@pytest.fixture(scope="module")
+def page_size(db):
+    # Imported once get_db() returns the test database
+    import app
+    return app.GRID_PAGE_SIZE
+
+@pytest.fixture(scope="module")
+def tier_id(db, page_size):
+    """The tier with the most escalations in it"""
+    with db.get_connection() as conn:
+        tier_id, count = conn.execute('''
+            SELECT current_tier_id, COUNT(*) FROM escalations GROUP BY current_tier_id ORDER BY 2 DESC LIMIT 1
+        ''').fetchone()
+    assert count > 2 * page_size
+    return tier_id
+
+@pytest.fixture
+def grid(monkeypatch):
+    """Rows each grid rendered, and the escalation id to report as selected per grid key"""
+    real_aggrid = st_aggrid.AgGrid
+    rendered, selected = {}, {}
+    
+    def aggrid(data, *args, key=None, **kwargs):
+        response = real_aggrid(data, *args, key=key, **kwargs)
+        rendered[key] = list(data['id'])
+        if key in selected:
+            rows = data[data['id'] == selected[key]].to_dict('records')
+            response._set_component_value({'nodes': [{'data': row, 'isSelected': True} for row in rows]})
+        return response
+    
+    monkeypatch.setattr(st_aggrid, "AgGrid", aggrid)
+    return rendered, selected
+
+def _login(db, person_id):
+    at = AppTest.from_file(APP_PATH, default_timeout=120)
+    at.run()
+    name = db.get_people().set_index('id').loc[person_id, 'name']
+    person = next(box for box in at.sidebar.selectbox if box.label == "Select Person")
+    person.set_value(next(option for option in person.options if option.startswith(f"{name} ("))).run()
+    assert not at.exception
+    return at
+
+def _widget(widgets, label):
+    return next(widget for widget in widgets if widget.label == label)
+
+def _button(at, key_prefix):
+    return next(button for button in at.button if button.key and button.key.startswith(key_prefix))
+
+def _status(db, escalation_id):
+    return db.get_escalation_detail(escalation_id)['status']
+
+@pytest.mark.parametrize('listing_key, search_text', [
+    ('manage_escalations', ''),
+    ('search_escalations', 'generated'),
+], ids=['listing', 'search'])
+def test_grid_pages_and_resets_on_filter_change(db, page_size, tier_id, grid, listing_key, search_text):
+    rendered, _ = grid
+    at = _login(db, db.get_people(tier_id).iloc[0]['id'])
+    _widget(at.text_input, "🔍 Search").set_value(search_text).run()
+    first_page = rendered[f"{listing_key}_grid"]
+    assert len(first_page) == page_size
+    assert at.session_state[f"{listing_key}_cursors"] == [None]
+    
+    _button(at, f"{listing_key}_next").click().run()
+    assert not at.exception
+    second_page = rendered[f"{listing_key}_grid"]
+    assert len(at.session_state[f"{listing_key}_cursors"]) == 2
+    assert second_page and not set(first_page) & set(second_page)
+    
+    _widget(at.selectbox, "Filter by Urgency").set_value("High").run()
+    assert at.session_state[f"{listing_key}_cursors"] == [None]
+
+def test_selected_row_drives_actions(db, page_size, tier_id, grid):
+    _, selected = grid
+    page, _ = db.get_escalations_page(tier_id=tier_id, days_open_range=(0, 30), sort_by=['-created_at'],
+                                      page_size=page_size)
+    
+    # Escalate, through a form that has to survive the rerun its submit triggers
+    escalation = page[page['status'] == 'Open'].iloc[0]
+    at = _login(db, escalation['created_by'])
+    selected[GRID] = escalation['id']
+    at.run()
+    _button(at, f"manage_escalations_escalate_{escalation['id']}").click().run()
+    _widget(at.button, "⬆️ Escalate Now").click().run()
+    assert not at.exception
+    assert _status(db, escalation['id']) == 'In Progress'
+    
+    # Feedback from the assignee returns it to the creator, who closes it
+    assignee = db.get_escalation_detail(escalation['id'])['assigned_to']
+    at = _login(db, assignee)
+    at.run()
+    _button(at, f"manage_escalations_feedback_{escalation['id']}").click().run()
+    _widget(at.text_area, "Feedback*").input("Resolved in the grid test")
+    _widget(at.button, "📤 Submit Feedback & Return").click().run()
+    assert not at.exception
+    assert _status(db, escalation['id']) == 'Pending Feedback'
+    
+    at = _login(db, escalation['created_by'])
+    at.run()
+    _button(at, f"manage_escalations_close_{escalation['id']}").click().run()
+    assert not at.exception
+    assert _status(db, escalation['id']) == 'Closed'
+
+def test_action_form_refuses_stale_version(db, tier_id, grid):
+    _, selected = grid
+    page, _ = db.get_escalations_page(tier_id=tier_id, status_filter='Open', page_size=10)
+    escalation = page.iloc[-1]
+    at = _login(db, escalation['created_by'])
+    selected[GRID] = escalation['id']
+    at.run()
+    _button(at, f"manage_escalations_escalate_{escalation['id']}").click().run()
+    _widget(at.button, "❌ Cancel").click().run()
+    assert "⬆️ Escalate Now" not in [button.label for button in at.button]
+    
+    _button(at, f"manage_escalations_escalate_{escalation['id']}").click().run()
+    with db.get_connection() as conn:
+        conn.execute('UPDATE escalations SET version = version + 1 WHERE id = ?', (escalation['id'],))
+    _widget(at.button, "⬆️ Escalate Now").click().run()
+    assert _status(db, escalation['id']) == 'Open'
+    assert any("Someone else updated" in warning.value for warning in at.warning)
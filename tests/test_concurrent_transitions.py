@@ -0,0 +1,144 @@
+"""
+Concurrency stress test for the versioned escalation state transitions
+
+50 writer threads race escalate, return-to-creator and close on the same
+escalations, both directly and through the write pipeline. Every contested
+transition must have exactly one winner, every applied transition must bump
+the version exactly once, and each escalation's history must be an unbroken
+chain of transitions allowed by ESCALATION_TRANSITIONS.
+"""
+
+import random
+import threading
+from collections import Counter
+
+import pytest
+
+from database import DatabaseManager
+
+THREADS = 50
+ESCALATIONS = 20
+ROUNDS = 40
+
+@pytest.fixture(params=[False, True], ids=['direct', 'pipeline'])
+def db(seeded_db, request):
+    if request.param:
+        seeded_db.start_write_pipeline()
+    yield seeded_db
+    seeded_db.stop_write_pipeline()
+
+@pytest.fixture(scope="module")
+def route(seeded_db):
+    """A creator's tier, a child tier to escalate to and people in both"""
+    people = seeded_db.get_people()
+    for tier_id, creators in people.groupby('tier_id')['id']:
+        for child_id in seeded_db.get_tier_graph().children[tier_id]:
+            assignees = people.loc[people['tier_id'] == child_id, 'id']
+            if not assignees.empty:
+                return creators.iloc[0], tier_id, child_id, list(assignees)
+    pytest.fail("no tier with a staffed child tier")
+
+def _create(db, route, label):
+    creator, tier_id, _, _ = route
+    return [db.create_escalation(f"{label} {index}", "Concurrency test", "High", creator, tier_id)
+            for index in range(ESCALATIONS)]
+
+def _step(db, route, status, escalation_id, worker, expected_version=None):
+    """Attempt the transition an escalation in `status` takes next, or None if it has none"""
+    creator, _, child_id, assignees = route
+    assignee = assignees[worker % len(assignees)]
+    if status == 'Open':
+        return db.escalate_to_next_tier(escalation_id, child_id, assignee, creator,
+                                        expected_version=expected_version)
+    if status == 'In Progress':
+        return db.return_escalation_to_creator(escalation_id, f"Answer from worker {worker}", assignee,
+                                               expected_version=expected_version)
+    if status == 'Pending Feedback':
+        return db.close_escalation(escalation_id, creator, expected_version=expected_version)
+    return None
+
+def _run_workers(target):
+    errors = []
+    def run(worker):
+        try:
+            target(worker)
+        except Exception as e:  # noqa: BLE001 - reported by the assertion below
+            errors.append(repr(e))
+    threads = [threading.Thread(target=run, args=(worker,)) for worker in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+
+def _assert_history_consistent(db, escalation_ids):
+    """Versions match the applied transitions, and history follows ESCALATION_TRANSITIONS"""
+    with db.get_connection() as conn:
+        for escalation_id in escalation_ids:
+            version, = conn.execute('SELECT version FROM escalations WHERE id = ?', (escalation_id,)).fetchone()
+            history = conn.execute('''
+                SELECT h.action, h.from_status, h.to_status
+                FROM escalation_history h JOIN escalations e ON e.key = h.escalation_key
+                WHERE e.id = ?
+                ORDER BY h.id
+            ''', (escalation_id,)).fetchall()
+            assert history[0] == ('Created', None, 'Open')
+            transitions = history[1:]
+            assert version == len(transitions)
+            previous = 'Open'
+            for action, from_status, to_status in transitions:
+                assert from_status == previous
+                assert from_status in DatabaseManager.ESCALATION_TRANSITIONS[action]
+                previous = to_status
+
+def test_contested_transitions_have_one_winner(db, route):
+    escalation_ids = _create(db, route, "contested")
+    barrier = threading.Barrier(THREADS, timeout=120)
+    wins = Counter()
+    lock = threading.Lock()
+    
+    def worker(index):
+        rng = random.Random(index)
+        for expected_status in ('Open', 'In Progress', 'Pending Feedback'):
+            # Everyone reads the same versions before anyone writes
+            seen = {escalation_id: db.get_escalation_detail(escalation_id) for escalation_id in escalation_ids}
+            assert all(detail['status'] == expected_status for detail in seen.values())
+            barrier.wait()
+            for escalation_id in rng.sample(escalation_ids, len(escalation_ids)):
+                result = _step(db, route, expected_status, escalation_id, index, seen[escalation_id]['version'])
+                if result:
+                    with lock:
+                        wins[escalation_id, expected_status] += 1
+                else:
+                    assert result.reason == 'conflict'
+            barrier.wait()
+    
+    _run_workers(worker)
+    assert len(wins) == ESCALATIONS * 3
+    assert set(wins.values()) == {1}
+    _assert_history_consistent(db, escalation_ids)
+
+def test_racing_writers_lose_no_updates(db, route):
+    escalation_ids = _create(db, route, "racing")
+    applied = Counter()
+    lock = threading.Lock()
+    
+    def worker(index):
+        rng = random.Random(index)
+        for _ in range(ROUNDS):
+            escalation_id = rng.choice(escalation_ids)
+            detail = db.get_escalation_detail(escalation_id)
+            # Half the writers act on what they read, half without a version check
+            expected_version = detail['version'] if index % 2 else None
+            result = _step(db, route, detail['status'], escalation_id, index, expected_version)
+            if result:
+                with lock:
+                    applied[escalation_id] += 1
+    
+    _run_workers(worker)
+    with db.get_connection() as conn:
+        versions = dict(conn.execute(f'''
+            SELECT id, version FROM escalations WHERE id IN ({', '.join('?' * len(escalation_ids))})
+        ''', escalation_ids).fetchall())
+    assert {escalation_id: applied[escalation_id] for escalation_id in escalation_ids} == versions
+    _assert_history_consistent(db, escalation_ids)
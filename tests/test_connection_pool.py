@@ -0,0 +1,50 @@
+"""
+Nested checkouts of ConnectionPool share the outermost checkout's transaction:
+an error from inside rolls all of it back, and only the outermost checkout
+may commit or roll back.
+"""
+
+import sqlite3
+
+import pytest
+
+from database import ConnectionPool
+
+@pytest.fixture
+def pool(tmp_path):
+    pool = ConnectionPool(str(tmp_path / "pool.db"), size=2)
+    with pool.connection() as conn:
+        conn.execute('CREATE TABLE items (name TEXT)')
+    yield pool
+    pool.close()
+
+def _names(pool):
+    with pool.connection() as conn:
+        return [name for name, in conn.execute('SELECT name FROM items ORDER BY name')]
+
+def test_nested_error_rolls_back_outer_transaction(pool):
+    with pytest.raises(RuntimeError):
+        with pool.connection() as outer:
+            outer.execute("INSERT INTO items VALUES ('outer')")
+            with pool.connection() as inner:
+                assert inner is outer
+                inner.execute("INSERT INTO items VALUES ('inner')")
+                raise RuntimeError("inner work failed")
+    
+    assert not pool.held
+    assert _names(pool) == []
+    # The connection went back to the pool ready for a new outermost checkout
+    with pool.connection() as conn:
+        assert conn.depth == 1 and not conn.in_transaction
+        conn.execute("INSERT INTO items VALUES ('after')")
+    assert _names(pool) == ['after']
+
+@pytest.mark.parametrize('action', ['commit', 'rollback'])
+def test_nested_checkout_cannot_end_transaction(pool, action):
+    with pool.connection() as outer:
+        outer.execute("INSERT INTO items VALUES ('outer')")
+        with pool.connection() as inner:
+            with pytest.raises(sqlite3.ProgrammingError, match="nested"):
+                getattr(inner, action)()
+        assert outer.depth == 1
+    assert _names(pool) == ['outer']
@@ -0,0 +1,28 @@
+"""
+Columns of the escalation listings: get_escalations keeps the full
+description and feedback it has always returned, while the paginated listing
+and search return the narrow projection with a description preview.
+"""
+
+import pandas as pd
+
+FULL_COLUMNS = {'description', 'feedback', 'version'}
+
+def test_get_escalations_returns_full_text(seeded_db):
+    rows = seeded_db.get_escalations(status_filter='Closed').set_index('id')
+    assert 'description_preview' in rows.columns
+    sample = rows[sorted(FULL_COLUMNS)].head(20)
+    details = pd.DataFrame([seeded_db.get_escalation_detail(escalation_id) for escalation_id in sample.index],
+                           index=sample.index)
+    pd.testing.assert_frame_equal(sample, details[sample.columns], check_dtype=False)
+    assert rows['feedback'].notna().any()
+
+def test_get_escalations_archived_returns_full_text(seeded_db):
+    assert FULL_COLUMNS <= set(seeded_db.get_escalations(archived=True).columns)
+
+def test_page_and_search_stay_narrow(seeded_db):
+    page, _ = seeded_db.get_escalations_page(page_size=10)
+    results, _ = seeded_db.search_escalations('generated', page_size=10)
+    for rows in (page, results):
+        assert len(rows) and 'description_preview' in rows.columns
+        assert not FULL_COLUMNS & set(rows.columns)
@@ -0,0 +1,107 @@
+"""
+Schema migration checks against the checked-in sample database, which was
+created with the original schema
+"""
+
+import os
+import sqlite3
+import subprocess
+import sys
+
+from conftest import REPO_ROOT
+from database import DatabaseManager
+
+def _schema(path):
+    """Every table, index and trigger definition, and the applied migrations"""
+    conn = sqlite3.connect(path)
+    try:
+        objects = conn.execute('SELECT type, name, sql FROM sqlite_master ORDER BY type, name').fetchall()
+        versions = []
+        if any(name == 'schema_version' for _, name, _ in objects):
+            versions = conn.execute('SELECT * FROM schema_version ORDER BY version').fetchall()
+        return objects, versions
+    finally:
+        conn.close()
+
+def _manage(cwd, *args):
+    return subprocess.run([sys.executable, os.path.join(REPO_ROOT, "manage.py"), *args], cwd=cwd,
+                          capture_output=True, text=True, check=True).stdout
+
+def test_imports_leave_default_database_alone(tmp_path):
+    subprocess.run([sys.executable, "-c", "import database, manage, generate_data, benchmark, export"],
+                   cwd=tmp_path, env=dict(os.environ, PYTHONPATH=REPO_ROOT), check=True)
+    assert os.listdir(tmp_path) == []
+
+def test_dry_run_leaves_schema_unchanged(baseline_db):
+    before = _schema(baseline_db)
+    db = DatabaseManager(baseline_db, initialize=False, cache_size=0)
+    try:
+        report = db.migrate(dry_run=True)
+    finally:
+        db.close()
+    assert [migration['version'] for migration in report] == [version for version, *_ in DatabaseManager.MIGRATIONS]
+    assert _schema(baseline_db) == before
+
+def test_manage_dry_run_on_default_database(baseline_db, tmp_path):
+    os.replace(baseline_db, tmp_path / "accountability_dashboard.db")
+    before = _schema(tmp_path / "accountability_dashboard.db")
+    output = _manage(tmp_path, "migrate", "--dry-run")
+    assert f"{len(DatabaseManager.MIGRATIONS)} pending migrations" in output
+    assert _schema(tmp_path / "accountability_dashboard.db") == before
+
+def test_dry_run_after_migrating_reports_nothing(baseline_db):
+    _manage(os.path.dirname(baseline_db), "--db", baseline_db, "migrate")
+    before = _schema(baseline_db)
+    assert len(before[1]) == len(DatabaseManager.MIGRATIONS)
+    db = DatabaseManager(baseline_db, initialize=False, cache_size=0)
+    try:
+        assert db.migrate(dry_run=True) == []
+    finally:
+        db.close()
+    assert _schema(baseline_db) == before
+
+def _history(rows):
+    return sorted(tuple(row) for row in rows)
+
+def test_baseline_database_upgrades(baseline_db):
+    conn = sqlite3.connect(baseline_db)
+    statuses = dict(conn.execute('SELECT id, status FROM escalations'))
+    history = _history(conn.execute('''
+        SELECT escalation_id, action, performed_by, from_status, to_status, notes, timestamp FROM escalation_history
+    '''))
+    conn.close()
+    
+    db = DatabaseManager(baseline_db, cache_size=0)
+    try:
+        assert [row['version'] for row in db.get_schema_migrations() if row['applied_at']] == \
+            [version for version, *_ in DatabaseManager.MIGRATIONS]
+        with db.get_connection() as conn:
+            assert conn.execute('PRAGMA integrity_check').fetchone()[0] == 'ok'
+            assert conn.execute('PRAGMA foreign_key_check').fetchall() == []
+            upgraded = _history(conn.execute('''
+                SELECT e.id, h.action, h.performed_by, h.from_status, h.to_status, h.notes, h.timestamp
+                FROM escalation_history h JOIN escalations e ON e.key = h.escalation_key
+            '''))
+        assert upgraded == history
+        assert dict(zip(*db.get_escalations()[['id', 'status']].values.T)) == statuses
+        
+        # Archive and restore go through the rebuilt archive tables
+        escalation = db.get_escalations(status_filter='Open').iloc[0]
+        assert db.close_escalation(escalation['id'], escalation['created_by'])
+        with db.get_connection() as conn:
+            conn.execute("UPDATE escalations SET closed_at = datetime('now', '-200 days'), "
+                         "updated_at = datetime('now', '-200 days') WHERE id = ?", (escalation['id'],))
+        assert db.archive_closed_escalations(90) == 1
+        assert len(db.get_escalation_history(escalation['id'], include_archived=True)) == \
+            sum(row[0] == escalation['id'] for row in history) + 1
+        assert db.restore_escalation(escalation['id'])
+    finally:
+        db.close()
+    
+    # Later starts find every migration applied and the archive tables in the new format
+    db = DatabaseManager(baseline_db, cache_size=0)
+    try:
+        assert db.migrate() == []
+        assert len(db.get_escalations()) == len(statuses)
+    finally:
+        db.close()
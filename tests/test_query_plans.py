@@ -0,0 +1,174 @@
+"""
+Query plan checks for every DatabaseManager read method
+
+Each public @instrumented method that is not a write is found by inspection
+and called with the arguments in `_calls`. Every statement it runs is captured
+through query instrumentation and explained with EXPLAIN QUERY PLAN. A plan
+that scans one of the per-row tables without an index fails the test, unless
+that call is marked with _whole_table as reading the table whole on purpose.
+Tiers, counters, SLA rules and the tier closure are small lookup tables that
+some queries read whole on purpose, so their scans are allowed everywhere.
+"""
+
+import inspect
+import re
+
+import pytest
+
+import database
+from database import DatabaseManager
+
+# Tables with a row per escalation, history event, person or tier-day
+ROW_TABLES = {
+    'escalations', 'escalations_archive', 'escalation_history', 'escalation_history_archive',
+    'people', 'sla_breaches', 'escalation_status_durations', 'daily_tier_snapshots',
+}
+
+# Write methods whose scans are on a hot path and get checked too
+CHECKED_WRITES = ['scan_sla_breaches']
+
+WRITE_DECORATORS = [database.invalidates_cache, database.queued_write, database.exclusive_write]
+
+TABLE_ALIAS = re.compile(r'\b(?:FROM|JOIN)\s+(\w+)(?:\s+(?:AS\s+)?(?!ON\b|WHERE\b|JOIN\b|LEFT\b|USING\b)(\w+))?',
+                         re.IGNORECASE)
+PLAN_SCAN = re.compile(r'\bSCAN (\w+)(.*)')
+
+def _decorator_codes(decorators):
+    return {decorator(lambda self: None).__code__ for decorator in decorators}
+
+def _read_methods():
+    """Public DatabaseManager methods wrapped by @instrumented and by no write decorator"""
+    instrumented = _decorator_codes([database.instrumented])
+    writes = _decorator_codes(WRITE_DECORATORS)
+    methods = []
+    for name, method in inspect.getmembers(DatabaseManager, inspect.isfunction):
+        layers = []
+        while method is not None:
+            layers.append(method.__code__)
+            method = getattr(method, '__wrapped__', None)
+        if not name.startswith('_') and instrumented & set(layers) and not writes & set(layers):
+            methods.append(name)
+    return methods
+
+READ_METHODS = _read_methods()
+
+def _table_scans(sql, plan):
+    """(table, plan row) for plan rows that scan a per-row table without using an index"""
+    tables = {}
+    for table, alias in TABLE_ALIAS.findall(sql):
+        tables[table] = table
+        if alias:
+            tables[alias] = table
+    scans = []
+    for row in plan:
+        match = PLAN_SCAN.search(row)
+        if not match:
+            continue
+        name, rest = match.groups()
+        table = tables.get(name, name)
+        if table in ROW_TABLES and 'USING' not in rest:
+            scans.append((table, row))
+    return scans
+
+def _whole_table(table, call):
+    """Mark a call that reads `table` whole on purpose, e.g. an aggregate over every row"""
+    call.whole_table = table
+    return call
+
+@pytest.fixture(scope="module")
+def ids(seeded_db):
+    # Archived rows, snapshots and status durations for the analytics and archive reads
+    assert seeded_db.archive_closed_escalations(older_than_days=300)
+    seeded_db.build_daily_snapshots('2025-12-01')
+    seeded_db.refresh_status_durations(full=True)
+    seeded_db.scan_sla_breaches()
+    tier_id = seeded_db.get_tiers().iloc[0]['id']
+    person_id = seeded_db.get_people(tier_id).iloc[0]['id']
+    escalation_id = seeded_db.get_escalations_page(tier_id=tier_id, include_subtree=True)[0].iloc[0]['id']
+    return tier_id, person_id, escalation_id
+
+def _calls(db, tier_id, person_id, escalation_id):
+    _, cursor = db.get_escalations_page(tier_id=tier_id, include_subtree=True, page_size=10)
+    return {
+        'get_escalations': [
+            lambda: db.get_escalations(),
+            lambda: db.get_escalations(tier_id=tier_id, include_subtree=True, sort_by=['-urgency', 'created_at']),
+            lambda: db.get_escalations(person_id=person_id, status_filter='Open'),
+            lambda: db.get_escalations(tier_id=tier_id, escalated=True, days_open_range=(0, 400)),
+            lambda: db.get_escalations(archived=True),
+            lambda: db.get_escalations(tier_id=tier_id, archived=True),
+        ],
+        'get_escalations_page': [
+            lambda: db.get_escalations_page(tier_id=tier_id, page_size=10),
+            lambda: db.get_escalations_page(tier_id=tier_id, include_subtree=True, page_size=10, cursor=cursor),
+            lambda: db.get_escalations_page(tier_id=tier_id, status_filter='Open', sort_by=['urgency']),
+            lambda: db.get_escalations_page(person_id=person_id, status_filter='Open'),
+            lambda: db.get_escalations_page(status_filter='Closed', days_open_range=(30, 90)),
+            lambda: db.get_escalations_page(archived=True),
+        ],
+        'search_escalations': [
+            lambda: db.search_escalations('generated'),
+            lambda: db.search_escalations('synthetic', tier_scope=tier_id, status_filter='Open'),
+        ],
+        'get_escalation_counters': [
+            lambda: db.get_escalation_counters(),
+            lambda: db.get_escalation_counters(tier_id, include_subtree=True, include_archived=True),
+        ],
+        'get_escalation_detail': [lambda: db.get_escalation_detail(escalation_id, include_archived=True)],
+        'get_escalation_history': [lambda: db.get_escalation_history(escalation_id, include_archived=True)],
+        'get_archive_summary': [lambda: db.get_archive_summary()],
+        'get_tier_stats': [lambda: db.get_tier_stats()],
+        'get_person_summary': [lambda: db.get_person_summary(person_id, tier_id)],
+        'get_people': [lambda: db.get_people(), lambda: db.get_people(tier_id)],
+        'get_person_by_id': [lambda: db.get_person_by_id(person_id)],
+        'get_tiers': [lambda: db.get_tiers()],
+        'get_tier_by_id': [lambda: db.get_tier_by_id(tier_id)],
+        'get_tier_graph': [lambda: db.get_tier_graph()],
+        'get_tier_hierarchy': [lambda: db.get_tier_hierarchy()],
+        'get_tier_ancestors': [lambda: db.get_tier_ancestors(tier_id, include_self=True)],
+        'get_tier_descendants': [lambda: db.get_tier_descendants(tier_id, include_self=True)],
+        'get_subtree_rollup': [lambda: db.get_subtree_rollup(tier_id, include_archived=True)],
+        'get_sla_rules': [lambda: db.get_sla_rules()],
+        # Walks the rowid backwards and stops at the limit
+        'get_sla_breaches': [_whole_table('sla_breaches', lambda: db.get_sla_breaches())],
+        'get_daily_snapshots': [
+            # The whole history, in primary key order
+            _whole_table('daily_tier_snapshots', lambda: db.get_daily_snapshots()),
+            lambda: db.get_daily_snapshots(start_date='2025-12-15', tier_id=tier_id),
+            lambda: db.get_daily_snapshots(start_date='2025-12-15', tier_id=tier_id, include_subtree=True),
+        ],
+        'get_time_in_status': [
+            _whole_table('escalation_status_durations', lambda: db.get_time_in_status()),
+            lambda: db.get_time_in_status(tier_id),
+            lambda: db.get_time_in_status(tier_id, include_subtree=True),
+        ],
+        # Averages over every Open and every In Progress stay
+        'get_handoff_latency': [_whole_table('escalation_status_durations', lambda: db.get_handoff_latency())],
+        'get_feedback_round_trip': [_whole_table('escalation_status_durations',
+                                                 lambda: db.get_feedback_round_trip())],
+        'get_schema_migrations': [lambda: db.get_schema_migrations()],
+        'verify_admin_password': [lambda: db.verify_admin_password('wrong')],
+        'scan_sla_breaches': [lambda: db.scan_sla_breaches()],
+    }
+
+def test_every_read_method_has_calls(seeded_db, ids):
+    assert set(READ_METHODS + CHECKED_WRITES) == set(_calls(seeded_db, *ids))
+
+@pytest.mark.parametrize('method', READ_METHODS + CHECKED_WRITES)
+def test_queries_use_indexes(seeded_db, ids, method):
+    scans = {}
+    seeded_db.set_instrumentation(True, slow_query_ms=0)
+    try:
+        for call in _calls(seeded_db, *ids)[method]:
+            seeded_db.reset_instrumentation()
+            call()
+            records = [record for record in seeded_db.instrumentation.records() if record['method'] == method]
+            plans = {sql: plan for record in records for sql, plan in (record['plans'] or {}).items()}
+            assert plans, f"{method} ran no statements"
+            for sql, plan in plans.items():
+                rows = [row for table, row in _table_scans(sql, plan) if table != getattr(call, 'whole_table', None)]
+                if rows:
+                    scans[sql] = rows
+    finally:
+        seeded_db.set_instrumentation(False)
+    assert not scans
@@ -0,0 +1,72 @@
+"""
+SLA auto-escalation follows the Escalate form: up to a higher level, never to
+the parent tier (which is the level below), and recorded under someone at the
+breached tier rather than the escalation's creator.
+"""
+
+import pytest
+
+from database import DatabaseManager
+
+@pytest.fixture
+def db(tmp_path):
+    db = DatabaseManager(str(tmp_path / "sla.db"), cache_size=0)
+    db.update_sla_rule('Critical', 1, True)
+    yield db
+    db.close()
+
+@pytest.fixture
+def tiers(db):
+    """Level 1 support with a Level 2 sub-tier, which has an empty and a staffed Level 3 sub-tier"""
+    level1 = db.create_tier("Level 1", 1)
+    level2 = db.create_tier("Level 2", 2, level1)
+    empty = db.create_tier("Level 3 A", 3, level2)
+    level3 = db.create_tier("Level 3 B", 3, level2)
+    people = {
+        'level1': db.create_person("Agent", "agent@example.com", level1),
+        'level2': db.create_person("Engineer", "engineer@example.com", level2),
+        'level2_lead': db.create_person("Engineering Lead", "eng.lead@example.com", level2, 'lead'),
+        'level3': db.create_person("Specialist", "specialist@example.com", level3),
+        'level3_lead': db.create_person("Specialist Lead", "spec.lead@example.com", level3, 'lead'),
+    }
+    return {'level1': level1, 'level2': level2, 'empty': empty, 'level3': level3}, people
+
+def _overdue(db, creator, tier_id):
+    escalation_id = db.create_escalation("Down", "Outage", "Critical", creator, tier_id)
+    with db.get_connection() as conn:
+        conn.execute("UPDATE escalations SET created_at = datetime('now', '-2 hours') WHERE id = ?",
+                     (escalation_id,))
+    return escalation_id
+
+def _breach_action(db, escalation_id):
+    with db.get_connection() as conn:
+        return conn.execute('SELECT action FROM sla_breaches WHERE escalation_id = ?', (escalation_id,)).fetchone()[0]
+
+def test_breach_escalates_to_higher_staffed_tier(db, tiers):
+    tier_ids, people = tiers
+    escalation_id = _overdue(db, people['level2'], tier_ids['level2'])
+    
+    assert db.scan_sla_breaches()['auto_escalated'] == 1
+    detail = db.get_escalation_detail(escalation_id)
+    assert detail['status'] == 'In Progress'
+    # Level 3 A has no one to assign, so its staffed sibling is picked
+    assert detail['current_tier_id'] == tier_ids['level3']
+    assert detail['assigned_to'] == people['level3_lead']
+    assert _breach_action(db, escalation_id) == 'Auto-escalated'
+    
+    escalated = detail['history'][detail['history']['action'] == 'Escalated'].iloc[0]
+    assert escalated['performed_by'] == people['level2_lead']
+    assert escalated['notes'].startswith("Auto-escalated")
+
+def test_level_one_breach_moves_up_not_to_parent(db, tiers):
+    tier_ids, people = tiers
+    escalation_id = _overdue(db, people['level1'], tier_ids['level1'])
+    db.scan_sla_breaches()
+    assert db.get_escalation_detail(escalation_id)['current_tier_id'] == tier_ids['level2']
+
+def test_top_level_breach_is_only_recorded(db, tiers):
+    tier_ids, people = tiers
+    escalation_id = _overdue(db, people['level3'], tier_ids['level3'])
+    assert db.scan_sla_breaches()['auto_escalated'] == 0
+    assert db.get_escalation_detail(escalation_id)['status'] == 'Open'
+    assert _breach_action(db, escalation_id) == 'No higher tier'